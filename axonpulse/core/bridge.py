@@ -1,5 +1,8 @@
 import multiprocessing
+import os
+import threading
 import time
+import uuid
 import msgpack
 import datetime
 import zlib
@@ -8,6 +11,7 @@ from multiprocessing import shared_memory
 from axonpulse.utils.logger import setup_logger
 from axonpulse.core.engine.services import ConnectionPoolManager
 from axonpulse.utils.shm_tracker import SHMTracker
+from axonpulse.core.constants import HIJACK_POLL_INTERVAL
 
 logger = setup_logger("AxonPulseBridge")
 
@@ -21,6 +25,12 @@ def msgpack_encode(obj):
         return {'__datetime__': obj.isoformat()}
     if isinstance(obj, (set, tuple)):
         return list(obj)
+    if type(obj).__module__ == 'numpy':
+        # Numeric arrays travel as raw bytes (float32 is 4 bytes/element vs 9 for a msgpack float)
+        if getattr(obj, 'ndim', 0) and obj.dtype.kind in 'biuf':
+            return {'__ndarray__': obj.dtype.str, 'shape': list(obj.shape), 'data': obj.tobytes()}
+        if hasattr(obj, 'tolist'):
+            return obj.tolist()
     if hasattr(obj, '__dict__'):
         return {'__object__': obj.__class__.__name__, 'state': dict(obj.__dict__)}
     return str(obj)
@@ -39,6 +49,9 @@ def msgpack_decode(obj):
         return obj['value']
     if '__datetime__' in obj:
         return datetime.datetime.fromisoformat(obj['__datetime__'])
+    if '__ndarray__' in obj:
+        import numpy as np
+        return np.frombuffer(bytearray(obj['data']), dtype=obj['__ndarray__']).reshape(obj['shape'])
     if '__object__' in obj:
         return obj['state']
     return obj
@@ -62,6 +75,7 @@ class AxonPulseBridge:
             self._provider_locks = system_state["provider_locks"]
             self._identities = system_state["identities"]
             self._hijack_registry = system_state["hijack_registry"]
+            self._hijack_queues = system_state.get("hijack_queues")
             self.root_registry = system_state.get("root_registry") # Inherit root from parent
         else:
             self._writer_locks = manager.list([manager.RLock() for _ in range(256)])
@@ -71,6 +85,7 @@ class AxonPulseBridge:
             self._provider_locks = manager.list([manager.RLock() for _ in range(128)])
             self._identities = manager.dict()
             self._hijack_registry = manager.dict()
+            self._hijack_queues = manager.dict() # provider_id -> manager Queue of hijack requests
             self.root_registry = None # Will be set to self._variables_registry below
 
         # 2. Data State (Usually isolated per SubGraph instance to avoid collisions)
@@ -100,6 +115,10 @@ class AxonPulseBridge:
         self._pinned_shm = {} # shm_name -> SharedMemory object
         self._shm_dirty = False # [OPTIMIZATION] Flag to skip pin_all if no new blocks
 
+        # In-process wakeups for wait_for() (scoped_key -> Condition)
+        self._key_waiters = {}
+        self._waiters_lock = threading.Lock()
+
     def get_system_state(self):
         """Returns only the hardware locks and system registries."""
         return {
@@ -110,6 +129,7 @@ class AxonPulseBridge:
             "provider_locks": self._provider_locks,
             "identities": self._identities,
             "hijack_registry": self._hijack_registry,
+            "hijack_queues": self._hijack_queues,
             "root_registry": self.root_registry # Ensure children know the root
         }
 
@@ -150,10 +170,15 @@ class AxonPulseBridge:
         state = self.__dict__.copy()
         # AuthenticationString inside manager can't be pickled
         state['manager'] = None 
+        # Thread primitives are process-local
+        state.pop('_key_waiters', None)
+        state.pop('_waiters_lock', None)
         return state
 
     def __setstate__(self, state):
         self.__dict__.update(state)
+        self._key_waiters = {}
+        self._waiters_lock = threading.Lock()
         # manager remains None in child processes unless re-initialized
         # This is fine as child processes don't typically need to spawn child managers
 
@@ -209,7 +234,6 @@ class AxonPulseBridge:
         Requests a password for an encrypted asset from the UI via the Bridge.
         Blocks until a response is received or timeout occurs.
         """
-        import uuid
         request_id = str(uuid.uuid4())[:8]
         zip_name = os.path.basename(zip_path)
         
@@ -271,6 +295,21 @@ class AxonPulseBridge:
         if provider_id in self._hijack_registry:
             del self._hijack_registry[provider_id]
             logger.info(f"Unregistered all Super-Functions for provider: {provider_id}")
+        if self._hijack_queues is not None:
+            self._hijack_queues.pop(provider_id, None)
+
+    def open_hijack_queue(self, provider_id, maxsize=1024):
+        """
+        Creates the FIFO a provider's hijack listener blocks on. Callers in any process
+        put() into it, so simultaneous requests queue up instead of overwriting the single
+        {provider_id}_HijackRequest key. Returns None where no manager is available
+        (child processes); the key-based channel is used then.
+        """
+        if self.manager is None or self._hijack_queues is None:
+            return None
+        q = self.manager.Queue(maxsize)
+        self._hijack_queues[provider_id] = q
+        return q
 
     def get_hijack_handler(self, context_stack, func_name):
         """
@@ -320,19 +359,42 @@ class AxonPulseBridge:
     def invoke_hijack(self, provider_id, func_name, data):
         """
         Synchronously (via IPC bridge) calls a hijack handler on a provider.
-        For now, we use a simple variable-based request/response pattern 
-        since we're in the same Manager scope.
+        Each calling thread gets its own reply slot ("reply_to"), so providers may answer
+        concurrent requests in any order without overwriting each other's results. The slot
+        (and its shared memory) is deleted when the call returns, times out or fails.
+        Raises RuntimeError if the provider reports that its handler failed.
         """
-        request_id = f"hijack_req_{int(time.time()*1000)}"
-        self.set(f"{provider_id}_HijackRequest", {"func": func_name, "data": data, "id": request_id}, "HijackInvoker")
+        request_id = f"hijack_req_{uuid.uuid4().hex[:12]}"
+        reply_key = f"{provider_id}_HijackResponse:{os.getpid()}_{threading.get_ident()}"
+        request = {"func": func_name, "data": data, "id": request_id, "reply_to": reply_key}
+        q = self._hijack_queues.get(provider_id) if self._hijack_queues is not None else None
+        if q is not None:
+            try:
+                q.put(request, timeout=1.0)
+            except Exception as e:
+                logger.warning(f"Hijack queue unavailable for provider {provider_id}: {e}")
+                return data
+        else:
+            self.set(f"{provider_id}_HijackRequest", request, "HijackInvoker")
         
         # Wait for response (short timeout)
-        start = time.time()
-        while time.time() - start < 1.0: # 1s timeout
-            resp = self.get(f"{provider_id}_HijackResponse")
-            if resp and resp.get("id") == request_id:
-                return resp.get("result")
-            time.sleep(0.01)
+        try:
+            deadline = time.monotonic() + 1.0 # 1s timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                resp = self.wait_for(reply_key, timeout=min(HIJACK_POLL_INTERVAL, remaining), poll_interval=HIJACK_POLL_INTERVAL)
+                if resp is None:
+                    # Providers that still answer on the shared response slot
+                    resp = self.get(f"{provider_id}_HijackResponse")
+                if resp and resp.get("id") == request_id:
+                    if "error" in resp:
+                        raise RuntimeError(f"Hijack handler '{func_name}' on provider {provider_id} failed: {resp['error']}")
+                    return resp.get("result")
+        finally:
+            # Drop the slot (and its shared memory) so reply keys don't accumulate per thread
+            self.delete(reply_key)
         
         logger.warning(f"Hijack timeout for provider {provider_id} on {func_name}")
         return data # Fallback to original data
@@ -632,8 +694,44 @@ class AxonPulseBridge:
         if registry_update:
             self._variables_registry.update(registry_update)
             self._shm_dirty = True
+            if self._key_waiters:
+                for scoped_key in registry_update:
+                    self._notify_waiters(scoped_key)
         return registry_update
 
+    def _notify_waiters(self, scoped_key):
+        cond = self._key_waiters.get(scoped_key)
+        if cond is not None:
+            with cond:
+                cond.notify_all()
+
+    def wait_for(self, key, timeout=1.0, scope_id=None, poll_interval=0.1):
+        """
+        Blocks until the key holds a non-None value or the timeout elapses.
+        Writes made through this bridge instance wake the caller immediately;
+        writes from other processes are picked up by a re-check every poll_interval.
+        Returns the value, or None on timeout.
+        """
+        value = self.get(key, scope_id=scope_id)
+        if value is not None:
+            return value
+        scoped_key = f"{scope_id or self.default_scope}:{key}"
+        with self._waiters_lock:
+            cond = self._key_waiters.get(scoped_key)
+            if cond is None:
+                cond = self._key_waiters[scoped_key] = threading.Condition()
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            with cond:
+                # Re-check under the condition so a set() between checks can't be missed
+                value = self.get(key, scope_id=scope_id)
+                if value is not None:
+                    return value
+                cond.wait(min(poll_interval, remaining))
+
     def mutate(self, key, action, payload, scope_id=None):
         """
         [Phase 3] IPC Delta Updates (The "Change Request" Architecture)
@@ -755,6 +853,8 @@ class AxonPulseBridge:
             metadata = self._write_shm(scoped_key, value)
             self._variables_registry[scoped_key] = metadata
             self._shm_dirty = True
+            if self._key_waiters:
+                self._notify_waiters(scoped_key)
         except (BrokenPipeError, EOFError, ConnectionResetError) as e:
             # Silent during shutdown
             pass
@@ -773,6 +873,33 @@ class AxonPulseBridge:
             else:
                 logger.error(f"Failed to set Shared Memory for '{scoped_key}': {e}")
 
+    def delete(self, key, scope_id=None):
+        """Removes a variable: drops its registry entry and unlinks its Shared Memory block."""
+        target_scope = scope_id or self.default_scope
+        scoped_key = f"{target_scope}:{key}"
+        self._local_cache.pop(scoped_key, None)
+        try:
+            metadata = self._variables_registry.pop(scoped_key, None)
+        except (BrokenPipeError, EOFError, ConnectionResetError):
+            return
+        if not metadata:
+            return
+
+        shm_name = metadata[0]
+        pinned = self._pinned_shm.pop(shm_name, None)
+        if pinned is not None:
+            try: pinned.close()
+            except Exception: pass
+        try:
+            shm = shared_memory.SharedMemory(name=shm_name)
+            shm.close()
+            shm.unlink()
+            SHMTracker.unregister(shm_name)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Could not unlink '{shm_name}' for '{scoped_key}': {e}")
+
     def increment(self, key, amount=1, scope_id=None):
         """Atomsically increments a numeric variable in the bridge."""
         target_scope = scope_id or self.default_scope
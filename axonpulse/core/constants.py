@@ -2,6 +2,7 @@
 # These are cached at startup to avoid repeated system calls.
 
 import platform
+import sys
 import os
 
 # Cached OS Detection
@@ -14,3 +15,19 @@ IS_LINUX = PLATFORM_SYSTEM == "Linux"
 IS_MACOS = PLATFORM_SYSTEM == "Darwin"
 IS_NT = OS_NAME == "nt"
 IS_POSIX = OS_NAME == "posix"
+
+# Flow Port Names (interned; they key the hottest bridge/routing lookups)
+FLOW = sys.intern("Flow")
+SUCCESS = sys.intern("Success")
+FAILURE = sys.intern("Failure")
+CATCH = sys.intern("Catch")
+
+# Shared ActivePorts values. The flow controller only tests membership,
+# so one immutable tuple replaces a fresh list per pulse.
+ACTIVE_FLOW = (FLOW,)
+ACTIVE_SUCCESS = (SUCCESS, FLOW)
+ACTIVE_FAILURE = (FAILURE, FLOW)
+
+# Provider hijack listeners block on the request key. Writers in the engine process wake
+# them at once; this is the re-check interval for requests written from node processes.
+HIJACK_POLL_INTERVAL = 0.05
@@ -0,0 +1,122 @@
+"""
+Persistent embedding cache shared by every process of a run (and by later runs).
+Vectors are keyed by SHA-256 of model, task and text and stored as float32 blobs in a SQLite
+file in WAL mode, so parallel workers read concurrently while one of them writes.
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "./data/embedding_cache.db"
+
+# SQLite's bound-parameter limit is 999 on older builds
+_LOOKUP_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key BLOB PRIMARY KEY,
+    provider TEXT,
+    model TEXT,
+    dim INTEGER,
+    vec BLOB
+) WITHOUT ROWID
+"""
+
+def embedding_key(model, text, task=""):
+    return hashlib.sha256(f"{model}:{task}:{text}".encode("utf-8")).digest()
+
+class EmbeddingCache:
+    """
+    One SQLite connection per process (reopened after fork or unpickling), guarded by a lock
+    so provider threads can share it. Cache failures never fail an embedding: the request
+    falls through to the API.
+    """
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = os.path.abspath(path)
+        self._conn = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        # Connections don't pickle; the receiving process attaches to its own shared instance
+        return (open_embedding_cache, (self.path,))
+
+    def _connection(self):
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def lookup(self, keys):
+        """Returns {key: vector} for the keys present in the cache."""
+        found = {}
+        with self._lock:
+            conn = self._connection()
+            for i in range(0, len(keys), _LOOKUP_CHUNK):
+                part = keys[i:i + _LOOKUP_CHUNK]
+                marks = ",".join("?" * len(part))
+                for key, blob in conn.execute(f"SELECT key, vec FROM embeddings WHERE key IN ({marks})", part):
+                    found[bytes(key)] = array("f", blob).tolist()
+        return found
+
+    def store(self, provider, model, items):
+        """Stores (key, vector) pairs."""
+        rows = [(key, provider, model, len(vec), array("f", vec).tobytes()) for key, vec in items]
+        with self._lock:
+            conn = self._connection()
+            conn.executemany("INSERT OR REPLACE INTO embeddings (key, provider, model, dim, vec) VALUES (?, ?, ?, ?, ?)", rows)
+            conn.commit()
+
+    def get_or_compute(self, provider, model, texts, embed_many, task=""):
+        """
+        Returns one vector per text, calling embed_many(list) once for the texts not yet cached
+        and persisting what it returns.
+        """
+        keys = [embedding_key(model, t, task) for t in texts]
+        try:
+            found = self.lookup(list(dict.fromkeys(keys)))
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache unavailable ({self.path}): {e}")
+            return embed_many(texts)
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in missing:
+                missing[key] = text
+        if missing:
+            vectors = embed_many(list(missing.values()))
+            fresh = list(zip(missing.keys(), vectors))
+            found.update(fresh)
+            try:
+                self.store(provider, model, fresh)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache write failed ({self.path}): {e}")
+        return [found[key] for key in keys]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+def open_embedding_cache(path=DEFAULT_CACHE_PATH):
+    """Returns the process-wide cache for a file, so all providers share one connection."""
+    path = os.path.abspath(path)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(path)
+        if cache is None:
+            cache = _CACHES[path] = EmbeddingCache(path)
+        return cache
@@ -0,0 +1,81 @@
+"""
+Client-side splitting of oversized embedding inputs.
+Remote embedding APIs reject inputs past their token/payload limits; long texts are split
+into chunks embedded in one batched request and mean-pooled back into a single vector.
+"""
+
+# Token counts are estimated, not tokenized: ~4 characters per token for English text
+CHARS_PER_TOKEN = 4
+
+# Default per-chunk budget, comfortably under Gemini's and OpenAI's per-input limits
+MAX_CHUNK_TOKENS = 2000
+
+def estimate_tokens(text):
+    return len(text) // CHARS_PER_TOKEN
+
+def split_for_embedding(text, max_tokens=MAX_CHUNK_TOKENS):
+    """
+    Splits text into chunks of at most max_tokens (estimated), breaking on whitespace when one
+    falls in the back half of the window. Texts already within budget come back as [text].
+    """
+    max_chars = max(1, int(max_tokens)) * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return [text]
+
+    chunks = []
+    start, end_of_text = 0, len(text)
+    while start < end_of_text:
+        end = start + max_chars
+        if end < end_of_text:
+            cut = max(text.rfind(" ", start + max_chars // 2, end), text.rfind("\n", start + max_chars // 2, end))
+            if cut > start:
+                end = cut
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        start = end
+    return chunks or [text]
+
+def _numpy():
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+def as_float32(vectors):
+    """Packs a vector (or list of vectors) into a float32 ndarray; unchanged when numpy is missing."""
+    np = _numpy()
+    if np is None:
+        return vectors
+    return np.asarray(vectors, dtype=np.float32)
+
+def mean_pool(vectors):
+    """Averages chunk vectors and L2-normalizes the result."""
+    np = _numpy()
+    if np is None:
+        dim = len(vectors[0])
+        pooled = [sum(v[i] for v in vectors) / len(vectors) for i in range(dim)]
+        norm = sum(x * x for x in pooled) ** 0.5
+        return [x / norm for x in pooled] if norm else pooled
+    pooled = np.mean(np.asarray(vectors, dtype=np.float64), axis=0)
+    norm = np.linalg.norm(pooled)
+    if norm:
+        pooled /= norm
+    return pooled
+
+def embed_pooled(texts, embed_many, max_tokens=MAX_CHUNK_TOKENS):
+    """
+    Embeds texts with a single embed_many(list) call. Any text over max_tokens is split and its
+    chunk vectors mean-pooled, so the result still has one vector per input text.
+    """
+    pieces, spans = [], []
+    for text in texts:
+        chunks = split_for_embedding(text, max_tokens)
+        spans.append((len(pieces), len(pieces) + len(chunks)))
+        pieces.extend(chunks)
+    if len(pieces) == len(texts):
+        return embed_many(texts)
+
+    vectors = embed_many(pieces)
+    return [vectors[a] if b - a == 1 else mean_pool(vectors[a:b]) for a, b in spans]
@@ -149,6 +149,14 @@ class ExecutionEngine(DataMixin, StateMixin, ServiceMixin, DebugMixin):
         }
         self.wires.append(wire)
 
+        # Let nodes drop wiring-dependent caches
+        src = self.nodes.get(from_node)
+        if src is not None:
+            if hasattr(src, "wired_outputs"):
+                src.wired_outputs.add(from_port)
+            if hasattr(src, "invalidate_error_port_cache"):
+                src.invalidate_error_port_cache()
+
     def hot_reload_graph(self):
         """Reloads the graph from disk and surgically patches the running engine."""
         if not self.source_file or not os.path.exists(self.source_file):
@@ -186,6 +194,9 @@ class ExecutionEngine(DataMixin, StateMixin, ServiceMixin, DebugMixin):
             
             # 2. Clear wires (will be repopulated by loader)
             self.wires = []
+            for node in self.nodes.values():
+                if hasattr(node, "wired_outputs"):
+                    node.wired_outputs.clear()
             
             # 3. Load new data into existing engine structure
             # load_graph_data will reuse nodes from self.nodes if IDs match
@@ -209,6 +220,9 @@ class ExecutionEngine(DataMixin, StateMixin, ServiceMixin, DebugMixin):
             # 5. Full Wire and Flow Sync
             # Loader repopulated self.wires, but we must ensure FlowController knows.
             self.flow.wires = self.wires
+            for node in self.nodes.values():
+                if hasattr(node, "invalidate_error_port_cache"):
+                    node.invalidate_error_port_cache()
             
             # 5. Notify existing nodes of property updates
             for n_id, node in self.nodes.items():
@@ -22,6 +22,107 @@ _DYNAMIC_PATTERNS_RAW = [
 ]
 DYNAMIC_PATTERNS_COMPILED = [re.compile(p) for p in _DYNAMIC_PATTERNS_RAW]
 
+# [OPTIMIZATION] Trig chain fusion: a unit conversion feeding a trig node (or fed by an
+# inverse trig node) collapses into the trig node with its Degrees flag set.
+_FUSE_FORWARD = {"Sin", "Cos", "Tan"}
+_FUSE_INVERSE = {"Asin", "Acos", "Atan"}
+
+
+def _is_sole_link(src_id, dst_id, expected, out_wires, in_wires):
+    """True if src's only outgoing wires are `expected` into dst and dst has no other inputs."""
+    outs = out_wires.get(src_id, [])
+    if any(w["to_node"] != dst_id for w in outs):
+        return False
+    if {(w.get("from_port", "Flow"), w.get("to_port", "In")) for w in outs} != expected or len(outs) != len(expected):
+        return False
+    return all(w["from_node"] == src_id for w in in_wires.get(dst_id, []))
+
+
+def fuse_trig_chains(nodes, wires):
+    """
+    Rewrites 'Degrees To Radians -> Sin/Cos/Tan' and 'Asin/Acos/Atan -> Radians To Degrees'
+    pairs into the single trig node with Degrees=True.
+    The input lists are not modified (the caller may save them back to disk).
+    Returns: (nodes, wires, property_overrides) where overrides are {node_id: {prop: value}}
+    to apply after the fused nodes' properties are loaded.
+    """
+    by_id = {n["id"]: n for n in nodes}
+    out_wires, in_wires = {}, {}
+    for w in wires:
+        out_wires.setdefault(w["from_node"], []).append(w)
+        in_wires.setdefault(w["to_node"], []).append(w)
+
+    def _plain(n):
+        props = n.get("properties", {})
+        return not (props.get("is_debug") or props.get("Is Debug"))
+
+    removed = set()
+    redirect = {}  # (node_id, port, is_source) -> (node_id, port)
+    overrides = {}
+
+    for n in nodes:
+        n_type = n.get("type")
+        if n_type == "Degrees To Radians":
+            conv_id = n["id"]
+            targets = {w["to_node"] for w in out_wires.get(conv_id, [])}
+            if len(targets) != 1:
+                continue
+            trig = by_id.get(next(iter(targets)))
+            if not trig or trig.get("type") not in _FUSE_FORWARD or trig["id"] in removed:
+                continue
+            if not (_plain(n) and _plain(trig)) or trig.get("properties", {}).get("Degrees"):
+                continue
+            if not _is_sole_link(conv_id, trig["id"], {("Flow", "Flow"), ("Result", "Angle")}, out_wires, in_wires):
+                continue
+            if any(w.get("to_port", "In") not in ("Flow", "Degrees") for w in in_wires.get(conv_id, [])):
+                continue
+            removed.add(conv_id)
+            redirect[(conv_id, "Flow", False)] = (trig["id"], "Flow")
+            redirect[(conv_id, "Degrees", False)] = (trig["id"], "Angle")
+            overrides[trig["id"]] = {
+                "Degrees": True,
+                "Angle": n.get("properties", {}).get("Degrees", 0.0)
+            }
+
+        elif n_type in _FUSE_INVERSE:
+            trig_id = n["id"]
+            targets = {w["to_node"] for w in out_wires.get(trig_id, [])}
+            if len(targets) != 1:
+                continue
+            conv = by_id.get(next(iter(targets)))
+            if not conv or conv.get("type") != "Radians To Degrees":
+                continue
+            if not (_plain(n) and _plain(conv)) or n.get("properties", {}).get("Degrees"):
+                continue
+            if not _is_sole_link(trig_id, conv["id"], {("Flow", "Flow"), ("Result", "Radians")}, out_wires, in_wires):
+                continue
+            if any(w.get("from_port", "Flow") not in ("Flow", "Result") for w in out_wires.get(conv["id"], [])):
+                continue
+            removed.add(conv["id"])
+            redirect[(conv["id"], "Flow", True)] = (trig_id, "Flow")
+            redirect[(conv["id"], "Result", True)] = (trig_id, "Result")
+            overrides[trig_id] = {"Degrees": True}
+
+    if not removed:
+        return nodes, wires, overrides
+
+    fused_wires = []
+    for w in wires:
+        src = redirect.get((w["from_node"], w.get("from_port", "Flow"), True))
+        dst = redirect.get((w["to_node"], w.get("to_port", "In"), False))
+        if src or dst:
+            w = dict(w)
+            if src:
+                w["from_node"], w["from_port"] = src
+            if dst:
+                w["to_node"], w["to_port"] = dst
+        if w["from_node"] in removed or w["to_node"] in removed:
+            continue
+        fused_wires.append(w)
+
+    logger.debug(f"Fused {len(removed)} trig conversion node(s)")
+    return [n for n in nodes if n["id"] not in removed], fused_wires, overrides
+
 def load_graph_from_file(path, bridge, engine):
     data = smart_load(path)
     if not data:
@@ -91,9 +192,14 @@ def load_graph_data(data, bridge, engine, source_file=None, existing_nodes=None)
     from axonpulse.core.schema import migrate_graph
     data, _ = migrate_graph(data)
 
+    # Live swap keeps a 1:1 mapping with the editor, so only fresh loads are fused
+    nodes_data, wires_data, fused_props = data["nodes"], data["wires"], {}
+    if not existing_nodes:
+        nodes_data, wires_data, fused_props = fuse_trig_chains(nodes_data, wires_data)
+
     # 1. Create Nodes
     # 1. Create Nodes
-    for n_data in data["nodes"]:
+    for n_data in nodes_data:
         node_id = n_data["id"]
         node_type = n_data["type"]
         node_name = n_data.get("name", node_type)
@@ -213,6 +319,9 @@ def load_graph_data(data, bridge, engine, source_file=None, existing_nodes=None)
                 loaded_props.pop(k) # Remove from JSON data
                 was_pruned = True
         
+        if node_id in fused_props:
+            node.properties.update(fused_props[node_id])
+
         # [NEW] Re-sync schema AFTER all properties (including Embedded Data) are loaded
         if hasattr(node, '_parse_legacy_ports'):
             node._parse_legacy_ports()
@@ -272,7 +381,7 @@ def load_graph_data(data, bridge, engine, source_file=None, existing_nodes=None)
         node_map[node_id] = node
 
     # 2. Connect Wires
-    for w_data in data["wires"]:
+    for w_data in wires_data:
         from_id = w_data["from_node"]
         to_id = w_data["to_node"]
         from_port = w_data.get("from_port", "Flow")
@@ -1,5 +1,6 @@
 import multiprocessing
 import abc
+import sys
 from axonpulse.utils.logger import setup_logger
 
 from axonpulse.core.types import DataType, TypeCaster
@@ -12,7 +13,10 @@ class BaseNode(abc.ABC):
     node_version = 1
 
     def __init__(self, node_id, name, bridge):
-        self.node_id = node_id
+        # Interned: node ids are used as dict keys by the engine, wires and bridge on every pulse
+        self.node_id = sys.intern(node_id) if type(node_id) is str else node_id
+        # node_id is fixed for the node's lifetime, so the hot bridge key is built once
+        self._k_active = f"{node_id}_ActivePorts"
         self.name = name
         self.bridge = bridge
         self.logger = setup_logger(f"Node-{name}")
@@ -36,6 +40,7 @@ class BaseNode(abc.ABC):
         
         # Caching
         self._provider_cache = {} # type -> (stack_hash, provider_id)
+        self.wired_outputs = set() # Output ports with at least one wire (kept by the engine)
         
     @property
     def is_hijacked(self):
@@ -64,6 +69,23 @@ class BaseNode(abc.ABC):
         self._provider_cache[provider_type] = (stack_hash, provider_id)
         return provider_id
 
+    def _get(self, kwargs, *keys, default=None):
+        """
+        Resolves an argument: wire value (kwargs) first, then node property, trying each
+        key (canonical name, then legacy aliases) in order. Only None counts as missing,
+        so set-but-falsy values like 0, False and "" are kept.
+        """
+        for k in keys:
+            v = kwargs.get(k)
+            if v is not None:
+                return v
+        props = self.properties
+        for k in keys:
+            v = props.get(k)
+            if v is not None:
+                return v
+        return default
+
     def _parse_legacy_ports(self):
         """Backwards compatibility for default_inputs/outputs properties."""
         if hasattr(self, "default_inputs"):
@@ -0,0 +1,110 @@
+"""
+Retry and throttling helpers for calls to remote APIs (embedding services, LLM endpoints).
+Transient failures (rate limits, 5xx, dropped connections) are retried with capped
+exponential backoff; everything else is raised immediately.
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits and server-side failures
+TRANSIENT_STATUS = frozenset((408, 409, 429, 500, 502, 503, 504))
+
+# A server asking for a longer pause than this is treated as a hard failure
+MAX_RETRY_AFTER = 60.0
+
+def _status_of(exc):
+    """Best-effort HTTP status of an SDK exception (OpenAI, google-api-core, requests/httpx)."""
+    for attr in ("status_code", "code", "http_status"):
+        status = getattr(exc, attr, None)
+        if callable(status):
+            try:
+                status = status()
+            except Exception:
+                status = None
+        if isinstance(status, int):
+            return int(status)
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+def is_transient(exc):
+    """True if exc looks like a rate limit, server error or network hiccup."""
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    status = _status_of(exc)
+    if status is not None:
+        return status in TRANSIENT_STATUS
+    # SDKs without a status attribute still name their throttling errors consistently
+    name = type(exc).__name__
+    return name in ("RateLimitError", "ResourceExhausted", "ServiceUnavailable", "APIConnectionError", "APITimeoutError", "InternalServerError")
+
+def retry_after_seconds(exc):
+    """Parses a Retry-After header (delta-seconds or HTTP date) off the exception's response."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def retry_with_backoff(fn, *args, attempts=5, base=1.0, cap=16.0, retry_on=None, logger=None, **kwargs):
+    """
+    Calls fn(*args, **kwargs), retrying transient failures up to `attempts` times in total.
+    Waits for the server's Retry-After when given, otherwise min(cap, base * 2**i) plus jitter.
+    `retry_on` is an exception tuple or predicate; by default is_transient() decides.
+    """
+    if retry_on is None:
+        should_retry = is_transient
+    elif isinstance(retry_on, tuple) or isinstance(retry_on, type):
+        should_retry = lambda e: isinstance(e, retry_on)
+    else:
+        should_retry = retry_on
+
+    for attempt in range(attempts):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == attempts - 1 or not should_retry(e):
+                raise
+            delay = retry_after_seconds(e)
+            if delay is None:
+                delay = min(cap, base * (2 ** attempt)) + random.uniform(0, base)
+            elif delay > MAX_RETRY_AFTER:
+                raise
+            if logger:
+                logger.warning(f"Transient failure ({e}); retrying in {delay:.1f}s [{attempt + 1}/{attempts - 1}]")
+            time.sleep(delay)
+
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing `rpm` calls per minute, with bursts up to `burst`
+    (defaults to one second's worth). acquire() blocks until a token is available.
+    """
+    def __init__(self, rpm, burst=None):
+        self.rate = rpm / 60.0
+        self.capacity = float(burst or max(1.0, self.rate))
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
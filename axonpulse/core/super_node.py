@@ -1,6 +1,7 @@
 from axonpulse.core.node import BaseNode
 from axonpulse.core.types import DataType, TypeCaster
 import inspect
+from types import MappingProxyType
 
 class SuperNode(BaseNode):
     """
@@ -12,14 +13,32 @@ class SuperNode(BaseNode):
     
     Handlers:
     - register_handler("PortName", callback)
+    
+    Static Schema:
+    - INPUT_SCHEMA / OUTPUT_SCHEMA: optional class-level dicts, frozen and shared
+      by every instance. Nodes using them must not mutate the schema in define_schema().
     """
+    INPUT_SCHEMA = None
+    OUTPUT_SCHEMA = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Freeze class schemas once; instances read them instead of building their own dicts
+        if cls.__dict__.get("INPUT_SCHEMA") is not None:
+            cls.INPUT_SCHEMA = MappingProxyType(dict(cls.INPUT_SCHEMA))
+            cls.input_schema = cls.INPUT_SCHEMA
+        if cls.__dict__.get("OUTPUT_SCHEMA") is not None:
+            cls.OUTPUT_SCHEMA = MappingProxyType(dict(cls.OUTPUT_SCHEMA))
+            cls.output_schema = cls.OUTPUT_SCHEMA
 
     def __init__(self, node_id, name, bridge):
         super().__init__(node_id, name, bridge)
         
-        # Schema Definitions
-        self.input_schema = {}
-        self.output_schema = {}
+        # Schema Definitions (class-level schemas are shared, not copied)
+        if self.INPUT_SCHEMA is None:
+            self.input_schema = {}
+        if self.OUTPUT_SCHEMA is None:
+            self.output_schema = {}
         
         # Event Handlers { "TriggerPort": method }
         self.handlers = {}
@@ -146,6 +165,25 @@ class SuperNode(BaseNode):
         if hasattr(self, "is_legacy") and self.is_legacy:
             self.bridge.set(f"{self.node_id}_{port_name}", value, self.name)
 
+    def set_outputs(self, values, active_ports=None):
+        """
+        Writes several output values in one bridge batch (single registry update).
+        Same keys as set_output; values is {port_name: value}. active_ports, when given,
+        is published as {node_id}_ActivePorts in the same batch.
+        """
+        registry = getattr(self.bridge, '_port_registry', None)
+        is_legacy = getattr(self, "is_legacy", False)
+        batch = {}
+        if active_ports is not None:
+            batch[self._k_active] = active_ports
+        for port_name, value in values.items():
+            if registry:
+                batch[registry.bridge_key(self.node_id, port_name, "output")] = value
+            if is_legacy:
+                batch[f"{self.node_id}_{port_name}"] = value
+        if batch:
+            self.bridge.set_batch(batch, self.name)
+
     def define_schema(self):
         """
         Override to define input/output schema. 
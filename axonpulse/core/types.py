@@ -173,6 +173,7 @@ class TypeCaster:
         if isinstance(val, list): return val
         if isinstance(val, (tuple, set)): return list(val)
         if val is None: return []
+        if getattr(val, "ndim", 0): return val.tolist() # numpy arrays
         # Try JSON parse if string
         if isinstance(val, str):
             if val.strip().startswith("["):
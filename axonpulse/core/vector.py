@@ -3,6 +3,8 @@ import os
 import subprocess
 import importlib
 import logging
+from axonpulse.core.retry import retry_with_backoff
+from axonpulse.core.embedding_chunks import MAX_CHUNK_TOKENS, embed_pooled, as_float32
 
 logger = logging.getLogger(__name__)
 
@@ -37,12 +39,35 @@ class DependencyManager:
 
 class VectorProvider:
     """Abstract base class for Embedding Providers."""
+    rate_limiter = None # Optional RateLimiter gating every remote request
+    embedding_cache = None # Optional EmbeddingCache consulted before every remote request
+
+    def _remote(self, fn, *args, **kwargs):
+        """Issues one remote API request, throttled per attempt and retried on transient failures."""
+        limiter = self.rate_limiter
+        def attempt():
+            if limiter is not None:
+                limiter.acquire()
+            return fn(*args, **kwargs)
+        return retry_with_backoff(attempt)
+
+    def _through_cache(self, texts, embed_many, task=""):
+        """Runs embed_many(texts) for the texts missing from the persistent cache only."""
+        cache = self.embedding_cache
+        if cache is None:
+            return embed_many(texts)
+        return cache.get_or_compute(type(self).__name__, self.model_name, texts, embed_many, task)
+
     def embed_documents(self, texts):
         raise NotImplementedError
 
     def embed_query(self, text):
         raise NotImplementedError
 
+    def embed_queries(self, texts):
+        """Embeds several search queries. Override with a single batched call where the backend has one."""
+        return [self.embed_query(t) for t in texts]
+
 class FastEmbedProvider(VectorProvider):
     """
     Concrete implementation using FastEmbed (ONNX Runtime).
@@ -50,6 +75,7 @@ class FastEmbedProvider(VectorProvider):
     def __init__(self, model_name="BAAI/bge-small-en-v1.5"):
         # Lazy import inside init to prevent startup crash if not installed
         from fastembed import TextEmbedding
+        self.model_name = model_name
         self.model = TextEmbedding(model_name=model_name)
 
     def embed_documents(self, texts):
@@ -60,54 +86,76 @@ class FastEmbedProvider(VectorProvider):
         result = list(self.model.embed([text]))
         return result[0]
 
+    def embed_queries(self, texts):
+        return list(self.model.embed(texts))
+
 class GeminiVectorProvider(VectorProvider):
     """
     Wrapper for Google Gemini Embeddings.
     """
-    def __init__(self, api_key, model_name="models/embedding-001"):
+    def __init__(self, api_key, model_name="models/embedding-001", rate_limiter=None, max_chunk_tokens=MAX_CHUNK_TOKENS, embedding_cache=None):
         import google.generativeai as genai
         self.genai = genai
         self.model_name = model_name
+        self.rate_limiter = rate_limiter
+        self.max_chunk_tokens = max_chunk_tokens
+        self.embedding_cache = embedding_cache
         if not api_key:
              raise ValueError("Gemini API Key is required.")
         genai.configure(api_key=api_key)
 
+    def _embed(self, texts, task_type):
+        def request(batch):
+            # A list of contents comes back as a list of vectors in one request
+            result = self._remote(
+                self.genai.embed_content,
+                model=self.model_name,
+                content=batch,
+                task_type=task_type
+            )
+            return result['embedding']
+        return self._through_cache(texts, request, task_type)
+
     def embed_documents(self, texts):
-        results = self.genai.embed_content(
-            model=self.model_name,
-            content=texts,
-            task_type="retrieval_document"
-        )
-        return results['embedding']
+        return as_float32(embed_pooled(texts, lambda t: self._embed(t, "retrieval_document"), self.max_chunk_tokens))
 
     def embed_query(self, text):
-        result = self.genai.embed_content(
-            model=self.model_name,
-            content=text,
-            task_type="retrieval_query"
-        )
-        return result['embedding']
+        return self.embed_queries([text])[0]
+
+    def embed_queries(self, texts):
+        return as_float32(embed_pooled(list(texts), lambda t: self._embed(t, "retrieval_query"), self.max_chunk_tokens))
 
 class OpenAIVectorProvider(VectorProvider):
     """
     Wrapper for OpenAI Embeddings.
     """
-    def __init__(self, api_key, model_name="text-embedding-3-small"):
+    def __init__(self, api_key, model_name="text-embedding-3-small", rate_limiter=None, max_chunk_tokens=MAX_CHUNK_TOKENS, embedding_cache=None):
         from openai import OpenAI
         if not api_key:
              raise ValueError("OpenAI API Key is required.")
         self.client = OpenAI(api_key=api_key)
         self.model_name = model_name
+        self.rate_limiter = rate_limiter
+        self.max_chunk_tokens = max_chunk_tokens
+        self.embedding_cache = embedding_cache
 
-    def embed_documents(self, texts):
+    def _embed(self, texts):
         texts = [t.replace("\n", " ") for t in texts] # Best practice for OpenAI
-        response = self.client.embeddings.create(input=texts, model=self.model_name)
+        return self._through_cache(texts, self._request)
+
+    def _request(self, texts):
+        response = self._remote(self.client.embeddings.create, input=texts, model=self.model_name)
         return [data.embedding for data in response.data]
 
+    def embed_documents(self, texts):
+        return as_float32(embed_pooled(texts, self._embed, self.max_chunk_tokens))
+
     def embed_query(self, text):
-        text = text.replace("\n", " ")
-        response = self.client.embeddings.create(input=[text], model=self.model_name)
-        return response.data[0].embedding
+        return self.embed_queries([text])[0]
+
+    def embed_queries(self, texts):
+        # Queries and documents share one OpenAI endpoint, so this is a single batched request
+        return as_float32(embed_pooled(list(texts), self._embed, self.max_chunk_tokens))
 
 class TFIDFVectorProvider(VectorProvider):
     """
@@ -164,6 +212,10 @@ class BM25VectorProvider(VectorProvider):
         tokenized_query = query.split(" ")
         return self.model.get_scores(tokenized_query).tolist()
 
+def _as_list(vector):
+    """Plain float list for backends whose clients reject numpy arrays."""
+    return vector.tolist() if hasattr(vector, "tolist") else list(vector)
+
 class BaseVectorDatabase:
     """Abstract Interface for Vector DBs."""
     def add(self, table_name, documents, embeddings, metadata=None):
@@ -249,7 +301,7 @@ class PineconeVectorDatabase(BaseVectorDatabase):
             vid = str(uuid.uuid4())
             vectors.append({
                 "id": vid,
-                "values": embeddings[i],
+                "values": _as_list(embeddings[i]),
                 "metadata": meta
             })
             
@@ -261,7 +313,7 @@ class PineconeVectorDatabase(BaseVectorDatabase):
         
         results = self.index.query(
             namespace=target_ns,
-            vector=query_vector,
+            vector=_as_list(query_vector),
             top_k=int(limit),
             include_values=False,
             include_metadata=True
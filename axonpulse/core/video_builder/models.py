@@ -1,6 +1,12 @@
+import json
 from typing import List, Dict, Any, Optional, Union
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class AssetType(Enum):
     VIDEO = "video"
     AUDIO = "audio"
@@ -90,6 +96,20 @@ class SceneList:
     def serialize(self) -> List[Dict[str, Any]]:
         return [obj.to_dict() for obj in self.objects]
         
+    @staticmethod
+    def load(data: Union[str, bytes, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Returns serialized scene dicts from either the list itself or its JSON text
+        (e.g. a timeline saved to disk). JSON is parsed with orjson when installed.
+        """
+        if isinstance(data, (str, bytes, bytearray, memoryview)):
+            if orjson is not None:
+                return orjson.loads(data)
+            if isinstance(data, memoryview):
+                data = data.tobytes()
+            return json.loads(data)
+        return data
+
     @classmethod
-    def deserialize(cls, data: List[Dict[str, Any]]) -> 'SceneList':
-        return cls([SceneObject.from_dict(d) for d in data])
+    def deserialize(cls, data: Union[str, bytes, List[Dict[str, Any]]]) -> 'SceneList':
+        return cls([SceneObject.from_dict(d) for d in cls.load(data)])
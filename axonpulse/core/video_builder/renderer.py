@@ -0,0 +1,735 @@
+import os
+import re
+import json
+import math
+import time
+import shutil
+import hashlib
+import tempfile
+import subprocess
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from axonpulse.core.video_builder.models import SceneList, AssetType
+from axonpulse.utils.logger import setup_logger
+
+logger = setup_logger("TimelineRenderer")
+
+# Hardware encoder per HW Accel mode and codec family; "auto" tries them in this order
+_HW_ENCODERS = {
+    "cuda": {"h264": "h264_nvenc", "hevc": "hevc_nvenc"},
+    "qsv": {"h264": "h264_qsv", "hevc": "hevc_qsv"},
+    "videotoolbox": {"h264": "h264_videotoolbox", "hevc": "hevc_videotoolbox"},
+    "amf": {"h264": "h264_amf", "hevc": "hevc_amf"},
+}
+_CPU_ENCODERS = {"h264": "libx264", "hevc": "libx265"}
+# encoder -> (preset, extra ffmpeg params)
+_ENCODER_PARAMS = {
+    "h264_nvenc": ("p4", ["-tune", "hq", "-rc", "vbr"]),
+    "hevc_nvenc": ("p4", ["-tune", "hq", "-rc", "vbr"]),
+    "h264_qsv": ("faster", []),
+    "hevc_qsv": ("faster", []),
+}
+
+# Parallel rendering: frames per worker task, and the cap on frames rendered ahead of
+# the encoder (~100 frames is ~280MB of RGB at 720p)
+_FRAME_BATCH = 8
+_MAX_FRAMES_IN_FLIGHT = 100
+# Shorter timelines render faster in one process than it takes to spawn the pool
+_PARALLEL_MIN_FRAMES = 240
+
+# Segments cheaper than this to render are not worth a cache slot
+_CACHE_MIN_RENDER_NS = 512_000_000
+
+# HW Accel mode -> FFmpeg decode hwaccel method (frames are downloaded for compositing)
+_HW_DECODERS = {"cuda": "cuda", "qsv": "qsv", "videotoolbox": "videotoolbox", "amf": "d3d11va"}
+
+# Output container extensions whose video can be stream-copied from matching sources
+_STREAM_COPY_EXTS = (".mp4", ".mov", ".mkv")
+
+# Probed once per process; empty set if ffmpeg could not be queried
+_ENCODERS = None
+# method -> True/False once a device has been tried
+_HW_DEVICES = {}
+
+
+def get_ffmpeg_binary():
+    """Returns the FFmpeg executable MoviePy is configured to use."""
+    try:
+        from moviepy.config import get_setting
+        return get_setting("FFMPEG_BINARY")
+    except Exception:
+        return "ffmpeg"
+
+
+def available_encoders():
+    """Returns the set of encoder names reported by `ffmpeg -encoders` (empty if the probe fails)."""
+    global _ENCODERS
+    if _ENCODERS is None:
+        try:
+            out = subprocess.run(
+                [get_ffmpeg_binary(), "-hide_banner", "-encoders"],
+                capture_output=True, text=True, timeout=15
+            ).stdout
+            encoders = set()
+            # The capability legend (" V..... = Video") precedes the "------" separator
+            _, _, table = out.partition("------")
+            for line in table.splitlines():
+                parts = line.split()
+                # Rows look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+                if len(parts) >= 2 and len(parts[0]) == 6 and parts[0][0] in "VAS":
+                    encoders.add(parts[1])
+            _ENCODERS = encoders
+        except Exception as e:
+            logger.debug(f"FFmpeg encoder probe failed: {e}")
+            _ENCODERS = set()
+    return _ENCODERS
+
+
+def hw_device_available(method):
+    """True if FFmpeg can open a `method` hwaccel device here (cached; building support alone is not enough)."""
+    ok = _HW_DEVICES.get(method)
+    if ok is None:
+        try:
+            ok = subprocess.run(
+                [get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error", "-init_hw_device", method,
+                 "-f", "lavfi", "-i", "nullsrc=s=16x16:d=0.04", "-f", "null", "-"],
+                capture_output=True, timeout=15
+            ).returncode == 0
+        except Exception as e:
+            logger.debug(f"FFmpeg hwaccel probe for {method} failed: {e}")
+            ok = False
+        _HW_DEVICES[method] = ok
+    return ok
+
+
+def select_hw_decoder(hw_accel="auto"):
+    """
+    Returns the -hwaccel method for decoding source videos, or None for software decode.
+    "auto" follows the encoder preference so decode and encode share one GPU.
+    """
+    mode = (hw_accel or "auto").lower()
+    if mode == "none":
+        return None
+    modes = list(_HW_ENCODERS) if mode == "auto" else [mode]
+    encoders = available_encoders()
+    for name in modes:
+        method = _HW_DECODERS.get(name)
+        if method is None:
+            continue
+        if mode == "auto" and _HW_ENCODERS[name]["h264"] not in encoders:
+            continue
+        if hw_device_available(method):
+            return method
+    return None
+
+
+# path -> (file signature, stream params or None)
+_PROBES = {}
+_DURATION_RE = re.compile(r"Duration: (\d+):(\d+):([\d.]+)")
+_VIDEO_STREAM_RE = re.compile(r"Stream #\d+:\d+.*?: Video: (\w+)(?: \(([^)]*)\))?[^,]*, (\w+)(?:\([^)]*\))?, (\d+)x(\d+)(.*)")
+_AUDIO_STREAM_RE = re.compile(r"Stream #\d+:\d+.*?: Audio: ")
+
+
+def probe_video_stream(path):
+    """
+    Returns the first video stream's params from `ffmpeg -i` as a dict (codec, profile,
+    pix_fmt, size, sar, fps, tbn, duration, audio), or None. Cached until the file changes.
+    """
+    signature = _file_signature(path)
+    cached = _PROBES.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    info = None
+    if signature is not None:
+        try:
+            err = subprocess.run([get_ffmpeg_binary(), "-hide_banner", "-i", path],
+                                 capture_output=True, text=True, timeout=15).stderr
+            duration = _DURATION_RE.search(err)
+            stream = _VIDEO_STREAM_RE.search(err)
+            if duration and stream:
+                rest = stream.group(6)
+                sar = re.search(r"SAR (\d+:\d+)", rest)
+                fps = re.search(r"([\d.]+) fps", rest)
+                tbn = re.search(r"([\d.]+k?) tbn", rest)
+                h, m, sec = duration.groups()
+                info = {
+                    "codec": stream.group(1), "profile": stream.group(2), "pix_fmt": stream.group(3),
+                    "size": (int(stream.group(4)), int(stream.group(5))),
+                    "sar": sar.group(1) if sar else "1:1",
+                    "fps": float(fps.group(1)) if fps else None,
+                    "tbn": tbn.group(1) if tbn else None,
+                    "duration": int(h) * 3600 + int(m) * 60 + float(sec),
+                    "audio": _AUDIO_STREAM_RE.search(err) is not None,
+                }
+        except Exception as e:
+            logger.debug(f"FFmpeg probe of {path} failed: {e}")
+    _PROBES[path] = (signature, info)
+    return info
+
+
+def _stream_codec(encoder):
+    """Codec name FFmpeg reports for streams produced by `encoder` (h264/hevc only)."""
+    if encoder == "libx264" or encoder.startswith("h264_"):
+        return "h264"
+    if encoder == "libx265" or encoder.startswith("hevc_"):
+        return "hevc"
+    return None
+
+
+def _encoder_settings(encoder):
+    preset, params = _ENCODER_PARAMS.get(encoder, (None, []))
+    return encoder, preset, list(params)
+
+
+def select_video_codec(out_path, codec="auto", hw_accel="auto"):
+    """
+    Picks (codec, preset, ffmpeg_params) for the output.
+    codec: "auto"/"h264", "hevc", or an explicit FFmpeg encoder name.
+    hw_accel: "auto", "cuda", "qsv", "videotoolbox", "amf" or "none".
+    Hardware encoders are only chosen when `ffmpeg -encoders` lists them.
+    """
+    ext = os.path.splitext(out_path)[1].lower()
+    if ext == ".webm":
+        return "libvpx", None, []
+    family = (codec or "auto").lower()
+    if family == "auto":
+        family = "h264"
+    if family not in _CPU_ENCODERS:
+        # Explicit encoder name: trust the caller
+        return _encoder_settings(codec)
+
+    mode = (hw_accel or "auto").lower()
+    if mode != "none":
+        encoders = available_encoders()
+        modes = _HW_ENCODERS if mode == "auto" else [mode]
+        for name in modes:
+            encoder = _HW_ENCODERS.get(name, {}).get(family)
+            if encoder in encoders:
+                return _encoder_settings(encoder)
+    return _CPU_ENCODERS[family], "veryfast", []
+
+
+class RenderCache:
+    """
+    On-disk cache of encoded timeline segments, keyed by a content hash.
+    Least recently used files are evicted past max_entries (hits refresh the mtime).
+    """
+
+    def __init__(self, root=None, max_entries=512):
+        self.root = root or os.path.join(os.path.expanduser("~"), ".axonpulse", "render_cache")
+        self.max_entries = max_entries
+
+    def _path(self, key, ext):
+        return os.path.join(self.root, f"{key}{ext}")
+
+    def get(self, key, ext):
+        path = self._path(key, ext)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key, ext, src_path):
+        os.makedirs(self.root, exist_ok=True)
+        path = self._path(key, ext)
+        shutil.move(src_path, path)
+        self._evict()
+        return path
+
+    def _evict(self):
+        try:
+            entries = [e for e in os.scandir(self.root) if e.is_file()]
+        except OSError:
+            return
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def _hw_decode_reader():
+    """FFMPEG_VideoReader that decodes with an -hwaccel method (MoviePy 1.x has no pre-input args hook)."""
+    global _HWReader
+    if _HWReader is None:
+        import subprocess as sp
+        from moviepy.video.io.ffmpeg_reader import FFMPEG_VideoReader
+
+        class HWDecodeReader(FFMPEG_VideoReader):
+            hwaccel = None
+
+            def initialize(self, starttime=0):
+                """Same pipe as FFMPEG_VideoReader.initialize, with -hwaccel before the input."""
+                self.close()
+                i_arg = ["-hwaccel", self.hwaccel]
+                if starttime != 0:
+                    offset = min(1, starttime)
+                    i_arg += ["-ss", "%.06f" % (starttime - offset), "-i", self.filename, "-ss", "%.06f" % offset]
+                else:
+                    i_arg += ["-i", self.filename]
+                cmd = ([get_ffmpeg_binary()] + i_arg +
+                       ["-loglevel", "error", "-f", "image2pipe", "-vf", "scale=%d:%d" % tuple(self.size),
+                        "-sws_flags", self.resize_algo, "-pix_fmt", self.pix_fmt, "-vcodec", "rawvideo", "-"])
+                popen_params = {"bufsize": self.bufsize, "stdout": sp.PIPE, "stderr": sp.PIPE, "stdin": sp.DEVNULL}
+                if os.name == "nt":
+                    popen_params["creationflags"] = 0x08000000
+                self.proc = sp.Popen(cmd, **popen_params)
+
+        _HWReader = HWDecodeReader
+    return _HWReader
+
+_HWReader = None
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+        return [st.st_size, st.st_mtime_ns]
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _resize(clip, size):
+    """Resizes a clip with Pillow directly (MoviePy 1.x's resize fx still uses the removed Image.ANTIALIAS)."""
+    import numpy as np
+    from PIL import Image
+
+    def resize_frame(frame):
+        return np.asarray(Image.fromarray(frame.astype("uint8")).resize(size, Image.LANCZOS))
+
+    resized = clip.fl_image(resize_frame)
+    if clip.mask is not None:
+        resized = resized.set_mask(clip.mask.fl_image(
+            lambda m: np.asarray(Image.fromarray(m.astype("float32"), mode="F").resize(size, Image.BILINEAR))))
+    return resized
+
+
+class TimelineRenderer:
+    """
+    Turns a serialized SceneList into a video file with MoviePy.
+    Heavy: run it through render_in_worker() so the engine process stays responsive.
+    """
+
+    def __init__(self, width=1920, height=1080, fps=24, auto_ducking=True, ducking_factor=0.2, ducking_ramp=0.5, codec="auto", hw_accel="auto", threads=0):
+        self.width = int(width)
+        self.height = int(height)
+        self.fps = int(fps)
+        self.auto_ducking = bool(auto_ducking)
+        self.ducking_factor = float(ducking_factor)
+        self.ducking_ramp = float(ducking_ramp)
+        self.codec = codec
+        self.hw_accel = hw_accel
+        self.threads = int(threads) if threads else (os.cpu_count() or 1)
+        self._hw_decoder = select_hw_decoder(hw_accel)
+
+    def settings(self):
+        return dict(width=self.width, height=self.height, fps=self.fps, auto_ducking=self.auto_ducking,
+                    ducking_factor=self.ducking_factor, ducking_ramp=self.ducking_ramp,
+                    codec=self.codec, hw_accel=self.hw_accel, threads=self.threads)
+
+    def compose(self, timeline_data, opened, with_audio=True):
+        """Builds (video, voices, music, duration) for a SceneList or its serialized form."""
+        from moviepy.editor import CompositeVideoClip
+
+        sl = _scene_list(timeline_data)
+        duration = sl.get_duration()
+        if duration <= 0:
+            raise ValueError("Timeline is empty or has no timed objects.")
+
+        visuals, voices, music = [], [], []
+        for obj in sl.objects:
+            if obj.asset_type == AssetType.AUDIO and not with_audio:
+                continue
+            clip = self._build_clip(obj, opened, with_audio)
+            if clip is None:
+                continue
+            if obj.asset_type == AssetType.AUDIO:
+                (music if obj.meta.get("role", "music") == "music" else voices).append(clip)
+            else:
+                visuals.append(clip)
+                if with_audio and getattr(clip, "audio", None) is not None:
+                    voices.append(clip.audio.set_start(clip.start))
+
+        video = CompositeVideoClip(visuals, size=(self.width, self.height), bg_color=(0, 0, 0)).set_duration(duration)
+        return video, voices, music, duration
+
+    def _source_audio(self, sl, opened):
+        """
+        Builds (voices, music) for a stream-copied render: the audio objects plus the source
+        videos' own tracks, opened as audio only so no video frame is ever decoded.
+        """
+        from moviepy.editor import AudioFileClip
+
+        voices, music = [], []
+        for obj in sl.objects:
+            if obj.asset_type == AssetType.AUDIO:
+                clip = self._build_clip(obj, opened)
+                if clip is not None:
+                    (music if obj.meta.get("role", "music") == "music" else voices).append(clip)
+            elif (probe_video_stream(obj.asset_path) or {}).get("audio"):
+                clip = AudioFileClip(obj.asset_path)
+                opened.append(clip)
+                if obj.duration:
+                    clip = clip.subclip(0, min(obj.duration, clip.duration))
+                voices.append(clip.set_start(obj.start_time))
+        return voices, music
+
+    def _write_audio(self, voices, music, duration, work_dir):
+        """
+        Mixes the audio tracks to WAV and returns (input paths, ffmpeg map args), where the
+        paths are added as inputs 1.. after the video. With ducking, voice and music stay
+        separate and FFmpeg's sidechaincompress lowers the music under the voice.
+        """
+        from moviepy.editor import CompositeAudioClip
+
+        def mix(tracks, name):
+            path = os.path.join(work_dir, name)
+            CompositeAudioClip(tracks).set_duration(duration).write_audiofile(
+                path, fps=44100, codec="pcm_s16le", logger=None)
+            return path
+
+        if not voices and not music:
+            return [], []
+        if not (self.auto_ducking and voices and music):
+            return [mix(voices + music, "audio.wav")], ["-map", "1:a"]
+
+        ramp_ms = min(max(self.ducking_ramp * 1000.0, 0.01), 2000.0)
+        ratio = min(max(1.0 / max(self.ducking_factor, 1e-3), 1.0), 20.0)
+        graph = (f"[1:a]asplit=2[sc][voice];"
+                 f"[2:a][sc]sidechaincompress=threshold=0.05:ratio={ratio:g}:attack={ramp_ms:g}:release={ramp_ms:g}:makeup=1[ducked];"
+                 f"[voice][ducked]amix=inputs=2:duration=longest:normalize=0[aout]")
+        return [mix(voices, "voice.wav"), mix(music, "music.wav")], ["-filter_complex", graph, "-map", "[aout]"]
+
+    def render_timeline(self, timeline_data, out_path, cache=None):
+        """Renders to out_path. With a RenderCache, unchanged segments are reused instead of re-rendered."""
+        opened = []
+        work_dir = tempfile.mkdtemp(prefix="axonpulse_render_")
+        try:
+            sl = _scene_list(timeline_data)
+            # Decided before any clip is built: a stream copy never opens the sources' frames
+            copy = self._stream_copy_sources(sl, out_path)
+            if copy:
+                sources, end = copy
+                logger.info(f"Stream-copying {len(sources)} source video(s); no re-encode needed.")
+                voices, music = self._source_audio(sl, opened)
+                self._concat(sources, out_path, self._write_audio(voices, music, end, work_dir), work_dir)
+                return out_path
+
+            video, voices, music, duration = self.compose(sl, opened)
+            ext = os.path.splitext(out_path)[1].lower()
+            if ext == ".gif":
+                video.write_gif(out_path, fps=self.fps, logger=None)
+                return out_path
+
+            audio = self._write_audio(voices, music, duration, work_dir)
+            n_frames = max(1, math.ceil(round(duration * self.fps, 6)))
+            if cache is None:
+                self._write_range(video, timeline_data, 0, n_frames, out_path, audio)
+            else:
+                self._write_cached(video, timeline_data, n_frames, out_path, audio, cache, ext, work_dir)
+            return out_path
+        finally:
+            _close_all(opened)
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _stream_copy_sources(self, sl, out_path):
+        """
+        Returns (source paths, end time) when the visual track is just whole videos played
+        back to back, full frame, untransformed, and already encoded the way this render would
+        encode them (same codec/profile/pix_fmt/size/SAR/fps/timebase). None otherwise.
+        """
+        if os.path.splitext(out_path)[1].lower() not in _STREAM_COPY_EXTS:
+            return None
+        want = _stream_codec(select_video_codec(out_path, self.codec, self.hw_accel)[0])
+        if want is None:
+            return None
+
+        half_frame = 0.5 / self.fps
+        visuals = sorted((o for o in sl.objects if o.asset_type != AssetType.AUDIO), key=lambda o: o.start_time)
+        if not visuals:
+            return None
+        sources, params, end = [], None, 0.0
+        for obj in visuals:
+            if obj.asset_type != AssetType.VIDEO:
+                return None
+            if (list(obj.position) != [0, 0] or list(obj.scale) != [1, 1]
+                    or obj.rotation or obj.opacity < 1.0):
+                return None
+            info = probe_video_stream(obj.asset_path)
+            if (info is None or info["codec"] != want or info["pix_fmt"] != "yuv420p"
+                    or info["size"] != (self.width, self.height) or info["fps"] != self.fps):
+                return None
+            key = (info["profile"], info["sar"], info["tbn"])
+            if params is None:
+                params = key
+            elif key != params:
+                return None
+            # Back to back, and never trimmed (a copied stream can only be cut on keyframes)
+            if abs(obj.start_time - end) > half_frame:
+                return None
+            if obj.duration and obj.duration < info["duration"] - half_frame:
+                return None
+            sources.append(obj.asset_path)
+            end += info["duration"]
+
+        # Audio running past the last video would need black frames rendered after it
+        for obj in sl.objects:
+            if obj.asset_type == AssetType.AUDIO and obj.start_time + (obj.duration or 0.0) > end + half_frame:
+                return None
+        return sources, end
+
+    def _segments(self, timeline_data, n_frames, codec):
+        """
+        Splits [0, n_frames) wherever a visual object starts or ends. Each segment's key
+        hashes the objects visible in it with their times made segment-relative, so a
+        segment that is unchanged (or merely moved in time) hashes the same.
+        """
+        fps = self.fps
+        visuals = [d for d in timeline_data if d.get("type") != AssetType.AUDIO.value]
+        cuts = {0, n_frames}
+        for d in visuals:
+            start = d.get("start", 0.0)
+            cuts.add(min(n_frames, max(0, round(start * fps))))
+            if d.get("duration"):
+                cuts.add(min(n_frames, max(0, round((start + d["duration"]) * fps))))
+        cuts = sorted(cuts)
+
+        segments = []
+        for f0, f1 in zip(cuts, cuts[1:]):
+            t0, t1 = f0 / fps, f1 / fps
+            objects = []
+            for d in visuals:
+                start = d.get("start", 0.0)
+                end = start + d["duration"] if d.get("duration") else math.inf
+                if start < t1 and end > t0:
+                    shifted = dict(d, start=round(start - t0, 6))
+                    objects.append([shifted, _file_signature(d.get("path"))])
+            blob = json.dumps([self.width, self.height, fps, codec, f1 - f0, objects], sort_keys=True, default=str)
+            segments.append((f0, f1, hashlib.blake2b(blob.encode(), digest_size=20).hexdigest()))
+        return segments
+
+    def _write_cached(self, video, timeline_data, n_frames, out_path, audio, cache, ext, work_dir):
+        codec = select_video_codec(out_path, self.codec, self.hw_accel)[0]
+        parts = []
+        hits = 0
+        for i, (f0, f1, key) in enumerate(self._segments(timeline_data, n_frames, codec)):
+            path = cache.get(key, ext)
+            if path is not None:
+                hits += 1
+                parts.append(path)
+                continue
+            path = os.path.join(work_dir, f"part_{i}{ext}")
+            t = time.perf_counter_ns()
+            used = self._write_range(video, timeline_data, f0, f1, path, None)
+            # A fallback encoder's stream would not concat cleanly with cached siblings
+            if used == codec and time.perf_counter_ns() - t >= _CACHE_MIN_RENDER_NS:
+                path = cache.put(key, ext, path)
+            parts.append(path)
+        logger.info(f"Render cache: {hits}/{len(parts)} segments reused.")
+        self._concat(parts, out_path, audio, work_dir)
+
+    def _concat(self, parts, out_path, audio, work_dir):
+        """Joins encoded segments with the concat demuxer (stream copy) and muxes the audio."""
+        list_path = os.path.join(work_dir, "concat.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            for part in parts:
+                escaped = os.path.abspath(part).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        cmd = [get_ffmpeg_binary(), "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", list_path]
+        cmd += _audio_args(audio) + ["-c:v", "copy", out_path]
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode(errors="replace").strip() or "ffmpeg concat failed")
+
+    def _write_range(self, video, timeline_data, f0, f1, out_path, audio):
+        """
+        Encodes frames [f0, f1) to out_path. Returns the encoder actually used
+        (a listed hardware encoder can still be unusable, so CPU is the fallback).
+        """
+        codec, preset, params = select_video_codec(out_path, self.codec, self.hw_accel)
+        try:
+            self._encode_frames(video, timeline_data, f0, f1, out_path, audio, codec, preset, params)
+            return codec
+        except RuntimeError as e:
+            if codec.startswith("lib"):
+                raise
+            fallback = _CPU_ENCODERS["hevc" if codec.startswith("hevc") else "h264"]
+            logger.warning(f"{codec} encode failed ({e}); falling back to {fallback}.")
+            self._encode_frames(video, timeline_data, f0, f1, out_path, audio, fallback, "veryfast", [])
+            return fallback
+
+    def _encode_frames(self, video, timeline_data, f0, f1, out_path, audio, codec, preset, params):
+        """
+        Streams frames [f0, f1) as raw RGB into a single FFmpeg encoder over stdin.
+        Long ranges are composed by a pool of worker processes (each builds the
+        composite once); short ones are composed here.
+        """
+        n_frames = f1 - f0
+        cmd = [get_ffmpeg_binary(), "-y", "-loglevel", "error",
+               "-f", "rawvideo", "-vcodec", "rawvideo", "-s", f"{self.width}x{self.height}",
+               "-pix_fmt", "rgb24", "-r", str(self.fps), "-i", "-"]
+        cmd += _audio_args(audio) + ["-c:v", codec]
+        if preset:
+            cmd += ["-preset", preset]
+        cmd += params + ["-pix_fmt", "yuv420p", out_path]
+
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            if self.threads > 1 and n_frames >= _PARALLEL_MIN_FRAMES:
+                self._feed_parallel(proc.stdin, timeline_data, f0, f1)
+            else:
+                for i in range(f0, f1):
+                    proc.stdin.write(_frame_bytes(video, i / self.fps))
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            if proc.stdin and not proc.stdin.closed:
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+        err = proc.stderr.read()
+        if proc.wait() != 0:
+            raise RuntimeError(err.decode(errors="replace").strip() or f"ffmpeg exited with {proc.returncode}")
+
+    def _feed_parallel(self, pipe, timeline_data, f0, f1):
+        ctx = multiprocessing.get_context("spawn")
+        workers = max(1, min(self.threads, math.ceil((f1 - f0) / _FRAME_BATCH)))
+        max_pending = max(workers, _MAX_FRAMES_IN_FLIGHT // _FRAME_BATCH)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_frame_worker,
+                                 initargs=(timeline_data, self.settings())) as pool:
+            pending = deque()
+            for start in range(f0, f1, _FRAME_BATCH):
+                pending.append(pool.submit(_render_frames, start, min(start + _FRAME_BATCH, f1)))
+                # Futures are written strictly in submission order
+                if len(pending) >= max_pending:
+                    pipe.write(pending.popleft().result())
+            while pending:
+                pipe.write(pending.popleft().result())
+
+    def _build_clip(self, obj, opened, with_audio=True):
+        from moviepy.editor import VideoFileClip, AudioFileClip, ImageClip, ColorClip, TextClip
+
+        kind = obj.asset_type
+        meta = obj.meta or {}
+        if kind == AssetType.VIDEO:
+            clip = VideoFileClip(obj.asset_path, audio=with_audio)
+            opened.append(clip)
+            if self._hw_decoder:
+                # Re-open the frame pipe through the GPU decoder
+                clip.reader.__class__ = _hw_decode_reader()
+                clip.reader.hwaccel = self._hw_decoder
+                clip.reader.initialize()
+                clip.reader.pos = 1
+                clip.reader.lastread = clip.reader.read_frame()
+        elif kind == AssetType.AUDIO:
+            clip = AudioFileClip(obj.asset_path)
+            opened.append(clip)
+            if obj.duration:
+                clip = clip.subclip(0, min(obj.duration, clip.duration))
+            volume = meta.get("volume")
+            if volume is not None:
+                clip = clip.volumex(float(volume))
+            return clip.set_start(obj.start_time)
+        elif kind == AssetType.IMAGE:
+            clip = ImageClip(obj.asset_path)
+        elif kind == AssetType.SHAPE:
+            size = meta.get("size") or [self.width, self.height]
+            clip = ColorClip(size=(int(size[0]), int(size[1])), color=tuple(meta.get("color", (0, 0, 0))))
+        elif kind == AssetType.TEXT:
+            try:
+                clip = TextClip(str(meta.get("text", "")), fontsize=int(meta.get("font_size", 48)), color=meta.get("color", "white"))
+            except Exception as e:
+                # TextClip needs ImageMagick; skip the layer rather than the whole render
+                logger.warning(f"Skipping text layer: {e}")
+                return None
+        else:
+            return None
+
+        if obj.duration:
+            if kind == AssetType.VIDEO:
+                clip = clip.subclip(0, min(obj.duration, clip.duration))
+            else:
+                clip = clip.set_duration(obj.duration)
+        elif clip.duration is None:
+            return None
+
+        (sx, sy) = obj.scale
+        if (sx, sy) != (1.0, 1.0):
+            clip = _resize(clip, (max(1, int(clip.w * sx)), max(1, int(clip.h * sy))))
+        if obj.rotation:
+            clip = clip.rotate(obj.rotation)
+        if obj.opacity < 1.0:
+            clip = clip.set_opacity(obj.opacity)
+        return clip.set_position(tuple(obj.position)).set_start(obj.start_time)
+
+
+def _scene_list(timeline_data):
+    if isinstance(timeline_data, SceneList):
+        return timeline_data
+    sl = SceneList.deserialize(timeline_data)
+    sl.sort()
+    return sl
+
+
+def _audio_args(audio):
+    """FFmpeg arguments adding the mixed audio from _write_audio (if any) to a video-only input 0."""
+    if not audio or not audio[0]:
+        return []
+    args = []
+    for path in audio[0]:
+        args += ["-i", path]
+    return args + ["-map", "0:v"] + audio[1] + ["-c:a", "aac", "-shortest"]
+
+
+def _close_all(clips):
+    for clip in clips:
+        try:
+            clip.close()
+        except Exception:
+            pass
+
+
+# Per-process composite used by the parallel frame workers: (video, fps)
+_WORKER_STATE = None
+
+def _init_frame_worker(timeline_data, settings):
+    global _WORKER_STATE
+    renderer = TimelineRenderer(**settings)
+    video = renderer.compose(timeline_data, [], with_audio=False)[0]
+    _WORKER_STATE = (video, renderer.fps)
+
+def _frame_bytes(video, t):
+    import numpy as np
+    return np.ascontiguousarray(video.get_frame(t), dtype=np.uint8).tobytes()
+
+def _render_frames(start, stop):
+    """Returns frames [start, stop) as packed RGB24 bytes."""
+    video, fps = _WORKER_STATE
+    return b"".join(_frame_bytes(video, i / fps) for i in range(start, stop))
+
+
+def _render_job(timeline_data, out_path, settings, use_cache):
+    cache = RenderCache() if use_cache else None
+    return TimelineRenderer(**settings).render_timeline(timeline_data, out_path, cache)
+
+
+def render_in_worker(timeline_data, out_path, use_cache=False, **settings):
+    """
+    Renders in a separate (spawned) process so composition and encoding never
+    hold the engine's GIL. Blocks until done; returns the output path or raises.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(_render_job, timeline_data, out_path, settings, use_cache).result()
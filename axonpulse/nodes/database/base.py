@@ -30,6 +30,8 @@ class BaseSQLNode(SuperNode):
     """
     version = "2.1.0"
     required_providers = ["DATABASE"]
+    # Subclasses that share one connection across threads turn this off
+    sqlite_check_same_thread = True
     
     def __init__(self, node_id, name, bridge):
         super().__init__(node_id, name, bridge)
@@ -75,7 +77,7 @@ class BaseSQLNode(SuperNode):
         conn = None
         
         if db_type == "sqlite":
-            conn = sqlite3.connect(config.get("path", "data.db"))
+            conn = sqlite3.connect(config.get("path", "data.db"), check_same_thread=self.sqlite_check_same_thread)
             # Enable dictionary access for rows
             conn.row_factory = sqlite3.Row
         elif db_type == "mysql":
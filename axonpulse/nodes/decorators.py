@@ -14,8 +14,47 @@ def _py_type_to_axon(py_type) -> DataType:
     if py_type == dict: return DataType.DICT
     return DataType.ANY
 
+def _analyze_signature(func, outputs):
+    """
+    Derives everything a DecoratedNode needs from its function once:
+    (sig, input_params, input_mapping, property_defaults, input_schema, output_schema).
+    """
+    sig = inspect.signature(func)
+    input_params = []
+    input_mapping = {} # sanitized -> original
+    property_defaults = {}
+
+    for p_name, param in sig.parameters.items():
+        if p_name in ["_bridge", "_node", "_node_id", "kwargs"] or p_name.startswith("_"):
+            continue
+
+        # Map underscores back to spaces and TitleCase the name (The Mandate)
+        original_name = p_name.replace("_", " ").title().strip()
+        input_params.append(p_name)
+        input_mapping[p_name] = original_name
+
+        if param.default != inspect.Parameter.empty:
+            property_defaults[p_name] = param.default
+
+    # Build Inputs
+    inputs = {"Flow": DataType.FLOW}
+    for name in input_params:
+        inputs[input_mapping[name]] = _py_type_to_axon(sig.parameters[name].annotation)
+
+    # Build Outputs
+    outputs_schema = {"Flow": DataType.FLOW}
+    if isinstance(outputs, list):
+        for port in outputs:
+            outputs_schema[port] = DataType.ANY
+    else:
+        outputs_schema["Result"] = _py_type_to_axon(sig.return_annotation)
+
+    return sig, input_params, input_mapping, property_defaults, inputs, outputs_schema
+
 class DecoratedNode(SuperNode):
     """Dynamic wrapper for functions decorated with @axon_node."""
+    _func_spec = None # Set per generated class by @axon_node
+
     def __init__(self, node_id, name, bridge, func, category, version, outputs=None, is_native=True, is_async=False):
         self.func = func
         self.category = category
@@ -24,23 +63,9 @@ class DecoratedNode(SuperNode):
         self.is_native = is_native
         self.is_async = is_async
         
-        # Analyze function signature for inputs and properties
-        self.sig = inspect.signature(func)
-        self.input_params = []
-        self.input_mapping = {} # sanitized -> original
-        self.property_defaults = {}
-        
-        for p_name, param in self.sig.parameters.items():
-            if p_name in ["_bridge", "_node", "_node_id", "kwargs"] or p_name.startswith("_"):
-                continue
-            
-            # Map underscores back to spaces and TitleCase the name (The Mandate)
-            original_name = p_name.replace("_", " ").title().strip()
-            self.input_params.append(p_name)
-            self.input_mapping[p_name] = original_name
-            
-            if param.default != inspect.Parameter.empty:
-                self.property_defaults[p_name] = param.default
+        # Signature analysis is shared by all instances of a generated class
+        self._spec = self._func_spec or _analyze_signature(func, self.custom_outputs)
+        self.sig, self.input_params, self.input_mapping, self.property_defaults = self._spec[:4]
 
         super().__init__(node_id, name, bridge)
         # Restore execution flags after SuperNode/BaseNode init
@@ -48,25 +73,10 @@ class DecoratedNode(SuperNode):
         self.is_async = is_async
 
     def define_schema(self):
-        # Build Inputs
-        inputs = {"Flow": DataType.FLOW}
-        for name in self.input_params:
-            param = self.sig.parameters[name]
-            original_name = self.input_mapping[name]
-            inputs[original_name] = _py_type_to_axon(param.annotation)
-        self.input_schema = inputs
-
-        # Build Outputs
-        outputs = {"Flow": DataType.FLOW}
-        ret_annotation = self.sig.return_annotation
-        
-        if isinstance(self.custom_outputs, list):
-            for port in self.custom_outputs:
-                outputs[port] = DataType.ANY
-        else:
-            outputs["Result"] = _py_type_to_axon(ret_annotation)
-        
-        self.output_schema = outputs
+        # Generated classes carry frozen class-level schemas; only ad-hoc instances build their own
+        if self.INPUT_SCHEMA is None:
+            self.input_schema = dict(self._spec[4])
+            self.output_schema = dict(self._spec[5])
 
         # Initialize properties
         for name, value in self.property_defaults.items():
@@ -114,9 +124,8 @@ class DecoratedNode(SuperNode):
                 return result
 
             if isinstance(result, dict) and len(self.custom_outputs) > 1:
-                for k, v in result.items():
-                    if k in self.output_schema:
-                        self.set_output(k, v)
+                # One batched publish instead of a bridge write per port
+                self.set_outputs({k: v for k, v in result.items() if k in self.output_schema})
             elif len(self.custom_outputs) == 1:
                 # If there's only one output (excluding Flow), set it
                 port = self.custom_outputs[0]
@@ -163,10 +172,15 @@ def axon_node(category: str, version: str = "1.0.0", outputs: List[str] = None,
         allow_dynamic_in = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values())
         allow_dynamic_out = (outputs is not None) or (sig.return_annotation == dict) or (sig.return_annotation == Any)
 
+        spec = _analyze_signature(func, outputs or ["Result"])
+
         class DynamicNode(DecoratedNode):
             allow_dynamic_inputs = allow_dynamic_in
             allow_dynamic_outputs = allow_dynamic_out
             node_label = label # [FIX] Ensure metadata is available on class
+            _func_spec = spec
+            INPUT_SCHEMA = spec[4]
+            OUTPUT_SCHEMA = spec[5]
 
             def __init__(self, node_id, name, bridge):
                 super().__init__(node_id, name, bridge, func, category, version, outputs, is_native, is_async)
@@ -1,6 +1,5 @@
 import os
 import threading
-import time
 from axonpulse.core.types import DataType
 from axonpulse.nodes.registry import NodeRegistry
 from axonpulse.nodes.lib.provider_node import ProviderNode
@@ -32,6 +31,7 @@ class FileProviderNode(ProviderNode):
         self._file_handle = None
         self._stop_event = None
         self._listener_thread = None
+        self._hijack_queue = None
         self.properties["File Path"] = ""
         self.properties["Mode"] = "r"
 
@@ -63,6 +63,7 @@ class FileProviderNode(ProviderNode):
             import threading
             self._stop_event = threading.Event()
             self._stop_event.clear()
+            self._hijack_queue = self.bridge.open_hijack_queue(self.node_id)
             self._listener_thread = threading.Thread(target=self._hijack_listener, daemon=True)
             self._listener_thread.start()
             
@@ -100,22 +101,24 @@ class FileProviderNode(ProviderNode):
     def _hijack_listener(self):
         """Background loop to process hijacking requests from other nodes."""
         logger.info(f"[{self.name}] Hijack Listener Started.")
+        hijack_queue = self._hijack_queue
         while self._stop_event and not self._stop_event.is_set():
-            req = self.bridge.get(f"{self.node_id}_HijackRequest")
+            # Blocks until a request arrives; the timeout keeps shutdown responsive
+            req = self.next_hijack_request(hijack_queue, timeout=1.0)
             if req:
-                # Consume immediately to prevent double-processing
-                self.bridge.set(f"{self.node_id}_HijackRequest", None, self.name)
-                
                 func = req.get("func")
                 data = req.get("data", {})
                 req_id = req.get("id")
                 
-                result = self.handle_hijack(func, data)
+                try:
+                    reply = {"id": req_id, "result": self.handle_hijack(func, data)}
+                except Exception as e:
+                    logger.error(f"[{self.name}] Hijack handler failed: {e}")
+                    reply = {"id": req_id, "error": str(e) or type(e).__name__}
                 
-                # Respond
-                self.bridge.set(f"{self.node_id}_HijackResponse", {"id": req_id, "result": result}, self.name)
-            
-            time.sleep(0.01) # Low latency polling
+                # Respond on the caller's reply key (file ops stay serial: they share one handle)
+                reply_to = req.get("reply_to") or f"{self.node_id}_HijackResponse"
+                self.bridge.set(reply_to, reply, self.name)
         logger.info(f"[{self.name}] Hijack Listener Stopped.")
 
     def handle_hijack(self, func, data):
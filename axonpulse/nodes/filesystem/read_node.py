@@ -97,6 +97,8 @@ Outputs:
         _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
     except Exception as e:
         _node.logger.error(f'Read Error: {e}')
+        # Never pass on raw content from a failed read (e.g. ciphertext after a failed decrypt hijack)
+        data = None
         _bridge.set(f'{_node_id}_ActivePorts', ['Error Flow'], _node.name)
     finally:
         pass
@@ -1,4 +1,6 @@
+import queue
 from axonpulse.core.super_node import SuperNode
+from axonpulse.core.constants import HIJACK_POLL_INTERVAL
 from axonpulse.core.types import DataType
 from axonpulse.nodes.registry import NodeRegistry
 
@@ -89,6 +91,33 @@ class ProviderNode(SuperNode):
         """Cleanup logic before final flow out."""
         self.bridge.unregister_super_functions(self.node_id)
 
+    def next_hijack_request(self, hijack_queue, timeout=1.0):
+        """
+        Blocks for the next hijack request, or returns None after timeout.
+        Reads hijack_queue (from bridge.open_hijack_queue) when there is one,
+        else consumes the legacy {node_id}_HijackRequest key.
+        A dead queue is terminal: it sets the provider's _stop_event (or re-raises
+        when there is none) so the listener loop exits instead of spinning.
+        """
+        if hijack_queue is not None:
+            try:
+                return hijack_queue.get(timeout=timeout)
+            except queue.Empty:
+                return None
+            except (BrokenPipeError, EOFError, ConnectionResetError) as e:
+                stop_event = getattr(self, "_stop_event", None)
+                if stop_event is None:
+                    raise
+                self.logger.warning(f"Hijack queue closed ({type(e).__name__}); stopping hijack listener.")
+                stop_event.set()
+                return None
+        req_key = f"{self.node_id}_HijackRequest"
+        req = self.bridge.wait_for(req_key, timeout=timeout, poll_interval=HIJACK_POLL_INTERVAL)
+        if req:
+            # Consume immediately to prevent double-processing
+            self.bridge.set(req_key, None, self.name)
+        return req
+
     def terminate(self):
         self.cleanup_provider_context()
         super().terminate()
\ No newline at end of file
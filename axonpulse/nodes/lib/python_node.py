@@ -5,9 +5,20 @@ import sys
 import os
 import subprocess
 import threading
+import multiprocessing
+import traceback
 import tempfile
+import queue
+import collections
+import builtins
 from axonpulse.core.types import DataType
 
+# Sentinel for "error port wiring not yet resolved"
+_ERROR_PORT_UNSET = object()
+
+# Set once stdout/stderr have been switched to UTF-8 in this process
+_STDIO_UTF8_DONE = False
+
 @NodeRegistry.register("Python Script", "Logic/Scripting")
 class PythonNode(SuperNode):
     """
@@ -26,12 +37,18 @@ class PythonNode(SuperNode):
     - Requirements: New-line separated list of pip packages to ensure.
     - Use Current Env: Whether to use the system environment if no 'Env' is provided.
     
+    Properties:
+    - Isolation: 'Process' (default) runs services in a separate process that 
+      can be hard-terminated. 'Thread' runs them on a daemon thread inside the 
+      engine process, skipping process startup and bridge pickling; best for 
+      IO-bound services that mostly wait on 'Std In'.
+    
     Outputs:
     - Flow: Pulse triggered immediately (Service) or after completion (Sync).
     - Finished Flow: Pulse triggered after the script finishes execution.
     - Error Flow: Pulse triggered if the script crashes or fails to start.
-    - Std Out: Pulse triggered for each printed line from the script.
-    - Text Out: The string content of the printed line.
+    - Std Out: Pulse triggered when printed output is flushed (at most every 16 ms).
+    - Text Out: All text printed since the previous Std Out pulse.
     """
     version = "2.3.0"
     allow_dynamic_inputs = True
@@ -44,9 +61,14 @@ class PythonNode(SuperNode):
         self.properties["Script Body"] = "### Auto-Input Vars ###\nname = bridge.get(f'{node_id}_Name')\n### End of Auto-Input Vars ###\n\nprint(f'Hello {name}!')\nbridge.set(f'{node_id}_Message', f'Hello {name}!', 'PythonScript')"
         self.properties["Requirements"] = "" 
         self.properties["Use Current Env"] = True
+        self.properties["Isolation"] = "Process" # "Process" or "Thread"
         
         # Interactive State
         self.service_input_queue = None # Set at runtime if needed
+        self._service_stop_event = None # Set for thread-isolated services
+        
+        # (is_wired, port_name) for the local error port, resolved lazily
+        self._error_port_cache = _ERROR_PORT_UNSET
         
         # Runtime Cache
         # Shared across all instances to avoid re-checking in loops
@@ -143,21 +165,35 @@ class PythonNode(SuperNode):
 
         if is_service:
             # Async: Flow continues immediately, Finished fires later
-            # Use Process for Services so we can terminate them
-            import multiprocessing
-            from axonpulse.nodes.lib.python_node import run_python_service
-            
-            # Create a queue for Stdin injection
-            self.service_input_queue = multiprocessing.Queue()
+            isolation = str(self.properties.get("Isolation", "Process")).strip().lower()
             
-            p = multiprocessing.Process(
-                target=run_python_service,
-                args=(script_body, self.node_id, self.name, self.bridge, self.service_input_queue),
-                daemon=True,
-                name=f"Service-{self.name}"
-            )
-            self.process = p
-            p.start()
+            if isolation == "thread":
+                # In-process service: no spawn cost, no bridge pickling.
+                # Cancellation is cooperative via the input queue wrapper.
+                self._service_stop_event = threading.Event()
+                self.service_input_queue = _CancellableQueue(self._service_stop_event)
+                
+                t = threading.Thread(
+                    target=run_python_service_inline,
+                    args=(script_body, self.node_id, self.name, self.bridge, self.service_input_queue),
+                    daemon=True,
+                    name=f"Service-{self.name}"
+                )
+                self.process = t
+                t.start()
+            else:
+                # Use Process for Services so we can terminate them
+                # Create a queue for Stdin injection
+                self.service_input_queue = multiprocessing.Queue()
+                
+                p = multiprocessing.Process(
+                    target=run_python_service,
+                    args=(script_body, self.node_id, self.name, self.bridge, self.service_input_queue),
+                    daemon=True,
+                    name=f"Service-{self.name}"
+                )
+                self.process = p
+                p.start()
             
             # Notify UI
             self.bridge.set(f"{self.node_id}_IsServiceRunning", True, self.name)
@@ -204,18 +240,22 @@ class PythonNode(SuperNode):
 
     def _run_script_task(self, script_body, is_async):
         # [Fix Encoding] Force UTF-8 for this process / thread execution
-        if sys.platform == "win32":
+        global _STDIO_UTF8_DONE
+        if IS_NT and not _STDIO_UTF8_DONE:
             try:
                 if sys.stdout.encoding.lower() != 'utf-8':
                     sys.stdout.reconfigure(encoding='utf-8')
                 if sys.stderr.encoding.lower() != 'utf-8':
                     sys.stderr.reconfigure(encoding='utf-8')
+                _STDIO_UTF8_DONE = True
             except Exception as e:
                 print(f"[WARN] Failed to force UTF-8: {e}")
         
         try:
-            # Define local scope for the script
-            local_scope = {
+            # Single scope used as both globals and locals, so helper
+            # functions defined by the script resolve names via LOAD_GLOBAL
+            scope = {
+                "__builtins__": builtins,
                 "bridge": self.bridge,
                 "node_id": self.node_id,
                 "name": self.name,
@@ -225,25 +265,18 @@ class PythonNode(SuperNode):
                 "sys": sys
             }
             
-            exec(script_body, {}, local_scope)
+            exec(script_body, scope)
             
             # Fire Finished Flow (and Done for tracing)
             self.bridge.set(f"{self.node_id}_ActivePorts", ["Finished Flow", "Flow"], self.name)
             
             return True
         except Exception as e:
-            import traceback
             error_msg = str(e)
             traceback.print_exc()
             
             # 1. Check for local Error Flow
-            is_wired = False
-            error_port = "Error Flow"
-            for p_name in ["Error Flow", "Error", "Panic"]:
-                if self.bridge.get(f"{self.node_id}_{p_name}_Wired"):
-                    is_wired = True
-                    error_port = p_name
-                    break
+            is_wired, error_port = self._resolve_error_port()
             
             if is_wired:
                 self.bridge.set(f"{self.node_id}_ActivePorts", [error_port], self.name)
@@ -252,6 +285,22 @@ class PythonNode(SuperNode):
             
             return False
 
+    def _resolve_error_port(self):
+        """Returns the cached (is_wired, port_name) tuple for the local error port."""
+        cached = self._error_port_cache
+        if cached is _ERROR_PORT_UNSET:
+            cached = (False, "Error Flow")
+            for p_name in ("Error Flow", "Error", "Panic"):
+                if self.bridge.get(f"{self.node_id}_{p_name}_Wired"):
+                    cached = (True, p_name)
+                    break
+            self._error_port_cache = cached
+        return cached
+
+    def invalidate_error_port_cache(self):
+        """Forces the error port wiring to be re-resolved (call on wire changes)."""
+        self._error_port_cache = _ERROR_PORT_UNSET
+
     def terminate(self):
         """
         Custom termination for Python Service.
@@ -261,48 +310,145 @@ class PythonNode(SuperNode):
             try:
                 self.service_input_queue.close()
             except: pass
+        
+        # Thread-isolated services cannot be killed; signal and detach
+        if isinstance(self.process, threading.Thread):
+            if self._service_stop_event:
+                self._service_stop_event.set()
+            self.process.join(timeout=1.0)
+            if self.process.is_alive():
+                self.logger.warning("Service thread did not stop within timeout; detaching.")
+            self.process = None
             
         # Standard Process Cleanup
         super().terminate()
 
 
+class _ServiceCancelled(SystemExit):
+    """Raised inside a thread-isolated service when the node is terminated."""
+    pass
+
+
+class _CancellableQueue:
+    """
+    In-process stand-in for the multiprocessing Queue used by thread-isolated 
+    services. Blocking reads wake up when the stop event is set.
+    """
+    def __init__(self, stop_event):
+        self._queue = queue.Queue()
+        self._stop_event = stop_event
+
+    def put(self, item):
+        self._queue.put(item)
+
+    def get(self):
+        while True:
+            if self._stop_event.is_set():
+                raise _ServiceCancelled()
+            try:
+                return self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    def close(self):
+        self._stop_event.set()
+
+
+class _StdOutBatcher:
+    """
+    Coalesces service prints into periodic bridge updates. Each flush 
+    publishes the accumulated text as a single 'Text Out' + 'Std Out' pulse, 
+    so print-heavy loops cost one IPC round-trip per interval, not per line.
+    """
+    FLUSH_INTERVAL = 0.016 # seconds
+
+    def __init__(self, bridge, node_id, name):
+        self.bridge = bridge
+        self.node_id = node_id
+        self.name = name
+        self._k_text = f"{node_id}_Text Out"
+        self._k_active = f"{node_id}_ActivePorts"
+        self._buf = collections.deque()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name=f"StdOut-{name}")
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def write(self, text):
+        with self._lock:
+            self._buf.append(text)
+
+    def flush(self):
+        with self._lock:
+            if not self._buf:
+                return
+            text = "".join(self._buf)
+            self._buf.clear()
+        # One write, so the pulse can never be seen without its text
+        self.bridge.set_batch({self._k_text: text, self._k_active: ["Std Out"]}, self.name)
+
+    def close(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.FLUSH_INTERVAL):
+            try:
+                self.flush()
+            except Exception:
+                # Bridge went away (engine shutdown); stop quietly
+                return
+
+
 # Static worker for Service Processes (Avoids pickling 'self')
 def run_python_service(script_body, node_id, name, bridge, input_queue=None):
-    import os
-    import sys
-    import traceback
-    
     # [Fix Encoding] Force UTF-8 for this process
     if sys.platform == "win32":
         sys.stdout.reconfigure(encoding='utf-8')
         sys.stderr.reconfigure(encoding='utf-8')
     
+    run_python_service_inline(script_body, node_id, name, bridge, input_queue)
+
+def run_python_service_inline(script_body, node_id, name, bridge, input_queue=None):
+    """Service body shared by process and thread isolation modes."""
+    out = _StdOutBatcher(bridge, node_id, name).start()
     try:
-        local_scope = {
+        scope = {
+            "__builtins__": builtins,
             "bridge": bridge,
             "node_id": node_id,
             "name": name,
-            "print": lambda *args, **kwargs: _proxied_print(bridge, node_id, name, *args, **kwargs),
-            "input": lambda prompt="": _proxied_input(bridge, node_id, name, input_queue, prompt),
+            "print": lambda *args, **kwargs: _proxied_print(out, *args, **kwargs),
+            "input": lambda prompt="": _proxied_input(out, input_queue, prompt),
             "os": os,
             "sys": sys
         }
 
-        exec(script_body, {}, local_scope)
+        exec(script_body, scope)
         
         # When service finishes naturally
         bridge.set(f"{node_id}_ActivePorts", ["Finished Flow"], name)
         
+    except _ServiceCancelled:
+        pass
     except Exception as e:
         print(f"[SERVICE ERROR] {name}: {e}")
         traceback.print_exc()
     finally:
+        try:
+            out.close()
+        except Exception:
+            pass
         bridge.set(f"{node_id}_IsServiceRunning", False, name)
         print(f"[SERVICE_STOP] {node_id}", flush=True)
 
-def _proxied_print(bridge, node_id, name, *args, **kwargs):
+def _proxied_print(out, *args, **kwargs):
     # original print to stdout for logging
-    import builtins
     builtins.print(*args, **kwargs)
     
     # Construct string
@@ -310,14 +456,14 @@ def _proxied_print(bridge, node_id, name, *args, **kwargs):
     end = kwargs.get('end', '\n')
     text = sep.join(map(str, args)) + end
     
-    # Send to AxonPulse
-    bridge.set(f"{node_id}_Text Out", text, name)
-    bridge.set(f"{node_id}_ActivePorts", ["Std Out"], name)
+    # Queue for AxonPulse (flushed by the batcher thread)
+    out.write(text)
 
-def _proxied_input(bridge, node_id, name, input_queue, prompt=""):
-    import builtins
+def _proxied_input(out, input_queue, prompt=""):
     if prompt:
-        _proxied_print(bridge, node_id, name, prompt, end="")
+        _proxied_print(out, prompt, end="")
+    # Make sure the prompt reaches the UI before we block
+    out.flush()
         
     if input_queue:
         # Blocking wait for input from "Std In" trigger
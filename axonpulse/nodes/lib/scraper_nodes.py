@@ -72,6 +72,37 @@ Outputs:
     return results
 
 
+_CSV_SPECIALS = (',', '"', '\r', '\n')
+
+def _csv_escape(value):
+    """Minimal-quoting cell formatter matching csv.QUOTE_MINIMAL output."""
+    if value is None:
+        return ''
+    text = value if isinstance(value, str) else str(value)
+    for ch in _CSV_SPECIALS:
+        if ch in text:
+            return '"' + text.replace('"', '""') + '"'
+    return text
+
+def _dict_rows_to_csv(rows):
+    """
+    Builds CSV text for a list of dicts with a single join. Returns None when 
+    the rows need csv.DictWriter semantics (mixed row types, unknown keys, or 
+    single-column output where empty cells must be quoted).
+    """
+    fieldnames = list(rows[0].keys())
+    if len(fieldnames) < 2:
+        return None
+    allowed = set(fieldnames)
+    for row in rows:
+        if not isinstance(row, dict) or not row.keys() <= allowed:
+            return None
+    lines = [','.join(map(_csv_escape, fieldnames))]
+    lines.extend(','.join([_csv_escape(row.get(f, '')) for f in fieldnames]) for row in rows)
+    lines.append('')
+    return '\r\n'.join(lines)
+
+
 @axon_node(category="Data/JSON", version="2.3.0", node_label="JSON CSV Converter")
 def JsonCsvNode(Data: Any = None, _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Converts between JSON (list of dicts) and CSV string formats.
@@ -104,21 +135,23 @@ Outputs:
                 _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
             else:
                 pass
-            output = io.StringIO()
             first = data[0]
-            if isinstance(first, dict):
-                fieldnames = first.keys()
-                writer = csv.DictWriter(output, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
-            elif isinstance(first, list):
-                writer = csv.writer(output)
-                writer.writerows(data)
-            else:
-                writer = csv.writer(output)
-                for row in data:
-                    writer.writerow([row])
-            result = output.getvalue()
+            result = _dict_rows_to_csv(data) if isinstance(first, dict) else None
+            if result is None:
+                output = io.StringIO()
+                if isinstance(first, dict):
+                    fieldnames = first.keys()
+                    writer = csv.DictWriter(output, fieldnames=fieldnames)
+                    writer.writeheader()
+                    writer.writerows(data)
+                elif isinstance(first, list):
+                    writer = csv.writer(output)
+                    writer.writerows(data)
+                else:
+                    writer = csv.writer(output)
+                    for row in data:
+                        writer.writerow([row])
+                result = output.getvalue()
             _node.logger.info(f'Converted {len(data)} rows to CSV.')
         else:
             if not isinstance(data, str):
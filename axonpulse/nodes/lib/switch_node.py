@@ -27,28 +27,33 @@ Outputs:
 - [Dynamic Cases]: Custom ports where the port name defines the matching value."""
     val_str = str(Value) if Value is not None else str(_node.properties.get('Value', ''))
     val_str = val_str.strip()
-    val_lower = val_str.lower()
-    chosen_port = 'Default'
-    for port_name in self.output_schema.keys():
-        if port_name in ['Default', 'Flow']:
-            continue
-        else:
-            pass
-        if val_str == port_name or val_lower == port_name.lower():
-            chosen_port = port_name
-            break
-        else:
-            pass
+    ports = tuple(_node.output_types)
+    cached = getattr(_node, '_switch_dispatch', None)
+    if cached is None or cached[0] != ports:
+        cached = (ports, _build_switch_dispatch(ports))
+        _node._switch_dispatch = cached
+    dispatch = cached[1]
+    chosen_port = dispatch.get(val_str.lower())
+    if chosen_port is None:
         try:
-            if float(val_str) == float(port_name):
-                chosen_port = port_name
-                break
-            else:
-                pass
+            chosen_port = dispatch.get(float(val_str))
         except (ValueError, TypeError):
             pass
-        finally:
-            pass
+    if chosen_port is None:
+        chosen_port = 'Default'
     _node.logger.info(f"Switching on '{val_str}' -> {chosen_port}")
     _bridge.set(f'{_node_id}_ActivePorts', [chosen_port], _node.name)
     return True
+
+def _build_switch_dispatch(port_names):
+    """Maps lowercased case names (and their numeric value, if any) to ports. First port wins."""
+    dispatch = {}
+    for port_name in port_names:
+        if port_name in ('Default', 'Flow'):
+            continue
+        dispatch.setdefault(port_name.lower(), port_name)
+        try:
+            dispatch.setdefault(float(port_name), port_name)
+        except (ValueError, TypeError):
+            pass
+    return dispatch
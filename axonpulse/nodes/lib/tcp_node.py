@@ -1,9 +1,19 @@
 import socket
 
+import errno
+
+import os
+
 import threading
 
+import asyncio
+
+import queue
+
 import time
 
+from concurrent.futures import ThreadPoolExecutor
+
 from axonpulse.core.super_node import SuperNode
 
 from axonpulse.nodes.registry import NodeRegistry
@@ -18,10 +28,118 @@ from axonpulse.core.types import DataType, TypeCaster
 
 from axonpulse.nodes.decorators import axon_node
 
-_TCP_INSTANCES = {}
+from axonpulse.core.constants import IS_WINDOWS, IS_LINUX, ACTIVE_FLOW
+
+# uvloop (libuv) speeds up the accept path; optional, not available on Windows
+uvloop = None
+if not IS_WINDOWS:
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+# Active connections live in a fixed slot array. Each provider owns one slot
+# for its lifetime; consumer nodes cache the slot index and read the socket
+# with a list index instead of a dict lookup per send/receive.
+_TCP_SLOT_COUNT = 256
+_TCP_SLOTS = [None] * _TCP_SLOT_COUNT # slot -> socket
+_TCP_SLOT_OWNERS = [None] * _TCP_SLOT_COUNT # slot -> provider id
+_TCP_SLOT_INDEX = {} # provider id -> slot
+_TCP_FREE_SLOTS = list(range(_TCP_SLOT_COUNT - 1, -1, -1))
+_TCP_SLOT_LOCK = threading.Lock()
+
+# Shared event loop that services every TCP Server Provider's accept loop.
+# One thread for the whole process instead of one per listening provider.
+_EVENT_LOOP = None
+_EVENT_LOOP_PID = None
+_EVENT_LOOP_LOCK = threading.Lock()
+
+# Bridge writes for connection events run on this executor so slow bridge IPC
+# never stalls the shared accept loop. A single reused worker keeps events in
+# accept order. Created (per process) together with the event loop.
+_TCP_EXECUTOR = None
+
+_SOCKET_BUFFER_SIZE = 262144 # 256 KiB send/receive buffers
+_SOCKET_TIMEOUT = 2.0 # seconds; set once per connection, not per receive
+
+# accept() errors that leave the listening socket usable
+_ACCEPT_RETRY_ERRNOS = frozenset(
+    getattr(errno, name) for name in ('EINTR', 'ECONNABORTED', 'EAGAIN', 'EWOULDBLOCK', 'EPROTO')
+    if hasattr(errno, name)
+)
+_ACCEPT_BACKOFF_ERRNOS = frozenset(
+    getattr(errno, name) for name in ('EMFILE', 'ENFILE', 'ENOBUFS', 'ENOMEM')
+    if hasattr(errno, name)
+)
+_ACCEPT_BACKOFF = 0.1 # seconds
+
+# Reusable receive buffers for TCP Receive (avoids a fresh allocation per recv)
+_RECV_BUF_POOL = queue.SimpleQueue()
+# Frames at least this large are received into their own buffer and handed
+# downstream as-is instead of being copied out of a pooled one.
+_RECV_HANDOFF_MIN = 65536
 
 def get_tcp(provider_id):
-    return _TCP_INSTANCES.get(provider_id)
+    slot = _TCP_SLOT_INDEX.get(provider_id)
+    return _TCP_SLOTS[slot] if slot is not None else None
+
+def _acquire_tcp_slot(provider_id):
+    with _TCP_SLOT_LOCK:
+        slot = _TCP_SLOT_INDEX.get(provider_id)
+        if slot is None:
+            if not _TCP_FREE_SLOTS:
+                raise RuntimeError(f'No free TCP provider slots (max {_TCP_SLOT_COUNT}).')
+            slot = _TCP_FREE_SLOTS.pop()
+            _TCP_SLOT_OWNERS[slot] = provider_id
+            _TCP_SLOT_INDEX[provider_id] = slot
+        return slot
+
+def _release_tcp_slot(provider_id):
+    with _TCP_SLOT_LOCK:
+        slot = _TCP_SLOT_INDEX.pop(provider_id, None)
+        if slot is not None:
+            _TCP_SLOTS[slot] = None
+            _TCP_SLOT_OWNERS[slot] = None
+            _TCP_FREE_SLOTS.append(slot)
+
+def _resolve_tcp(node, provider_id):
+    """Socket lookup for Send/Receive nodes; the provider's slot is cached on the node."""
+    slot = getattr(node, '_tcp_slot', None)
+    if slot is None or _TCP_SLOT_OWNERS[slot] != provider_id:
+        slot = _TCP_SLOT_INDEX.get(provider_id)
+        node._tcp_slot = slot
+        if slot is None:
+            return None
+    return _TCP_SLOTS[slot]
+
+def _tune_socket(sock):
+    """Disables Nagle, enables keepalive and enlarges kernel buffers for low-latency sends."""
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+    except OSError:
+        pass
+
+def _get_event_loop():
+    """
+    Returns the shared TCP event loop, starting its thread on first use.
+    A forked worker inherits the loop object but not its thread, so the loop 
+    is recreated when the current process is not the one that started it.
+    """
+    global _EVENT_LOOP, _EVENT_LOOP_PID, _TCP_EXECUTOR
+    pid = os.getpid()
+    if _EVENT_LOOP is None or _EVENT_LOOP_PID != pid:
+        with _EVENT_LOOP_LOCK:
+            if _EVENT_LOOP is None or _EVENT_LOOP_PID != pid:
+                # Only this loop uses uvloop; the global asyncio policy is left alone
+                loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, daemon=True, name='TCP-EventLoop').start()
+                _TCP_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tcp-accept')
+                _EVENT_LOOP = loop
+                _EVENT_LOOP_PID = pid
+    return _EVENT_LOOP
 
 @NodeRegistry.register('TCP Server Provider', 'Network/TCP')
 class TCPServerProvider(ProviderNode):
@@ -50,6 +168,10 @@ class TCPServerProvider(ProviderNode):
         self.properties['Port'] = 6000
         self._socket = None
         self._running = False
+        self._accept_future = None
+        self._accept_done = None
+        self._slot = None
+        self._k_client_info = f'{node_id}_Client Info'
 
     def define_schema(self):
         super().define_schema()
@@ -64,46 +186,97 @@ class TCPServerProvider(ProviderNode):
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            _tune_socket(self._socket)
             self._socket.bind((host, port))
             self._socket.listen(5)
+            self._socket.setblocking(False)
+            self._slot = _acquire_tcp_slot(self.node_id)
             self._running = True
+            self.logger.info(f'TCP Server listening on {host}:{port}...')
 
-            def listen_loop():
-                self.logger.info(f'TCP Server listening on {host}:{port}...')
-                while self._running:
-                    try:
-                        (conn, addr) = self._socket.accept()
-                        _TCP_INSTANCES[self.node_id] = conn
-                        self.bridge.set(f'{self.node_id}_Client Info', str(addr), self.name)
-                        self.bridge.set(f'{self.node_id}_ActivePorts', ['On Connection'], self.name)
-                    except Exception as e:
-                        if self._running:
-                            self.logger.error(f'TCP Accept Error: {e}')
-                        break
-            threading.Thread(target=listen_loop, daemon=True).start()
+            # Accept on the shared event loop instead of a dedicated thread
+            self._accept_done = threading.Event()
+            self._accept_future = asyncio.run_coroutine_threadsafe(
+                self._accept_loop(self._socket, self._accept_done), _get_event_loop()
+            )
             return super().start_scope(**kwargs)
         except Exception as e:
             self.logger.error(f'Failed to start TCP Server: {e}')
             return False
 
-    def stop_scope(self, **kwargs):
-        self._running = False
-        if self._socket:
+    async def _accept_loop(self, sock, done):
+        loop = asyncio.get_running_loop()
+        try:
+            while self._running:
+                try:
+                    (conn, addr) = await loop.sock_accept(sock)
+                except asyncio.CancelledError:
+                    raise
+                except OSError as e:
+                    if e.errno in _ACCEPT_RETRY_ERRNOS:
+                        continue
+                    if e.errno in _ACCEPT_BACKOFF_ERRNOS and self._running:
+                        # Out of descriptors/buffers: keep listening and let the
+                        # pending connection wait in the backlog until FDs free up.
+                        self.logger.warning(f'TCP Accept deferred: {e}')
+                        await asyncio.sleep(_ACCEPT_BACKOFF)
+                        continue
+                    if self._running:
+                        self.logger.error(f'TCP Accept Error: {e}')
+                    break
+                except Exception as e:
+                    if self._running:
+                        self.logger.error(f'TCP Accept Error: {e}')
+                    break
+                # Child nodes use the socket synchronously from worker threads.
+                # This is the only mode change after accept; CPython's accept()
+                # already uses accept4(SOCK_CLOEXEC) where available.
+                conn.settimeout(_SOCKET_TIMEOUT)
+                if not IS_LINUX:
+                    # Linux copies these options from the listening socket
+                    _tune_socket(conn)
+                self._on_new_conn(conn, addr)
+        finally:
             try:
-                self._socket.close()
+                sock.close()
             except:
                 pass
-        return super().stop_scope(**kwargs)
+            done.set()
 
-    def cleanup_provider_context(self):
+    def _on_new_conn(self, conn, addr):
+        _TCP_SLOTS[self._slot] = conn
+        _TCP_EXECUTOR.submit(self._publish_connection, addr)
+
+    def _publish_connection(self, addr):
+        # One registry update per connection event
+        self.bridge.set_batch({
+            self._k_client_info: str(addr),
+            self._k_active: ['On Connection']
+        }, self.name)
+
+    def _stop_listening(self):
         self._running = False
-        if self._socket:
+        future, self._accept_future = self._accept_future, None
+        sock, self._socket = self._socket, None
+        if future is not None:
+            future.cancel()
+            # The accept loop closes the socket on the loop thread; wait briefly
+            # so the port is free for an immediate restart.
+            if self._accept_done is not None and self._accept_done.wait(1.0):
+                return
+        if sock:
             try:
-                self._socket.close()
+                sock.close()
             except:
                 pass
-        if self.node_id in _TCP_INSTANCES:
-            del _TCP_INSTANCES[self.node_id]
+
+    def stop_scope(self, **kwargs):
+        self._stop_listening()
+        return super().stop_scope(**kwargs)
+
+    def cleanup_provider_context(self):
+        self._stop_listening()
+        _release_tcp_slot(self.node_id)
         super().cleanup_provider_context()
 
 @NodeRegistry.register('TCP Client Provider', 'Network/TCP')
@@ -139,13 +312,16 @@ class TCPClientProvider(ProviderNode):
         port = int(kwargs.get('Port') or self.properties.get('Port', 6000))
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Buffer sizes must be set before connect to affect window scaling
+            _tune_socket(self._socket)
             self._socket.connect((host, port))
+            self._socket.settimeout(_SOCKET_TIMEOUT)
             self.logger.info(f'TCP Client connected to {host}:{port}')
-            _TCP_INSTANCES[self.node_id] = self._socket
+            _TCP_SLOTS[_acquire_tcp_slot(self.node_id)] = self._socket
             super().start_scope(**kwargs)
         except Exception as e:
             self.logger.error(f'TCP Client Connection Error: {e}')
-            self.bridge.set(f'{self.node_id}_ActivePorts', ['Error Flow'], self.name)
+            self.bridge.set(self._k_active, ['Error Flow'], self.name)
         return True
 
     def cleanup_provider_context(self):
@@ -154,69 +330,132 @@ class TCPClientProvider(ProviderNode):
                 self._socket.close()
             except:
                 pass
-        if self.node_id in _TCP_INSTANCES:
-            del _TCP_INSTANCES[self.node_id]
+        _release_tcp_slot(self.node_id)
         super().cleanup_provider_context()
 
+def _send_segments(sock, segments):
+    """Sends a list of chunks with scatter/gather I/O where supported, without concatenating."""
+    views = [memoryview(seg.encode('utf-8') if isinstance(seg, str) else seg).cast('B') for seg in segments]
+    if not hasattr(sock, 'sendmsg'):
+        sock.sendall(b''.join(views))
+        return
+    while views:
+        sent = sock.sendmsg(views)
+        # Drop fully-sent chunks and trim a partially-sent one
+        while views and sent >= len(views[0]):
+            sent -= len(views[0])
+            views.pop(0)
+        if views and sent:
+            views[0] = views[0][sent:]
+
 @axon_node(category="Network/TCP", version="2.3.0", node_label="TCP Send")
 def TCPSendNode(Body: Any, _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Sends data through an active TCP Provider context.
 
 Inputs:
 - Flow: Trigger send.
-- Body: Data to send (String or Bytes).
+- Body: Data to send (String, any bytes-like object such as a received frame, 
+  or a List of chunks sent without concatenation).
 
 Outputs:
 - Flow: Triggered after the data is sent."""
-    provider_id = self.get_provider_id('TCP Provider')
-    sock = get_tcp(provider_id)
+    provider_id = _node.get_provider_id('TCP Provider')
+    sock = _resolve_tcp(_node, provider_id)
     if not sock:
         _node.logger.error('No active TCP Provider instance found.')
         return
     else:
         pass
     data = Body if Body is not None else ''
-    if isinstance(data, str):
-        data = data.encode('utf-8')
-    else:
-        pass
+    kind = type(data)
+    if kind is str:
+        # Loops often resend the same text; reuse the last encoding
+        cached = getattr(_node, '_tcp_send_cache', None)
+        if cached is not None and cached[0] == data:
+            data = cached[1]
+        else:
+            encoded = data.encode('utf-8')
+            _node._tcp_send_cache = (data, encoded)
+            data = encoded
     try:
-        sock.sendall(data)
+        if kind is list or kind is tuple:
+            _send_segments(sock, data)
+        else:
+            sock.sendall(data)
     except Exception as e:
         _node.logger.error(f'TCP Send Error: {e}')
     finally:
         pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     return True
 
 
+def _recv_exact(sock, buf, size):
+    """Fills buf[:size] from the socket; returns the byte count (short only if the peer closed)."""
+    view = memoryview(buf)
+    got = 0
+    while got < size:
+        n = sock.recv_into(view[got:size], size - got)
+        if not n:
+            break
+        got += n
+    return got
+
 @axon_node(category="Network/TCP", version="2.3.0", node_label="TCP Receive", outputs=['Body'])
-def TCPReceiveNode(Buffer_Size: float = 4096, _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
+def TCPReceiveNode(Buffer_Size: float = 4096, Exact: bool = False, _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Receives data from an active TCP Provider context.
 
 Inputs:
 - Flow: Trigger receive.
 - Buffer Size: Max bytes to read (Default: 4096).
+- Exact: If True, keep reading until exactly 'Buffer Size' bytes arrive 
+  (one complete fixed-size frame per pulse).
 
 Outputs:
 - Flow: Pulse triggered after receiving.
-- Body: The received data."""
-    provider_id = self.get_provider_id('TCP Provider')
-    sock = get_tcp(provider_id)
+- Body: The received data (bytes; frames of 64 KiB or more arrive as a 
+  bytearray so they are not copied)."""
+    provider_id = _node.get_provider_id('TCP Provider')
+    sock = _resolve_tcp(_node, provider_id)
     if not sock:
         _node.logger.error('No active TCP Provider instance found.')
         return
     else:
         pass
     buf_size = int(kwargs.get('Buffer Size') or _node.properties.get('Buffer Size', 4096))
+    data = None
+    # The bridge keeps the written object in its local cache, so a view into a
+    # pooled buffer must never escape; large frames get a buffer they own instead.
+    handoff = buf_size >= _RECV_HANDOFF_MIN
+    buf = None
+    if handoff:
+        buf = bytearray(buf_size)
+    else:
+        try:
+            buf = _RECV_BUF_POOL.get_nowait()
+        except queue.Empty:
+            pass
+        if buf is None or len(buf) < buf_size:
+            buf = bytearray(buf_size)
     try:
-        sock.settimeout(2.0)
-        data = sock.recv(buf_size)
+        if Exact:
+            n = _recv_exact(sock, buf, buf_size)
+            if n < buf_size:
+                _node.logger.warning(f'TCP connection closed after {n} of {buf_size} bytes.')
+        else:
+            n = sock.recv_into(buf, buf_size)
+        if handoff:
+            if n < buf_size:
+                del buf[n:]
+            data = buf
+        else:
+            data = bytes(memoryview(buf)[:n])
     except socket.timeout:
         _node.logger.warning('TCP Receive timeout.')
     except Exception as e:
         _node.logger.error(f'TCP Receive Error: {e}')
     finally:
-        pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+        if not handoff:
+            _RECV_BUF_POOL.put(buf)
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     return data
@@ -1,6 +1,6 @@
 from axonpulse.core.super_node import SuperNode
 from axonpulse.nodes.registry import NodeRegistry
-from axonpulse.core.constants import IS_WINDOWS
+from axonpulse.core.constants import IS_WINDOWS, ACTIVE_FLOW
 from axonpulse.core.types import DataType
 from axonpulse.core.dependencies import DependencyManager
 
@@ -14,6 +14,16 @@ def ensure_toast():
         from win11toast import toast as _t; toast = _t; return True
     return False
 
+# Lazy Qt widgets for the fallback dialog: (QApplication, QInputDialog, QLineEdit)
+_QT = None
+
+def _get_qt():
+    global _QT
+    if _QT is None:
+        from PyQt6.QtWidgets import QApplication, QInputDialog, QLineEdit
+        _QT = (QApplication, QInputDialog, QLineEdit)
+    return _QT
+
 @NodeRegistry.register("Toast Input", "UI/Toasts")
 class ToastInputNode(SuperNode):
     """
@@ -33,36 +43,38 @@ class ToastInputNode(SuperNode):
     """
     version = "2.3.0"
 
+    INPUT_SCHEMA = {
+        "Flow": DataType.FLOW,
+        "Title": DataType.STRING,
+        "Message": DataType.STRING,
+        "Value": DataType.STRING
+    }
+    OUTPUT_SCHEMA = {
+        "Flow": DataType.FLOW,
+        "Text": DataType.STRING,
+        "OnClick": DataType.FLOW
+    }
+
     def __init__(self, node_id, name, bridge):
         super().__init__(node_id, name, bridge)
         self.is_native = True  # Must run in main process for reliable Windows Toast integration
+        self._k_text = f"{node_id}_Text"
         self.properties["Title"] = "AxonPulse Input"
         self.properties["Message"] = "Please enter data:"
         self.properties["Value"] = "Type here..."
-        self.define_schema()
         self.register_handlers()
 
     def define_schema(self):
-        self.input_schema = {
-            "Flow": DataType.FLOW,
-            "Title": DataType.STRING,
-            "Message": DataType.STRING,
-            "Value": DataType.STRING
-        }
-        self.output_schema = {
-            "Flow": DataType.FLOW,
-            "Text": DataType.STRING,
-            "OnClick": DataType.FLOW
-        }
+        pass # Ports come from INPUT_SCHEMA / OUTPUT_SCHEMA
 
     def register_handlers(self):
         self.register_handler("Flow", self.do_work)
 
     def do_work(self, Title=None, Message=None, Value=None, **kwargs):
         # Fallback to properties if inputs aren't provided
-        title_val = Title if Title is not None else self.properties.get("Title", self.properties.get("Title", ""))
-        message_val = Message if Message is not None else self.properties.get("Message", self.properties.get("Message", ""))
-        value_val = Value if Value is not None else self.properties.get("Value", self.properties.get("Value", ""))
+        title_val = Title if Title is not None else self.properties.get("Title", "")
+        message_val = Message if Message is not None else self.properties.get("Message", "")
+        value_val = Value if Value is not None else self.properties.get("Value", "")
         
         # Trim message to prevent Windows display failure (max 200 chars)
         if message_val and len(str(message_val)) > 200:
@@ -96,13 +108,13 @@ class ToastInputNode(SuperNode):
                 
                 if val is not None:
                     self.logger.info(f"Win Toast Received: {val}")
-                    self.bridge.set(f"{self.node_id}_Text", str(val), self.name)
-                    self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow", "OnClick"], self.name)
+                    self.bridge.set(self._k_text, str(val), self.name)
+                    self.bridge.set(self._k_active, ["Flow", "OnClick"], self.name)
                     return True
         except Exception as e:
             self.logger.error(f"Windows Toast Input Error: {e}")
             
-        self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+        self.bridge.set(self._k_active, ACTIVE_FLOW, self.name)
         return True
 
     def _execute_fallback_gui(self, Title, Message, DefaultValue):
@@ -110,7 +122,7 @@ class ToastInputNode(SuperNode):
         self.logger.info("Using PyQt Fallback for Input...")
         
         try:
-            from PyQt6.QtWidgets import QApplication, QInputDialog, QLineEdit
+            QApplication, QInputDialog, QLineEdit = _get_qt()
             
             app = QApplication.instance()
             if not app:
@@ -120,15 +132,15 @@ class ToastInputNode(SuperNode):
             
             if ok:
                 self.logger.info(f"Input Received: {text}")
-                self.bridge.set(f"{self.node_id}_Text", text, self.name)
-                self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow", "OnClick"], self.name)
+                self.bridge.set(self._k_text, text, self.name)
+                self.bridge.set(self._k_active, ["Flow", "OnClick"], self.name)
                 return True
             else:
                 self.logger.info("Input Cancelled.")
-                self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+                self.bridge.set(self._k_active, ACTIVE_FLOW, self.name)
                 return True
                 
         except Exception as e:
             self.logger.error(f"GUI Fallback Error: {e}")
-            self.bridge.set(f"{self.node_id}_ActivePorts", [], self.name)
+            self.bridge.set(self._k_active, [], self.name)
             return False
@@ -12,6 +12,199 @@ from axonpulse.core.types import DataType, TypeCaster
 
 from axonpulse.nodes.decorators import axon_node
 
+from axonpulse.core.constants import ACTIVE_FLOW
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_ARRAY_TYPES = (list, tuple) if np is None else (list, tuple, np.ndarray)
+
+_sin = math.sin
+_cos = math.cos
+_tan = math.tan
+_radians = math.radians
+_exp = math.exp
+_expm1 = math.expm1
+_copysign = math.copysign
+
+# Forward trig ops shared by Sin/Cos/Tan
+_OP_SIN, _OP_COS, _OP_TAN = 0, 1, 2
+_SCALAR_TRIG = (_sin, _cos, _tan)
+_ARRAY_TRIG = (np.sin, np.cos, np.tan) if np is not None else None
+
+# Numba-compiled scalar kernel, resolved on first use (False = unavailable)
+_TRIG_KERNEL = None
+
+def _get_trig_kernel():
+    """Returns the optional Numba kernel fusing degree conversion and the trig call."""
+    global _TRIG_KERNEL
+    if _TRIG_KERNEL is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _TRIG_KERNEL = False
+            return _TRIG_KERNEL
+
+        @njit(cache=True)
+        def _trig_kernel(angle, deg, op):
+            if deg:
+                angle = angle * 0.017453292519943295 # pi / 180, same as math.radians
+            if op == 0:
+                return math.sin(angle)
+            if op == 1:
+                return math.cos(angle)
+            return math.tan(angle)
+
+        _TRIG_KERNEL = _trig_kernel
+    return _TRIG_KERNEL
+
+def _memo_lookup(node, value, flag):
+    """One-entry per-node memo: returns the last result if (value, flag) repeats, else None."""
+    memo = node.__dict__.get('_trig_memo')
+    if memo is not None and memo[0] == value and memo[1] == flag:
+        return memo[2]
+    return None
+
+def _memo_store(node, value, flag, result):
+    node._trig_memo = (value, flag, result)
+
+def _is_array(value):
+    """True when value is a batch of numbers that NumPy can evaluate in one call."""
+    return np is not None and isinstance(value, _ARRAY_TYPES)
+
+def _forward_trig(op, angle_in, degrees_in, node):
+    """Shared Sin/Cos/Tan kernel: resolves the angle, converts degrees to radians, applies the op."""
+    if angle_in is None:
+        angle_in = node.properties.get('Angle', 0.0)
+    use_degrees = degrees_in if degrees_in is not None else node.properties.get('Degrees', False)
+    if _is_array(angle_in):
+        arr = np.asarray(angle_in, dtype=np.float64)
+        if use_degrees:
+            arr = np.deg2rad(arr)
+        return _ARRAY_TRIG[op](arr).tolist()
+    angle = float(angle_in)
+    use_degrees = bool(use_degrees)
+    # Constant angles are common (evaluated every tick); reuse the last result
+    result = _memo_lookup(node, angle, use_degrees)
+    if result is not None:
+        return result
+    kernel = _TRIG_KERNEL if _TRIG_KERNEL is not None else _get_trig_kernel()
+    if kernel:
+        result = kernel(angle, use_degrees, op)
+    else:
+        result = _SCALAR_TRIG[op](_radians(angle) if use_degrees else angle)
+    _memo_store(node, angle, use_degrees, result)
+    return result
+
+def _inverse_trig_array(np_func, values, node, clip=False):
+    """Vectorized Asin/Acos/Atan path; returns a list (radians, or degrees if the property is set)."""
+    arr = np.asarray(values, dtype=np.float64)
+    if clip:
+        arr = np.clip(arr, -1.0, 1.0)
+    result = np_func(arr)
+    if node.properties.get('Degrees', False):
+        result = np.rad2deg(result)
+    return result.tolist()
+
+# Hyperbolic ops shared by Sinh/Cosh/Tanh
+_OP_SINH, _OP_COSH, _OP_TANH = 0, 1, 2
+_SCALAR_HYPER = (math.sinh, math.cosh, math.tanh)
+_HYPER_EXP_MAX = 350.0 # expm1(2|x|) overflows past ~354.9; math.* handles the large range itself
+_TANH_SATURATE = 20.0 # tanh(|x|) rounds to exactly 1.0 from here on
+# Last (x, (sinh, cosh, tanh)) evaluated by any hyperbolic node
+_HYPER_LAST = None
+
+def _hyper(x, op):
+    """
+    Returns sinh, cosh or tanh of x. All three come from one exp/expm1 pair and
+    the last argument is remembered, so Sinh -> Cosh -> Tanh on one Value pays once.
+    """
+    global _HYPER_LAST
+    last = _HYPER_LAST
+    if last is not None and last[0] == x:
+        return last[1][op]
+    a = abs(x)
+    if not a < _HYPER_EXP_MAX: # also catches NaN
+        return _SCALAR_HYPER[op](x)
+    e = _exp(-a)
+    s = _copysign(0.5 * e * _expm1(2.0 * a), x) # expm1 keeps sinh exact near zero
+    c = 0.5 * (e + 1.0 / e)
+    # s / c can round a ulp past 1.0; tanh must stay within [-1, 1]
+    t = _copysign(1.0, x) if a > _TANH_SATURATE else _copysign(min(abs(s / c), 1.0), x)
+    vals = (s, c, t)
+    _HYPER_LAST = (x, vals)
+    return vals[op]
+
+_NP_HYPER = (np.sinh, np.cosh, np.tanh) if np is not None else None
+
+# Parallel Numba kernel for large batches, resolved on first use (False = unavailable)
+_HYPER_KERNEL = None
+# Below this size (or with fewer threads) a single NumPy ufunc call is faster than
+# fanning out; on one core the Numba loop is ~3x slower than NumPy's SIMD loop.
+_HYPER_PARALLEL_MIN = 65536
+_HYPER_PARALLEL_THREADS = 4
+
+def _get_hyper_kernel():
+    """Returns the optional prange kernel for Sinh/Cosh/Tanh, or False when it would not pay off."""
+    global _HYPER_KERNEL
+    if _HYPER_KERNEL is None:
+        try:
+            import numba
+            from numba import njit, prange
+        except ImportError:
+            _HYPER_KERNEL = False
+            return _HYPER_KERNEL
+        if numba.config.NUMBA_NUM_THREADS < _HYPER_PARALLEL_THREADS:
+            _HYPER_KERNEL = False
+            return _HYPER_KERNEL
+
+        # 'afn' allows the fast (SVML) transcendentals without assuming finite inputs
+        @njit(parallel=True, fastmath={'afn', 'contract'}, cache=True)
+        def _hyper_kernel(arr, op, out):
+            n = arr.shape[0]
+            if op == 0:
+                for i in prange(n):
+                    out[i] = math.sinh(arr[i])
+            elif op == 1:
+                for i in prange(n):
+                    out[i] = math.cosh(arr[i])
+            else:
+                for i in prange(n):
+                    out[i] = math.tanh(arr[i])
+            return out
+
+        _HYPER_KERNEL = _hyper_kernel
+    return _HYPER_KERNEL
+
+# Last (snapshot, float64 array) converted by a hyperbolic node. Sinh/Cosh/Tanh wired to one
+# Value receive the same list, and converting it costs far more than comparing it.
+_HYPER_ARRAY_LAST = None
+
+def _hyper_input(values):
+    """Returns the float64 array for values, reusing the previous conversion of equal contents."""
+    global _HYPER_ARRAY_LAST
+    if not isinstance(values, (list, tuple)):
+        return np.asarray(values, dtype=np.float64)
+    last = _HYPER_ARRAY_LAST
+    # Keyed on a copy of the contents, so a list edited in place is converted afresh
+    if last is not None and last[0] == values:
+        return last[1]
+    arr = np.asarray(values, dtype=np.float64)
+    _HYPER_ARRAY_LAST = (values[:], arr)
+    return arr
+
+def _hyperbolic_array(op, values):
+    """Vectorized Sinh/Cosh/Tanh path; the converted input is shared, so results always get a new buffer."""
+    arr = _hyper_input(values)
+    out = np.empty_like(arr)
+    if arr.ndim == 1 and arr.size >= _HYPER_PARALLEL_MIN:
+        kernel = _HYPER_KERNEL if _HYPER_KERNEL is not None else _get_hyper_kernel()
+        if kernel:
+            return kernel(arr, op, out).tolist()
+    return _NP_HYPER[op](arr, out=out).tolist()
+
 @axon_node(category="Math/Trigonometry", version="2.3.0", node_label="Sin")
 def SinNode(Angle: Any = 0.0, Degrees: bool = False, _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Calculates the sine of a given angle.
@@ -22,21 +215,15 @@ Otherwise, it is treated as radians.
 
 Inputs:
 - Flow: Trigger the calculation.
-- Angle: The input angle to process.
+- Angle: The input angle to process (a list is evaluated element-wise).
 - Degrees: Whether the angle is in degrees (True) or radians (False).
 
 Outputs:
 - Flow: Triggered after calculation.
 - Result: The sine of the angle."""
-    val = Angle if Angle is not None else _node.properties.get('Angle', 0.0)
-    angle = float(val)
-    use_degrees = Degrees if Degrees is not None else _node.properties.get('Degrees', False)
-    if use_degrees:
-        angle = math.radians(angle)
-    else:
-        pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
-    return math.sin(angle)
+    result = _forward_trig(_OP_SIN, Angle, Degrees, _node)
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+    return result
 
 
 @axon_node(category="Math/Trigonometry", version="2.3.0", node_label="Cos")
@@ -46,20 +233,14 @@ Supports both Degrees and Radians based on the Degrees property.
 
 Inputs:
 - Flow: Trigger the calculation.
-- Angle: The input angle to process.
+- Angle: The input angle to process (a list is evaluated element-wise).
 
 Outputs:
 - Flow: Triggered after calculation.
 - Result: The cosine of the angle."""
-    val = Angle if Angle is not None else _node.properties.get('Angle', 0.0)
-    angle = float(val)
-    use_degrees = Degrees if Degrees is not None else _node.properties.get('Degrees', False)
-    if use_degrees:
-        angle = math.radians(angle)
-    else:
-        pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
-    return math.cos(angle)
+    result = _forward_trig(_OP_COS, Angle, Degrees, _node)
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+    return result
 
 
 @axon_node(category="Math/Trigonometry", version="2.3.0", node_label="Tan")
@@ -72,21 +253,15 @@ Otherwise, it is treated as radians.
 
 Inputs:
 - Flow: Trigger the calculation.
-- Angle: The input angle to process.
+- Angle: The input angle to process (a list is evaluated element-wise).
 - Degrees: Whether the angle is in degrees (True) or radians (False).
 
 Outputs:
 - Flow: Triggered after calculation.
 - Result: The tangent of the angle."""
-    val = Angle if Angle is not None else _node.properties.get('Angle', 0.0)
-    angle = float(val)
-    use_degrees = Degrees if Degrees is not None else _node.properties.get('Degrees', False)
-    if use_degrees:
-        angle = math.radians(angle)
-    else:
-        pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
-    return math.tan(angle)
+    result = _forward_trig(_OP_TAN, Angle, Degrees, _node)
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+    return result
 
 
 @axon_node(category="Math/Trigonometry", version="2.3.0", node_label="Asin")
@@ -102,18 +277,21 @@ Outputs:
 - Flow: Triggered after calculation.
 - Result: The angle in radians (or degrees if the Degrees property is set)."""
     val = Value if Value is not None else _node.properties.get('Value', 0.0)
+    if _is_array(val):
+        _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+        return _inverse_trig_array(np.arcsin, val, _node, clip=True)
     value = float(val)
-    try:
-        result = math.asin(max(-1, min(1, value)))
-        if _node.properties.get('Degrees', _node.properties.get('Degrees', False)):
-            result = math.degrees(result)
-        else:
-            pass
-    except ValueError:
-        _node.logger.warning(f'Asin Error: Value {value} out of range -1 to 1')
-    finally:
-        pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+    use_degrees = bool(_node.properties.get('Degrees', False))
+    result = _memo_lookup(_node, value, use_degrees)
+    if result is None:
+        try:
+            result = math.asin(max(-1, min(1, value)))
+            if use_degrees:
+                result = math.degrees(result)
+            _memo_store(_node, value, use_degrees, result)
+        except ValueError:
+            _node.logger.warning(f'Asin Error: Value {value} out of range -1 to 1')
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     return result
 
 
@@ -130,18 +308,21 @@ Outputs:
 - Flow: Triggered after calculation.
 - Result: The angle in radians (or degrees if the Degrees property is set)."""
     val = Value if Value is not None else _node.properties.get('Value', 0.0)
+    if _is_array(val):
+        _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+        return _inverse_trig_array(np.arccos, val, _node, clip=True)
     value = float(val)
-    try:
-        result = math.acos(max(-1, min(1, value)))
-        if _node.properties.get('Degrees', _node.properties.get('Degrees', False)):
-            result = math.degrees(result)
-        else:
-            pass
-    except ValueError:
-        _node.logger.warning(f'Acos Error: Value {value} out of range -1 to 1')
-    finally:
-        pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+    use_degrees = bool(_node.properties.get('Degrees', False))
+    result = _memo_lookup(_node, value, use_degrees)
+    if result is None:
+        try:
+            result = math.acos(max(-1, min(1, value)))
+            if use_degrees:
+                result = math.degrees(result)
+            _memo_store(_node, value, use_degrees, result)
+        except ValueError:
+            _node.logger.warning(f'Acos Error: Value {value} out of range -1 to 1')
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     return result
 
 
@@ -157,13 +338,18 @@ Outputs:
 - Flow: Triggered after calculation.
 - Result: The angle in radians (or degrees if the Degrees property is set)."""
     val = Value if Value is not None else _node.properties.get('Value', 0.0)
+    if _is_array(val):
+        _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+        return _inverse_trig_array(np.arctan, val, _node)
     value = float(val)
-    result = math.atan(value)
-    if _node.properties.get('Degrees', _node.properties.get('Degrees', False)):
-        result = math.degrees(result)
-    else:
-        pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+    use_degrees = bool(_node.properties.get('Degrees', False))
+    result = _memo_lookup(_node, value, use_degrees)
+    if result is None:
+        result = math.atan(value)
+        if use_degrees:
+            result = math.degrees(result)
+        _memo_store(_node, value, use_degrees, result)
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     return result
 
 
@@ -180,14 +366,20 @@ Inputs:
 Outputs:
 - Flow: Triggered after calculation.
 - Result: The angle in radians (or degrees if the Degrees property is set)."""
-    y = float(Y) if Y is not None else float(_node.properties.get('Y', 0.0))
-    x = float(X) if X is not None else float(_node.properties.get('X', 1.0))
-    result = math.atan2(y, x)
-    if _node.properties.get('Degrees', _node.properties.get('Degrees', False)):
+    y = Y if Y is not None else _node.properties.get('Y', 0.0)
+    x = X if X is not None else _node.properties.get('X', 1.0)
+    if _is_array(y) or _is_array(x):
+        result = np.arctan2(np.asarray(y, dtype=np.float64), np.asarray(x, dtype=np.float64))
+        if _node.properties.get('Degrees', False):
+            result = np.rad2deg(result)
+        _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+        return result.tolist()
+    result = math.atan2(float(y), float(x))
+    if _node.properties.get('Degrees', False):
         result = math.degrees(result)
     else:
         pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     return result
 
 
@@ -203,7 +395,7 @@ Outputs:
 - Flow: Triggered after conversion.
 - Result: The angle in radians."""
     val = Degrees if Degrees is not None else _node.properties.get('Degrees', 0.0)
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     return math.radians(float(val))
 
 
@@ -219,7 +411,7 @@ Outputs:
 - Flow: Triggered after conversion.
 - Result: The angle in degrees."""
     val = Radians if Radians is not None else _node.properties.get('Radians', 0.0)
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     return math.degrees(float(val))
 
 
@@ -229,14 +421,16 @@ def SinhNode(Value: Any = 0.0, _bridge: Any = None, _node: Any = None, _node_id:
 
 Inputs:
 - Flow: Trigger the calculation.
-- Value: The input value.
+- Value: The input value (a list is evaluated element-wise).
 
 Outputs:
 - Flow: Triggered after calculation.
 - Result: The hyperbolic sine."""
     val = Value if Value is not None else _node.properties.get('Value', 0.0)
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
-    return math.sinh(float(val))
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+    if _is_array(val):
+        return _hyperbolic_array(_OP_SINH, val)
+    return _hyper(float(val), _OP_SINH)
 
 
 @axon_node(category="Math/Hyperbolic", version="2.3.0", node_label="Cosh")
@@ -245,14 +439,16 @@ def CoshNode(Value: Any = 0.0, _bridge: Any = None, _node: Any = None, _node_id:
 
 Inputs:
 - Flow: Trigger the calculation.
-- Value: The input value.
+- Value: The input value (a list is evaluated element-wise).
 
 Outputs:
 - Flow: Triggered after calculation.
 - Result: The hyperbolic cosine."""
     val = Value if Value is not None else _node.properties.get('Value', 0.0)
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
-    return math.cosh(float(val))
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+    if _is_array(val):
+        return _hyperbolic_array(_OP_COSH, val)
+    return _hyper(float(val), _OP_COSH)
 
 
 @axon_node(category="Math/Hyperbolic", version="2.3.0", node_label="Tanh")
@@ -261,11 +457,13 @@ def TanhNode(Value: Any = 0.0, _bridge: Any = None, _node: Any = None, _node_id:
 
 Inputs:
 - Flow: Trigger the calculation.
-- Value: The input value.
+- Value: The input value (a list is evaluated element-wise).
 
 Outputs:
 - Flow: Triggered after calculation.
 - Result: The hyperbolic tangent."""
     val = Value if Value is not None else _node.properties.get('Value', 0.0)
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
-    return math.tanh(float(val))
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+    if _is_array(val):
+        return _hyperbolic_array(_OP_TANH, val)
+    return _hyper(float(val), _OP_TANH)
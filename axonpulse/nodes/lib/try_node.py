@@ -10,6 +10,8 @@ from axonpulse.core.types import DataType, TypeCaster
 
 from axonpulse.nodes.decorators import axon_node
 
+from axonpulse.core.constants import ACTIVE_FLOW
+
 @axon_node(category="Logic/Control Flow", version="2.3.0", node_label="Try Node", outputs=['Catch', 'FailedNode', 'ErrorCode'])
 def TryNode(_bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Initiates a protected execution block (Exception Handler).
@@ -26,5 +28,5 @@ Outputs:
 - Catch: Pulse triggered only on execution failure.
 - FailedNode: Name or ID of the node that threw the error.
 - ErrorCode: Error message or status code."""
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     return {'FailedNode': '', 'ErrorCode': ''}
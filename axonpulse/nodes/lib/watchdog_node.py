@@ -12,12 +12,46 @@ from axonpulse.core.types import DataType, TypeCaster
 
 from axonpulse.nodes.decorators import axon_node
 
+from axonpulse.core.constants import PLATFORM_SYSTEM, ACTIVE_FLOW
+
 try:
     import psutil
 except ImportError:
     psutil = None
 
-@axon_node(category="System/Monitor", version="2.3.0", node_label="Watchdog", outputs=['CPU', 'RAM', 'Drives', 'OS'])
+_SAMPLE_TTL = 1.0 # seconds; faster pulses reuse the last reading
+_PARTITIONS_TTL = 10.0 # seconds; mounted drives rarely change
+_GB = 1 << 30
+
+# Shared by every Watchdog node in the process (they all read the same host)
+_last_sample_ts = 0.0
+_last_sample = None # (cpu, ram, drives, os)
+_partitions_ts = 0.0
+_partitions = None
+_cpu_primed = False
+
+def _get_partitions(now):
+    global _partitions_ts, _partitions
+    if _partitions is None or now - _partitions_ts >= _PARTITIONS_TTL:
+        _partitions = psutil.disk_partitions()
+        _partitions_ts = now
+    return _partitions
+
+def _cpu_sample():
+    """Non-blocking CPU percentage since the previous call; only the very first call blocks to prime it."""
+    global _cpu_primed
+    if not _cpu_primed:
+        _cpu_primed = True
+        return psutil.cpu_percent(interval=0.1)
+    return psutil.cpu_percent(interval=None)
+
+def _watchdog_result(node, cpu, ram, drives, current_os):
+    result = {'CPU': cpu, 'RAM': ram, 'Drives': drives, 'OS': current_os}
+    if 'Drives Text' in node.wired_outputs:
+        result['Drives Text'] = [f"{d['device']} {d['used_gb']:.1f}GB/{d['total_gb']:.1f}GB" for d in drives]
+    return result
+
+@axon_node(category="System/Monitor", version="2.3.0", node_label="Watchdog", outputs=['CPU', 'RAM', 'Drives', 'Drives Text', 'OS'])
 def WatchdogNode(_bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Monitors system resource usage including CPU, RAM, and Disk space.
 Provides real-time telemetry about the host operating system.
@@ -29,26 +63,32 @@ Outputs:
 - Flow: Pulse triggered after data is captured.
 - CPU: Total CPU usage percentage (FLOAT).
 - RAM: Total RAM usage percentage (FLOAT).
-- Drives: List of connected drives and their usage (LIST).
+- Drives: List of connected drives and their usage, one dict per drive with 
+  'device', 'used_gb', 'total_gb' and 'percent' (LIST).
+- Drives Text: The same drives as 'device usedGB/totalGB' strings; only 
+  formatted when this port is wired (LIST).
 - OS: The name of the host operating system (STRING)."""
-    import platform
-    current_os = platform.system()
+    global _last_sample_ts, _last_sample
+    now = time.monotonic()
+    if _last_sample is not None and now - _last_sample_ts < _SAMPLE_TTL:
+        (cpu, ram, drives, current_os) = _last_sample
+        _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+        return _watchdog_result(_node, cpu, ram, [dict(d) for d in drives], current_os)
+    current_os = PLATFORM_SYSTEM
     if not psutil:
         _node.logger.error("'psutil' not installed.")
-        _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+        _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     else:
         pass
-    cpu = psutil.cpu_percent(interval=0.1)
+    cpu = _cpu_sample()
     ram = psutil.virtual_memory().percent
     drives = []
     try:
-        partitions = psutil.disk_partitions()
+        partitions = _get_partitions(now)
         for p in partitions:
             try:
                 usage = psutil.disk_usage(p.mountpoint)
-                total_gb = usage.total / 1024 ** 3
-                used_gb = usage.used / 1024 ** 3
-                drives.append(f'{p.device} {used_gb:.1f}GB/{total_gb:.1f}GB')
+                drives.append({'device': p.device, 'used_gb': usage.used / _GB, 'total_gb': usage.total / _GB, 'percent': usage.percent})
             except PermissionError:
                 continue
             finally:
@@ -57,5 +97,7 @@ Outputs:
         _node.logger.error(f'Disk Error: {e}')
     finally:
         pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
-    return {'CPU': cpu, 'RAM': ram, 'Drives': drives, 'OS': current_os}
+    _last_sample = (cpu, ram, tuple(dict(d) for d in drives), current_os)
+    _last_sample_ts = time.monotonic()
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+    return _watchdog_result(_node, cpu, ram, drives, current_os)
@@ -1,7 +1,11 @@
-import platform
+import ctypes
 
 import time
 
+from itertools import islice
+
+from concurrent.futures import ThreadPoolExecutor
+
 from axonpulse.core.super_node import SuperNode
 
 from axonpulse.nodes.registry import NodeRegistry
@@ -10,12 +14,19 @@ from axonpulse.core.types import DataType
 
 from axonpulse.core.dependencies import DependencyManager
 
+from axonpulse.core.constants import IS_WINDOWS, ACTIVE_SUCCESS, ACTIVE_FAILURE
+
 from typing import Any, List, Dict, Optional
 
 from axonpulse.core.types import DataType, TypeCaster
 
 from axonpulse.nodes.decorators import axon_node
 
+if IS_WINDOWS:
+    from ctypes import wintypes
+else:
+    wintypes = None
+
 win32service = None
 
 win32serviceutil = None
@@ -24,8 +35,11 @@ win32evtlog = None
 
 win32evtlogutil = None
 
+# Service status names indexed by SERVICE_* code (built once pywin32 is loaded)
+_STATUS_NAMES = ()
+
 def ensure_pywin32():
-    global win32service, win32serviceutil, win32evtlog, win32evtlogutil
+    global win32service, win32serviceutil, win32evtlog, win32evtlogutil, _STATUS_NAMES
     if win32service:
         return True
     if DependencyManager.ensure('pywin32', 'win32service'):
@@ -33,6 +47,8 @@ def ensure_pywin32():
         import win32serviceutil as _su
         import win32evtlog as _el
         import win32evtlogutil as _elu
+        codes = {_s.SERVICE_STOPPED: 'Stopped', _s.SERVICE_START_PENDING: 'Start Pending', _s.SERVICE_STOP_PENDING: 'Stop Pending', _s.SERVICE_RUNNING: 'Running', _s.SERVICE_CONTINUE_PENDING: 'Continue Pending', _s.SERVICE_PAUSE_PENDING: 'Pause Pending', _s.SERVICE_PAUSED: 'Paused'}
+        _STATUS_NAMES = tuple(codes.get(i) for i in range(max(codes) + 1))
         win32service = _s
         win32serviceutil = _su
         win32evtlog = _el
@@ -40,8 +56,147 @@ def ensure_pywin32():
         return True
     return False
 
+def _status_name(status_code):
+    if 0 <= status_code < len(_STATUS_NAMES) and _STATUS_NAMES[status_code]:
+        return _STATUS_NAMES[status_code]
+    return str(status_code)
+
+def _start_service(node, svc_name, status_code):
+    if status_code == win32service.SERVICE_RUNNING:
+        node.logger.info(f'Service {svc_name} already running.')
+    else:
+        node.logger.info(f'Starting {svc_name}...')
+        win32serviceutil.StartService(svc_name)
+
+def _stop_service(node, svc_name, status_code):
+    if status_code == win32service.SERVICE_STOPPED:
+        node.logger.info(f'Service {svc_name} already stopped.')
+    else:
+        node.logger.info(f'Stopping {svc_name}...')
+        win32serviceutil.StopService(svc_name)
+
+def _restart_service(node, svc_name, status_code):
+    node.logger.info(f'Restarting {svc_name}...')
+    win32serviceutil.RestartService(svc_name)
+
+_SERVICE_ACTIONS = {'start': _start_service, 'stop': _stop_service, 'restart': _restart_service}
+
 def is_windows():
-    return platform.system().lower() == 'windows'
+    return IS_WINDOWS
+
+# Formatted event messages keyed by (log type, source, event id, inserts)
+_MESSAGE_CACHE = {}
+_MESSAGE_CACHE_MAX = 1024
+_FORMAT_EXECUTOR = None
+_FORMAT_WORKERS = 4
+
+def _format_event(event, log_type):
+    try:
+        return win32evtlogutil.SafeFormatMessage(event, log_type)
+    except Exception:
+        return '(Format Error)'
+
+def _format_events(events, log_type):
+    """
+    Formats event messages, reusing cached text for repeated events and
+    formatting the rest concurrently (SafeFormatMessage releases the GIL).
+    """
+    global _FORMAT_EXECUTOR
+    keys = [(log_type, e.SourceName, e.EventID, tuple(e.StringInserts or ())) for e in events]
+    pending = {}
+    for key, event in zip(keys, events):
+        if key not in _MESSAGE_CACHE and key not in pending:
+            pending[key] = event
+    if len(pending) > 1:
+        if _FORMAT_EXECUTOR is None:
+            _FORMAT_EXECUTOR = ThreadPoolExecutor(max_workers=_FORMAT_WORKERS, thread_name_prefix='EventLogFormat')
+        formatted = _FORMAT_EXECUTOR.map(_format_event, pending.values(), [log_type] * len(pending))
+    else:
+        formatted = [_format_event(e, log_type) for e in pending.values()]
+    fresh = dict(zip(pending, formatted))
+    messages = [fresh[key] if key in fresh else _MESSAGE_CACHE[key] for key in keys]
+    if len(_MESSAGE_CACHE) + len(fresh) > _MESSAGE_CACHE_MAX:
+        _MESSAGE_CACHE.clear()
+    _MESSAGE_CACHE.update(fresh)
+    return messages
+
+_USER32 = None
+
+def get_user32():
+    """Returns user32 with the prototypes used by the window nodes bound once (Windows only)."""
+    global _USER32
+    if _USER32 is None:
+        user32 = ctypes.WinDLL('user32')
+        user32.EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+        user32.EnumWindows.argtypes = [user32.EnumWindowsProc, wintypes.LPARAM]
+        user32.EnumWindows.restype = wintypes.BOOL
+        user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+        user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+        user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+        user32.GetWindowTextLengthW.restype = ctypes.c_int
+        user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+        user32.GetWindowTextW.restype = ctypes.c_int
+        user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+        user32.GetWindowRect.restype = wintypes.BOOL
+
+        class WINDOWINFO(ctypes.Structure):
+            _fields_ = [('cbSize', wintypes.DWORD), ('rcWindow', wintypes.RECT), ('rcClient', wintypes.RECT), ('dwStyle', wintypes.DWORD), ('dwExStyle', wintypes.DWORD), ('dwWindowStatus', wintypes.DWORD), ('cxWindowBorders', wintypes.UINT), ('cyWindowBorders', wintypes.UINT), ('atomWindowType', wintypes.ATOM), ('wCreatorVersion', wintypes.WORD)]
+        user32.WINDOWINFO = WINDOWINFO
+        user32.GetWindowInfo.argtypes = [wintypes.HWND, ctypes.POINTER(WINDOWINFO)]
+        user32.GetWindowInfo.restype = wintypes.BOOL
+        user32.GetClassNameW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+        user32.GetClassNameW.restype = ctypes.c_int
+        user32.IsWindowVisible.argtypes = [wintypes.HWND]
+        user32.IsWindowVisible.restype = wintypes.BOOL
+        _USER32 = user32
+    return _USER32
+
+_TITLE_BUF_LEN = 512
+_CLASS_BUF_LEN = 256
+
+_WS_VISIBLE = 0x10000000
+_WS_CHILD = 0x40000000
+
+def _get_info_buffers(node):
+    """Per-node (title buffer, class buffer, WINDOWINFO, WINDOWINFO pointer) reused by Window Information."""
+    bufs = node.__dict__.get('_info_bufs')
+    if bufs is None:
+        info = get_user32().WINDOWINFO()
+        info.cbSize = ctypes.sizeof(info)
+        bufs = node._info_bufs = (ctypes.create_unicode_buffer(_TITLE_BUF_LEN), ctypes.create_unicode_buffer(_CLASS_BUF_LEN), info, ctypes.byref(info))
+    return bufs
+
+def _get_enum_callback(node):
+    """
+    Builds the node's EnumWindows callback once. It reads the current query from
+    node._enum_target (pid, titles, handles) and reuses one PID/title buffer.
+    """
+    cb = node.__dict__.get('_enum_cb')
+    if cb is not None:
+        return cb
+    user32 = get_user32()
+    window_pid = wintypes.DWORD()
+    pid_ref = ctypes.byref(window_pid)
+    title_buf = ctypes.create_unicode_buffer(_TITLE_BUF_LEN)
+
+    def enum_callback(hwnd, lparam):
+        (pid, titles, handles) = node._enum_target
+        user32.GetWindowThreadProcessId(hwnd, pid_ref)
+        if window_pid.value == pid:
+            length = user32.GetWindowTextLengthW(hwnd)
+            if length <= 0:
+                titles.append('')
+            elif length < _TITLE_BUF_LEN:
+                user32.GetWindowTextW(hwnd, title_buf, _TITLE_BUF_LEN)
+                titles.append(title_buf.value)
+            else:
+                buf = ctypes.create_unicode_buffer(length + 1)
+                user32.GetWindowTextW(hwnd, buf, length + 1)
+                titles.append(buf.value)
+            handles.append(int(hwnd))
+        return True # keep enumerating
+    cb = node._enum_cb = user32.EnumWindowsProc(enum_callback)
+    return cb
 
 @axon_node(category="Automation/Windows", version="2.3.0", node_label="Service Controller", outputs=['Success', 'Failure', 'Previous Status'])
 def ServiceControllerNode(Service_Name: str = '', Action: str = 'Start', _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
@@ -60,49 +215,38 @@ Outputs:
 - Previous Status: The status of the service before the action was taken."""
     if not is_windows() or not ensure_pywin32():
         _node.logger.error('Windows only or pywin32 missing.')
-        _bridge.set(f'{_node_id}_ActivePorts', ['Failure', 'Flow'], _node.name)
+        _bridge.set(_node._k_active, ACTIVE_FAILURE, _node.name)
+        return {'Previous Status': ''}
     else:
         pass
     svc_name = Service_Name if Service_Name is not None else _node.properties.get('Service Name', '')
     action = Action if Action is not None else _node.properties.get('Action', 'Start')
     if not svc_name:
         _node.logger.error('Missing Service Name.')
-        _bridge.set(f'{_node_id}_ActivePorts', ['Failure', 'Flow'], _node.name)
+        _bridge.set(_node._k_active, ACTIVE_FAILURE, _node.name)
+        return {'Previous Status': ''}
     else:
         pass
+    prev_status = ''
     try:
         status_code = win32serviceutil.QueryServiceStatus(svc_name)[1]
-        status_map = {win32service.SERVICE_STOPPED: 'Stopped', win32service.SERVICE_START_PENDING: 'Start Pending', win32service.SERVICE_STOP_PENDING: 'Stop Pending', win32service.SERVICE_RUNNING: 'Running', win32service.SERVICE_CONTINUE_PENDING: 'Continue Pending', win32service.SERVICE_PAUSE_PENDING: 'Pause Pending', win32service.SERVICE_PAUSED: 'Paused'}
-        prev_status = status_map.get(status_code, str(status_code))
-        action_lower = str(action).lower()
-        if action_lower == 'start':
-            if status_code == win32service.SERVICE_RUNNING:
-                _node.logger.info(f'Service {svc_name} already running.')
-            else:
-                _node.logger.info(f'Starting {svc_name}...')
-                win32serviceutil.StartService(svc_name)
-        elif action_lower == 'stop':
-            if status_code == win32service.SERVICE_STOPPED:
-                _node.logger.info(f'Service {svc_name} already stopped.')
-            else:
-                _node.logger.info(f'Stopping {svc_name}...')
-                win32serviceutil.StopService(svc_name)
-        elif action_lower == 'restart':
-            _node.logger.info(f'Restarting {svc_name}...')
-            win32serviceutil.RestartService(svc_name)
+        prev_status = _status_name(status_code)
+        handler = _SERVICE_ACTIONS.get(str(action).lower())
+        if handler is not None:
+            handler(_node, svc_name, status_code)
         else:
             pass
-        _bridge.set(f'{_node_id}_ActivePorts', ['Success', 'Flow'], _node.name)
+        _bridge.set(_node._k_active, ACTIVE_SUCCESS, _node.name)
     except Exception as e:
         _node.logger.error(f'Service Controller Error: {e}')
-        _bridge.set(f'{_node_id}_ActivePorts', ['Failure', 'Flow'], _node.name)
+        _bridge.set(_node._k_active, ACTIVE_FAILURE, _node.name)
     finally:
         pass
     return {'Previous Status': prev_status}
 
 
 @axon_node(category="Automation/Windows", version="2.3.0", node_label="Event Log Watcher", outputs=['Logs'])
-def EventLogWatcherNode(Log_Type: str = 'System', Limit: float = 10, _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
+def EventLogWatcherNode(Log_Type: str = 'System', Limit: float = 10, Include_Message: bool = True, _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Reads recent entries from Windows Event Logs (System, Application, Security).
 Allows monitoring system events and security logs for specific patterns.
 
@@ -110,10 +254,12 @@ Inputs:
 - Flow: Trigger the log reading operation.
 - Log Type: The log category to read ('System', 'Application', or 'Security').
 - Limit: The maximum number of recent events to retrieve.
+- Include Message: Format each event's message text (the slowest part of 
+  reading; disable when only IDs/sources are needed).
 
 Outputs:
 - Flow: Triggered after logs are retrieved.
-- Logs: A list of event dictionaries containing time, source, ID, and message."""
+- Logs: A list of event dictionaries containing time (epoch seconds), source, ID, and message."""
     if not is_windows() or not ensure_pywin32():
         _node.logger.error('Windows only or pywin32 missing.')
         return False
@@ -121,34 +267,27 @@ Outputs:
         pass
     log_type = Log_Type if Log_Type is not None else _node.properties.get('Log Type', 'System')
     limit = int(Limit) if Limit is not None else int(_node.properties.get('Limit', 10))
+    include_message = Include_Message if Include_Message is not None else _node.properties.get('Include Message', True)
     logs = []
+    raw_events = []
     hand = None
     try:
         server = 'localhost'
         hand = win32evtlog.OpenEventLog(server, log_type)
         flags = win32evtlog.EVENTLOG_BACKWARDS_READ | win32evtlog.EVENTLOG_SEQUENTIAL_READ
-        total = 0
-        while total < limit:
+        while len(logs) < limit:
             events = win32evtlog.ReadEventLog(hand, flags, 0)
             if not events:
                 break
             else:
                 pass
-            for event in events:
-                if total >= limit:
-                    break
-                else:
-                    pass
-                data = {'Time': str(event.TimeGenerated), 'Source': event.SourceName, 'Event ID': event.EventID, 'Type': event.EventType, 'Category': event.EventCategory}
-                try:
-                    msg = win32evtlogutil.SafeFormatMessage(event, log_type)
-                    data['Message'] = msg
-                except Exception:
-                    data['Message'] = '(Format Error)'
-                finally:
-                    pass
-                logs.append(data)
-                total += 1
+            # Records past the limit are never touched (no formatting, no dict)
+            for event in islice(events, limit - len(logs)):
+                logs.append({'Time': event.TimeGenerated.timestamp(), 'Source': event.SourceName, 'Event ID': event.EventID, 'Type': event.EventType, 'Category': event.EventCategory, 'Message': ''})
+                raw_events.append(event)
+        if include_message and raw_events:
+            for (data, msg) in zip(logs, _format_events(raw_events, log_type)):
+                data['Message'] = msg
         _node.logger.info(f'Read {len(logs)} events from {log_type}')
     except Exception as e:
         _node.logger.error(f'Event Log Error: {e}')
@@ -178,34 +317,16 @@ Outputs:
         return False
     else:
         pass
-    import ctypes
-    from ctypes import wintypes
     pid = int(Process_ID) if Process_ID is not None else int(_node.properties.get('Process ID', 0))
     if not pid:
         _node.logger.warning('No Process ID provided.')
         return False
     else:
         pass
-    user32 = ctypes.windll.user32
-    EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
     titles = []
     handles = []
-    
-    def enum_callback(hwnd, lparam):
-        window_pid = wintypes.DWORD()
-        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(window_pid))
-        if window_pid.value == pid:
-            length = user32.GetWindowTextLengthW(hwnd)
-            if length > 0:
-                buf = ctypes.create_unicode_buffer(length + 1)
-                user32.GetWindowTextW(hwnd, buf, length + 1)
-                titles.append(buf.value)
-            else:
-                titles.append('')
-            handles.append(int(hwnd))
-        else:
-            pass
-    user32.EnumWindows(EnumWindowsProc(enum_callback), 0)
+    _node._enum_target = (pid, titles, handles)
+    get_user32().EnumWindows(_get_enum_callback(_node), 0)
     _node.logger.info(f'Found {len(handles)} window(s) for PID {pid}')
     return {'Titles': titles, 'Handles': handles}
 
@@ -231,26 +352,35 @@ Outputs:
         return False
     else:
         pass
-    import ctypes
-    from ctypes import wintypes
-    hwnd = int(Handle) if Handle is not None else int(_node.properties.get('Handle', _node.properties.get('Handle', 0)))
+    hwnd = int(Handle) if Handle is not None else int(_node.properties.get('Handle', 0))
     if not hwnd:
         _node.logger.warning('No Window Handle provided.')
         return False
     else:
         pass
-    user32 = ctypes.windll.user32
-    length = user32.GetWindowTextLengthW(hwnd)
-    buf = ctypes.create_unicode_buffer(length + 1)
-    user32.GetWindowTextW(hwnd, buf, length + 1)
-    title = buf.value
-    rect = wintypes.RECT()
-    user32.GetWindowRect(hwnd, ctypes.byref(rect))
+    user32 = get_user32()
+    (title_buf, cls_buf, info, info_ref) = _get_info_buffers(_node)
+    # One call instead of GetWindowTextLengthW + GetWindowTextW; only a
+    # completely filled buffer can mean the title was truncated
+    n = user32.GetWindowTextW(hwnd, title_buf, _TITLE_BUF_LEN)
+    if n >= _TITLE_BUF_LEN - 1:
+        length = user32.GetWindowTextLengthW(hwnd)
+        buf = ctypes.create_unicode_buffer(length + 1)
+        user32.GetWindowTextW(hwnd, buf, length + 1)
+        title = buf.value
+    else:
+        title = title_buf.value
+    # Rect and style in one call (replaces GetWindowRect + IsWindowVisible)
+    user32.GetWindowInfo(hwnd, info_ref)
+    rect = info.rcWindow
     (x, y) = (rect.left, rect.top)
     (w, h) = (rect.right - rect.left, rect.bottom - rect.top)
-    cls_buf = ctypes.create_unicode_buffer(256)
-    user32.GetClassNameW(hwnd, cls_buf, 256)
+    user32.GetClassNameW(hwnd, cls_buf, _CLASS_BUF_LEN)
     class_name = cls_buf.value
-    is_visible = bool(user32.IsWindowVisible(hwnd))
+    style = info.dwStyle
+    is_visible = bool(style & _WS_VISIBLE)
+    if is_visible and style & _WS_CHILD:
+        # A child is only visible if its ancestors are; let user32 walk them
+        is_visible = bool(user32.IsWindowVisible(hwnd))
     _node.logger.info(f"Window '{title}' info retrieved.")
     return {'Title': title, 'X': x, 'Y': y, 'Width': w, 'Height': h, 'Class Name': class_name, 'Is Visible': is_visible}
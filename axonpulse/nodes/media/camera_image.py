@@ -12,6 +12,8 @@ from axonpulse.core.types import DataType, TypeCaster
 
 from axonpulse.nodes.decorators import axon_node
 
+from axonpulse.core.constants import ACTIVE_FLOW
+
 @axon_node(category="Media/Video", version="2.3.0", node_label="Camera Image", outputs=['Image'])
 def CameraImageNode(_bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Retrieves the most recent frame from an active Camera Provider.
@@ -23,24 +25,18 @@ Inputs:
 Outputs:
 - Flow: Pulse triggered after the image is retrieved.
 - Image: The captured image object."""
-    provider_id = self.get_provider_id('CAMERA')
+    provider_id = _node.get_provider_id('CAMERA')
     if not provider_id:
         _node.logger.error('No CAMERA Provider found.')
-        _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+        _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+        return None
     else:
         pass
-    import time
-    img_obj = None
-    for _ in range(10):
-        img_obj = _bridge.get(f'{provider_id}_CurrentFrame')
-        if img_obj is not None:
-            break
-        else:
-            pass
-        time.sleep(0.1)
+    # Wakes as soon as the capture thread publishes a frame (up to 1 s)
+    img_obj = _bridge.wait_for(f'{provider_id}_CurrentFrame', timeout=1.0)
     if img_obj is not None:
         pass
     else:
         _node.logger.warning(f'No frame available from provider {provider_id}.')
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
-    return None
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+    return img_obj
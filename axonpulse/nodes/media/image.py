@@ -16,6 +16,8 @@ from axonpulse.core.types import DataType, TypeCaster
 
 from axonpulse.nodes.decorators import axon_node
 
+from axonpulse.core.constants import ACTIVE_FLOW
+
 Image = None
 
 ImageOps = None
@@ -31,8 +33,8 @@ def ensure_pil():
         return True
     return False
 
-@axon_node(category="Media/Graphics", version="2.3.0", node_label="Image Processor", outputs=['Result Path'])
-def ImageProcessorNode(Image_Path: str = '', Action: Any = 'Grayscale', Action_Data: dict = {}, W: Any = 100, H: Any = 100, Box: list = [0, 0, 100, 100], _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
+@axon_node(category="Media/Graphics", version="2.3.0", node_label="Image Processor", outputs=['Result Path', 'Result Image'])
+def ImageProcessorNode(Image_Path: str = '', Action: Any = 'Grayscale', Action_Data: dict = {}, W: Any = 100, H: Any = 100, Box: list = [0, 0, 100, 100], Quality: str = 'Standard', _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Performs common image manipulation actions like resizing, cropping, or color conversion.
 
 Applies the selected 'Action' to an input image. Supported actions include:
@@ -50,11 +52,15 @@ Inputs:
 - W: Target width (for Resize action).
 - H: Target height (for Resize action).
 - Box: Crop boundaries [x, y, w, h] (for Crop action).
+- Quality: 'High' resamples with bicubic filtering; 'Standard' uses faster 
+  bilinear filtering and lets JPEG sources decode at reduced size.
 
 Outputs:
 - Flow: Triggered after processing completes.
-- Result Path: Path to the modified temporary image file."""
-    if not DependencyManager.ensure('PIL', 'Pillow'):
+- Result Path: Path to the modified temporary image file. The file is only 
+  written when this port is wired (or when Result Image is not).
+- Result Image: The modified image in memory."""
+    if not ensure_pil():
         return
     else:
         pass
@@ -63,29 +69,43 @@ Outputs:
     action_data = Action_Data if Action_Data is not None else _node.properties.get('Action Data', {})
     if not Image_Path or not os.path.exists(Image_Path):
         _node.logger.warning(f'Image Path invalid: {Image_Path}')
-        _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+        _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     else:
         pass
-    action = _node.properties.get('Action', _node.properties.get('Action', 'Grayscale'))
+    out_path = None
+    res = None
     try:
         img = Image.open(Image_Path)
         if action == 'Grayscale':
             res = ImageOps.grayscale(img)
         elif action == 'Resize':
-            w = int(W) if W is not None else int(_node.properties.get('W', _node.properties.get('W', 100)))
-            h = int(H) if H is not None else int(_node.properties.get('H', _node.properties.get('H', 100)))
-            res = img.resize((w, h))
+            w = int(W) if W is not None else int(_node.properties.get('W', 100))
+            h = int(H) if H is not None else int(_node.properties.get('H', 100))
+            quality = Quality if Quality is not None else _node.properties.get('Quality', 'Standard')
+            if quality == 'High':
+                res = img.resize((w, h), Image.Resampling.BICUBIC)
+            else:
+                # JPEG only: decode straight at a reduced scale (DCT-domain) before resizing
+                img.draft('RGB', (w, h))
+                res = img.resize((w, h), Image.Resampling.BILINEAR)
         elif action == 'Crop':
-            box = Box if Box is not None else _node.properties.get('Box', _node.properties.get('Box', [0, 0, 100, 100]))
+            box = Box if Box is not None else _node.properties.get('Box', [0, 0, 100, 100])
             res = img.crop(tuple(box))
         else:
             res = img
-        (base, ext) = os.path.splitext(Image_Path)
-        out_path = f'{base}_{int(time.time())}{ext}'
-        res.save(out_path)
+        # Encoding to disk dominates this node; skip it when only the in-memory image is consumed
+        wired = _node.wired_outputs
+        if 'Result Path' in wired or 'Result Image' not in wired:
+            (base, ext) = os.path.splitext(Image_Path)
+            out_path = f'{base}_{int(time.time())}{ext}'
+            res.save(out_path)
     except Exception as e:
         _node.logger.error(f'Image Processor Error: {e}')
     finally:
         pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
-    return out_path
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
+    result_image = None
+    if res is not None:
+        from axonpulse.nodes.media.camera import ImageObject
+        result_image = ImageObject(res)
+    return {'Result Path': out_path, 'Result Image': result_image}
@@ -10,12 +10,16 @@ from axonpulse.core.dependencies import DependencyManager
 
 from axonpulse.core.video_builder.models import SceneList, SceneObject, AssetType
 
+from axonpulse.core.video_builder.renderer import render_in_worker
+
 from typing import Any, List, Dict, Optional
 
 from axonpulse.core.types import DataType, TypeCaster
 
 from axonpulse.nodes.decorators import axon_node
 
+from axonpulse.core.constants import ACTIVE_FLOW
+
 VideoFileClip = None
 
 AudioFileClip = None
@@ -47,38 +51,44 @@ def ensure_moviepy():
     return False
 
 @axon_node(category="Media/Video", version="2.3.0", node_label="Render Timeline")
-def RenderTimelineNode(Compiled_Timeline: Any, Output_Path: str = 'output.mp4', Width: float = 1920, Height: float = 1080, FPS: float = 24, Auto_Ducking: bool = True, Ducking_Factor: float = 0.2, Ducking_Ramp: float = 0.5, _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
+def RenderTimelineNode(Compiled_Timeline: Any, Output_Path: str = 'output.mp4', Width: float = 1920, Height: float = 1080, FPS: float = 24, Auto_Ducking: bool = True, Ducking_Factor: float = 0.2, Ducking_Ramp: float = 0.5, Codec: str = 'auto', HW_Accel: str = 'auto', Threads: float = 0, Use_Cache: bool = True, _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Renders a compiled timeline into a video file.
 
 Uses MoviePy to process a 'SceneList' (timeline) and export it 
 as an MP4, GIF, or other video format. Supports resolution, FPS, 
-and audio ducking controls.
+and audio ducking controls. Rendering runs in a worker process and 
+uses a hardware H.264 encoder (NVENC etc.) when FFmpeg reports one. 
+Timelines that only play whole, already matching videos back to back 
+are joined by stream copy without re-encoding.
 
 Inputs:
 - Flow: Trigger the render.
-- Compiled Timeline: The SceneList data to render.
+- Compiled Timeline: The SceneList data to render (scene list or its JSON text).
 - Output Path: Destination file path (default 'output.mp4').
 - Width: Output video width (default 1920).
 - Height: Output video height (default 1080).
 - FPS: Frames per second (default 24).
 - Auto Ducking: Whether to automatically lower background music for speech.
+- Codec: 'auto'/'h264', 'hevc', or an explicit FFmpeg encoder name.
+- HW Accel: GPU backend for encoding and source decoding: 'auto', 'cuda', 'qsv', 'videotoolbox', 'amf' or 'none'.
+- Threads: Frame-composition worker processes (0 = one per CPU, 1 = single pipeline).
+- Use Cache: Reuse previously rendered segments that are unchanged (~/.axonpulse/render_cache).
 
 Outputs:
 - Flow: Pulse triggered once rendering completes."""
     if not Compiled_Timeline:
         _node.logger.warning('No Compiled Timeline provided.')
-        _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+        _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
         return True
     else:
         pass
     if not ensure_moviepy():
         _node.logger.error('moviepy not installed.')
-        _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+        _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
         return True
     else:
         pass
     try:
-        sl = SceneList.deserialize(Compiled_Timeline)
         out_path = Output_Path or _node.properties.get('Output Path', 'output.mp4')
         width = int(kwargs.get('Width') or _node.properties.get('Width', 1920))
         height = int(kwargs.get('Height') or _node.properties.get('Height', 1080))
@@ -86,10 +96,19 @@ Outputs:
         auto_ducking = kwargs.get('Auto Ducking') if kwargs.get('Auto Ducking') is not None else _node.properties.get('Auto Ducking', True)
         ducking_factor = kwargs.get('Ducking Factor') if kwargs.get('Ducking Factor') is not None else _node.properties.get('Ducking Factor', 0.2)
         ducking_ramp = kwargs.get('Ducking Ramp') if kwargs.get('Ducking Ramp') is not None else _node.properties.get('Ducking Ramp', 0.5)
+        codec = Codec or _node.properties.get('Codec', 'auto')
+        hw_accel = HW_Accel or _node.properties.get('Hw Accel', 'auto')
+        threads = int(Threads if Threads is not None else _node.properties.get('Threads', 0))
+        use_cache = Use_Cache if Use_Cache is not None else _node.properties.get('Use Cache', True)
+        # Saved timelines may arrive as JSON text; the renderer works on the scene dicts
+        timeline = SceneList.load(Compiled_Timeline)
         _node.logger.info(f'Rendering timeline to {out_path} at {width}x{height} @ {fps}fps')
+        # Composition and encoding run in a spawned worker so the engine keeps its GIL
+        render_in_worker(timeline, out_path, use_cache=bool(use_cache), width=width, height=height, fps=fps, auto_ducking=auto_ducking, ducking_factor=ducking_factor, ducking_ramp=ducking_ramp, codec=codec, hw_accel=hw_accel, threads=threads)
+        _node.logger.info(f'Render complete: {out_path}')
     except Exception as e:
         _node.logger.error(f'Render Error: {e}')
     finally:
         pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
+    _bridge.set(_node._k_active, ACTIVE_FLOW, _node.name)
     return True
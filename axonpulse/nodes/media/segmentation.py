@@ -1,8 +1,12 @@
 from axonpulse.core.super_node import SuperNode
 from axonpulse.nodes.registry import NodeRegistry
 from axonpulse.core.types import DataType
+from axonpulse.core.constants import ACTIVE_FLOW
 from axonpulse.core.dependencies import DependencyManager
 import os
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Lazy Globals
 sam_build = None
@@ -11,6 +15,14 @@ sam_auto_mask_cls = None
 np = None
 pil_image = None
 
+# Images per ViT encoder forward when embedding an Images batch
+_EMBED_BATCH = 4
+# Image embeddings kept per node (SAM ViT embeddings are 256x64x64 each)
+_EMBED_CACHE_SIZE = 8
+# File reads and PIL decodes release the GIL, so an Images list is loaded concurrently
+_LOAD_EXECUTOR = None
+_LOAD_WORKERS = 4
+
 def ensure_sam():
     global sam_build, sam_predictor_cls, sam_auto_mask_cls, np, pil_image
     if sam_build: return True
@@ -36,6 +48,13 @@ def ensure_sam():
     return True
 
 
+def unpack_masks(segments):
+    """Decodes a segment table's bit-packed masks column to a bool [N,H,W] array."""
+    import numpy as _np
+    w = segments["mask_shape"][1]
+    return _np.unpackbits(segments["masks"], axis=-1, count=w).astype(bool)
+
+
 @NodeRegistry.register("Image Segmentation Anything", "Media/Graphics")
 class ImageSegmentationAnythingNode(SuperNode):
     """
@@ -47,6 +66,7 @@ class ImageSegmentationAnythingNode(SuperNode):
     Inputs:
     - Flow: Trigger the segmentation process.
     - Image: The source image (Path, PIL Object, or Numpy Array).
+    - Images: Optional list of images; prompts are applied to each using one batched encoder pass.
     - Points: List of [x, y] coordinates for targeted segmentation.
     - Labels: List of labels for the points (1 for foreground, 0 for background).
     - Box: Bounding box for targeted segmentation [x, y, w, h].
@@ -56,7 +76,9 @@ class ImageSegmentationAnythingNode(SuperNode):
     
     Outputs:
     - Flow: Triggered after segmentation completes.
-    - Segments: List of detected mask objects with bbox and compliance data.
+    - Segments: Columnar segment table {masks [N,H,ceil(W/8)] bit-packed along x
+      (see unpack_masks), mask_shape (H, W), bboxes [N,4] (x, y, w, h), areas [N],
+      scores [N]}, ordered best-first. A list of tables when Images is used.
     - Count: The total number of identified segments.
     """
     version = "2.3.0"
@@ -72,6 +94,9 @@ class ImageSegmentationAnythingNode(SuperNode):
         self._sam = None
         self._predictor = None
         self._generator = None
+        self._dtype = None
+        self._device = None
+        self._embed_cache = OrderedDict() # image digest -> predictor state
 
         self.define_schema()
         self.register_handlers()
@@ -83,6 +108,7 @@ class ImageSegmentationAnythingNode(SuperNode):
         self.input_schema = {
             "Flow": DataType.FLOW,
             "Image": DataType.ANY,
+            "Images": DataType.LIST,
             "Points": DataType.LIST,
             "Labels": DataType.LIST,
             "Box": DataType.LIST,
@@ -92,19 +118,21 @@ class ImageSegmentationAnythingNode(SuperNode):
         }
         self.output_schema = {
             "Flow": DataType.FLOW,
-            "Segments": DataType.LIST,
+            # One table for Image, a list of tables for Images
+            "Segments": DataType.ANY,
             "Count": DataType.NUMBER
         }
 
-    def _load_model(self):
+    def _load_model(self, **kwargs):
         """Lazy-load SAM model on first use."""
         if self._sam is not None:
             return
 
         import torch
+        device = "cuda" if torch.cuda.is_available() else "cpu"
         # Fallback with legacy support
-        model_type = kwargs.get("Model Type") or self.properties.get("Model Type", self.properties.get("ModelType", "vit_b"))
-        checkpoint = kwargs.get("Checkpoint") or self.properties.get("Checkpoint", self.properties.get("Checkpoint", ""))
+        model_type = self._get(kwargs, "Model Type", "ModelType", default="vit_b")
+        checkpoint = self._get(kwargs, "Checkpoint", default="")
 
         if not checkpoint:
             raise RuntimeError(
@@ -134,13 +162,30 @@ class ImageSegmentationAnythingNode(SuperNode):
                     f"huggingface_hub not installed for auto-download."
                 )
 
-        self._sam = sam_build[model_type](checkpoint=checkpoint).to(device)
+        sam = sam_build[model_type](checkpoint=checkpoint).to(device)
+        if device == "cuda":
+            # Half-precision ViT backbone; the small prompt/mask decoders keep FP32 weights under autocast.
+            # Always fp16: SAM hands decoder outputs to .numpy(), which has no bfloat16.
+            self._dtype = torch.float16
+            sam.image_encoder.to(dtype=self._dtype)
+            if hasattr(torch, "compile"):
+                # SamPredictor always feeds a padded 1024x1024 tensor, so the graph is captured once
+                sam.image_encoder = torch.compile(sam.image_encoder, mode="reduce-overhead")
+        self._sam = sam
+        self._device = device
         self._predictor = sam_predictor_cls(self._sam)
         self._generator = sam_auto_mask_cls(
             self._sam,
-            points_per_side=int(kwargs.get("Points Per Side") or self.properties.get("Points Per Side", self.properties.get("PointsPerSide", 32)))
+            points_per_side=int(self._get(kwargs, "Points Per Side", "PointsPerSide", default=32))
         )
-        self.logger.info(f"SAM {model_type} loaded on {device}.")
+        self.logger.info(f"SAM {model_type} loaded on {device} ({self._dtype or torch.float32}).")
+
+    def _inference(self):
+        """Autocast context for the reduced-precision encoder (plain inference mode on CPU)."""
+        import torch
+        if self._dtype is None:
+            return torch.inference_mode()
+        return torch.autocast(device_type="cuda", dtype=self._dtype)
 
     def _load_image(self, image_input):
         """Convert various image inputs to a numpy RGB array."""
@@ -148,36 +193,166 @@ class ImageSegmentationAnythingNode(SuperNode):
             if not os.path.exists(image_input):
                 raise RuntimeError(f"[{self.name}] Image file not found: {image_input}")
             img = pil_image.open(image_input).convert("RGB")
-            return np.array(img)
+            return np.asarray(img)
         elif hasattr(image_input, 'mode'):
-            # PIL Image
-            return np.array(image_input.convert("RGB"))
+            # PIL Image (asarray: no extra copy of the converted buffer)
+            img = image_input if image_input.mode == "RGB" else image_input.convert("RGB")
+            return np.asarray(img)
         elif isinstance(image_input, np.ndarray):
-            return image_input
+            # Fast path: already the contiguous uint8 HxWx3 layout SAM expects
+            if (image_input.dtype == np.uint8 and image_input.ndim == 3
+                    and image_input.shape[2] == 3 and image_input.flags.c_contiguous):
+                return image_input
+            arr = image_input
+            if arr.ndim == 2:
+                arr = np.stack([arr] * 3, axis=-1)
+            elif arr.ndim == 3 and arr.shape[2] == 4:
+                arr = arr[..., :3]
+            if arr.ndim != 3 or arr.shape[2] != 3:
+                raise RuntimeError(f"[{self.name}] Unsupported image array shape: {image_input.shape}")
+            if arr.dtype != np.uint8:
+                arr = np.clip(arr, 0, 255).astype(np.uint8)
+            return np.ascontiguousarray(arr)
         else:
             raise RuntimeError(f"[{self.name}] Unsupported image type: {type(image_input)}")
 
+    def _load_images(self, inputs):
+        """Loads several images, overlapping their reads/decodes on a shared thread pool."""
+        global _LOAD_EXECUTOR
+        if len(inputs) < 2:
+            return [self._load_image(img) for img in inputs]
+        if _LOAD_EXECUTOR is None:
+            _LOAD_EXECUTOR = ThreadPoolExecutor(max_workers=_LOAD_WORKERS, thread_name_prefix='SAMImageLoad')
+        return list(_LOAD_EXECUTOR.map(self._load_image, inputs))
+
+    def _embed_images(self, image_arrays):
+        """
+        Returns each image's predictor state (original size, input size, features).
+        Images already in the LRU embedding cache skip the encoder; the rest are
+        run through the ViT encoder in batches.
+        """
+        import torch
+        keys = []
+        for img in image_arrays:
+            h = hashlib.blake2b(np.ascontiguousarray(img), digest_size=16)
+            h.update(repr((img.shape, img.dtype.str)).encode())
+            keys.append(h.digest())
+
+        states = {}
+        missing = []
+        for key, img in zip(keys, image_arrays):
+            if key in states:
+                continue
+            cached = self._embed_cache.get(key)
+            if cached is not None:
+                self._embed_cache.move_to_end(key)
+                states[key] = cached
+            else:
+                states[key] = None
+                missing.append((key, img))
+
+        transform = self._predictor.transform
+        for start in range(0, len(missing), _EMBED_BATCH):
+            chunk = missing[start:start + _EMBED_BATCH]
+            sizes, tensors = [], []
+            for _, img in chunk:
+                resized = transform.apply_image(img)
+                t = torch.as_tensor(resized, device=self._device).permute(2, 0, 1).contiguous()
+                sizes.append((img.shape[:2], tuple(t.shape[-2:])))
+                # preprocess normalizes and pads to the encoder's fixed square input
+                tensors.append(self._sam.preprocess(t[None])[0])
+            with torch.inference_mode(), self._inference():
+                features = self._sam.image_encoder(torch.stack(tensors))
+            for i, ((key, _), (original_size, input_size)) in enumerate(zip(chunk, sizes)):
+                state = (original_size, input_size, features[i:i + 1])
+                states[key] = state
+                self._embed_cache[key] = state
+                if len(self._embed_cache) > _EMBED_CACHE_SIZE:
+                    self._embed_cache.popitem(last=False)
+
+        return [states[key] for key in keys]
+
+    def _prime_predictor(self, original_size, input_size, features):
+        """Equivalent of SamPredictor.set_image with a precomputed embedding."""
+        p = self._predictor
+        p.reset_image()
+        p.original_size = original_size
+        p.input_size = input_size
+        p.features = features
+        p.is_image_set = True
+
+    def _segment_prompt(self, point_coords, point_labels, box_arr):
+        """Predicts masks for the prompts against the primed predictor image."""
+        with self._inference():
+            masks, scores, _ = self._predictor.predict(
+                point_coords=point_coords,
+                point_labels=point_labels,
+                box=box_arr,
+                multimask_output=True
+            )
+
+        # Sort by score (best first)
+        order = scores.argsort()[::-1]
+        masks = masks[order]
+        scores = scores[order].astype(np.float32)
+
+        # One reduction gives every area; empty masks are the zero-area rows
+        areas = masks.reshape(len(masks), -1).sum(axis=1, dtype=np.int64)
+        keep = areas > 0
+
+        # Batched bbox: project the stack onto rows/cols once, then find first/last hits
+        rows = masks.any(axis=2)  # (N, H)
+        cols = masks.any(axis=1)  # (N, W)
+        y1 = rows.argmax(axis=1)
+        y2 = rows.shape[1] - 1 - rows[:, ::-1].argmax(axis=1)
+        x1 = cols.argmax(axis=1)
+        x2 = cols.shape[1] - 1 - cols[:, ::-1].argmax(axis=1)
+        bboxes = np.stack([x1, y1, x2 - x1, y2 - y1], axis=1).astype(np.int32)
+
+        if not keep.all():
+            masks, bboxes, areas, scores = masks[keep], bboxes[keep], areas[keep], scores[keep]
+        return {"masks": np.packbits(masks, axis=-1), "mask_shape": masks.shape[1:],
+                "bboxes": bboxes, "areas": areas, "scores": scores}
+
+    def _segment_auto(self, image_array):
+        """Segments everything in the image with the automatic mask generator."""
+        with self._inference():
+            raw_masks = self._generator.generate(image_array)
+
+        # sorted by area (largest first)
+        raw_masks.sort(key=lambda x: x["area"], reverse=True)
+
+        n = len(raw_masks)
+        h, w = image_array.shape[:2]
+        # Pack each mask as it is stacked so the full bool stack is never materialized
+        masks = (np.stack([np.packbits(m["segmentation"], axis=-1) for m in raw_masks]) if n
+                 else np.zeros((0, h, (w + 7) // 8), dtype=np.uint8))
+        bboxes = np.array([m["bbox"] for m in raw_masks], dtype=np.int32).reshape(n, 4)
+        areas = np.array([m["area"] for m in raw_masks], dtype=np.int64)
+        scores = np.array([m.get("predicted_iou", m.get("stability_score", 0.0)) for m in raw_masks],
+                          dtype=np.float32)
+        return {"masks": masks, "mask_shape": (h, w),
+                "bboxes": bboxes, "areas": areas, "scores": scores}
+
     def do_work(self, **kwargs):
         if not ensure_sam():
             raise RuntimeError(f"[{self.name}] segment-anything dependency not installed.")
 
         image_input = kwargs.get("Image")
+        images_input = kwargs.get("Images")
         points = kwargs.get("Points")
         labels = kwargs.get("Labels")
         box = kwargs.get("Box")
 
-        if not image_input:
+        # Never truth-test the inputs: an ndarray Image has no single truth value
+        if image_input is None and not images_input:
             raise RuntimeError(f"[{self.name}] No image provided.")
 
-        self._load_model()
-        image_array = self._load_image(image_input)
-
-        segments = []
+        self._load_model(**kwargs)
+        image_arrays = self._load_images(images_input if images_input else [image_input])
 
         if points is not None or box is not None:
-            # Prompt Mode
-            self._predictor.set_image(image_array)
-
+            # Prompt Mode: cached or batched embeddings, then the same prompts against every image
             point_coords = None
             point_labels = None
             box_arr = None
@@ -189,52 +364,28 @@ class ImageSegmentationAnythingNode(SuperNode):
             if box is not None:
                 box_arr = np.array(box)
 
-            masks, scores, _ = self._predictor.predict(
-                point_coords=point_coords,
-                point_labels=point_labels,
-                box=box_arr,
-                multimask_output=True
-            )
-
-            # Sort by score (best first)
-            sorted_indices = scores.argsort()[::-1]
-            for i in sorted_indices:
-                mask = masks[i]
-                ys, xs = np.where(mask)
-                if len(xs) == 0:
-                    continue
-                x1, y1 = int(xs.min()), int(ys.min())
-                x2, y2 = int(xs.max()), int(ys.max())
-                segments.append({
-                    "mask": mask,
-                    "bbox": [x1, y1, x2 - x1, y2 - y1],
-                    "area": int(mask.sum()),
-                    "score": float(scores[i])
-                })
+            tables = []
+            for state in self._embed_images(image_arrays):
+                self._prime_predictor(*state)
+                tables.append(self._segment_prompt(point_coords, point_labels, box_arr))
         else:
             # Auto Mode — segment everything
-            raw_masks = self._generator.generate(image_array)
-
-            # sorted by area (largest first)
-            raw_masks.sort(key=lambda x: x["area"], reverse=True)
-
-            for m in raw_masks:
-                segments.append({
-                    "mask": m["segmentation"],
-                    "bbox": list(m["bbox"]),
-                    "area": int(m["area"]),
-                    "score": float(m.get("predicted_iou", m.get("stability_score", 0.0)))
-                })
+            tables = [self._segment_auto(img) for img in image_arrays]
 
-        count = len(segments)
+        # Columnar layout: one array per field, row i across all columns is segment i
+        segments = tables if images_input else tables[0]
+        count = sum(len(t["areas"]) for t in tables)
         self.bridge.set(f"{self.node_id}_Segments", segments, self.name)
         self.bridge.set(f"{self.node_id}_Count", count, self.name)
         self.logger.info(f"Found {count} segments.")
-        self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+        self.bridge.set(self._k_active, ACTIVE_FLOW, self.name)
         return True
 
     def terminate(self):
         self._sam = None
         self._predictor = None
         self._generator = None
+        self._dtype = None
+        self._device = None
+        self._embed_cache.clear()
         super().terminate()
@@ -1,16 +1,46 @@
+import sys
 from axonpulse.core.node import BaseNode
 
+class _IdentifierChars(dict):
+    """str.translate table that drops non-alphanumeric characters, filled lazily per code point."""
+    def __missing__(self, codepoint):
+        keep = codepoint if chr(codepoint).isalnum() else None
+        self[codepoint] = keep
+        return keep
+
+_IDENT_TABLE = _IdentifierChars()
+
 class NodeRegistry:
     _nodes = {} # label -> node_class
     _categories = {} # category -> [labels]
+    _label_to_category = {} # label -> category (reverse of _categories)
+    _dyn_subclasses = {} # (label, base_cls, path) -> generated SubGraphNode subclass
+
+    @classmethod
+    def _detach_label(cls, label):
+        """Removes a label from the category it is listed under; returns that category."""
+        old_cat = cls._label_to_category.pop(label, None)
+        if old_cat is not None:
+            cls._categories[old_cat].remove(label)
+        return old_cat
+
+    @classmethod
+    def _attach_label(cls, label, category):
+        cat_list = cls._categories.get(category)
+        if cat_list is None:
+            cat_list = cls._categories[category] = []
+        cat_list.append(label)
+        cls._label_to_category[label] = category
 
     @classmethod
     def register(cls, label, category="General"):
+        # Labels and categories are dict keys for every lookup; keep one shared copy of each
+        label = sys.intern(label)
+        category = sys.intern(category)
+
         def decorator(node_class):
             # 1. Cleanup old category mapping if re-registering
-            for cat_list in cls._categories.values():
-                if label in cat_list:
-                    cat_list.remove(label)
+            cls._detach_label(label)
 
             # Register namespaced key (Category.Label)
             namespaced_label = f"{category}.{label}"
@@ -25,10 +55,7 @@ class NodeRegistry:
                 # Use namespaced version to be safe.
                 cls._nodes[label] = node_class # Last write wins strategy for legacy
             
-            if category not in cls._categories:
-                cls._categories[category] = []
-            if label not in cls._categories[category]:
-                cls._categories[category].append(label)
+            cls._attach_label(label, category)
                 
             # Attach metadata to class
             node_class.node_label = label
@@ -78,16 +105,20 @@ class NodeRegistry:
             return
 
         # 2. Cleanup old category mapping if re-registering
-        for cat_list in cls._categories.values():
-            if label in cat_list:
-                cat_list.remove(label)
+        label = sys.intern(label)
+        category = sys.intern(category)
+        cls._detach_label(label)
 
         base_cls = cls._nodes.get("SubGraph Node")
         if base_cls:
-             # Create dynamic class
-             # name needs to be a valid identifier
-             safe_name = "".join(x for x in label.title() if x.isalnum())
-             new_cls = type(safe_name, (base_cls,), {})
+             # Create dynamic class (reused when the same subgraph is registered again)
+             key = (label, base_cls, path)
+             new_cls = cls._dyn_subclasses.get(key)
+             if new_cls is None:
+                 # name needs to be a valid identifier
+                 safe_name = label.title().translate(_IDENT_TABLE)
+                 new_cls = type(safe_name, (base_cls,), {})
+                 cls._dyn_subclasses[key] = new_cls
              
              # Set Metadata
              new_cls.node_label = label
@@ -100,10 +131,7 @@ class NodeRegistry:
              
              # Only add to categories if NOT an alias
              if not is_alias:
-                 if category not in cls._categories:
-                     cls._categories[category] = []
-                 if label not in cls._categories[category]:
-                     cls._categories[category].append(label)
+                 cls._attach_label(label, category)
 
     @classmethod
     def is_path_registered(cls, path):
@@ -122,9 +150,7 @@ class NodeRegistry:
             del cls._nodes[label]
         
         # Cleanup category mapping
-        for cat_name, node_list in list(cls._categories.items()):
-            if label in node_list:
-                node_list.remove(label)
-            # Remove empty categories (optional, but keeps things clean)
-            if not node_list:
-                del cls._categories[cat_name]
+        cat_name = cls._detach_label(label)
+        # Remove empty categories (optional, but keeps things clean)
+        if cat_name is not None and not cls._categories[cat_name]:
+            del cls._categories[cat_name]
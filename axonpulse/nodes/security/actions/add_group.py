@@ -1,6 +1,6 @@
 from axonpulse.nodes.registry import NodeRegistry
 from axonpulse.core.types import DataType
-from .base import BaseSecurityActionNode
+from .base import BaseSecurityActionNode, security_sql
 
 @NodeRegistry.register("Add Group", "Security/Actions")
 class AddGroupNode(BaseSecurityActionNode):
@@ -38,27 +38,25 @@ class AddGroupNode(BaseSecurityActionNode):
 
     def add_group(self, Group_Name=None, **kwargs):
         # Fallback with legacy support
-        Group_Name = Group_Name or kwargs.get("Group Name") or self.properties.get("Group Name", self.properties.get("GroupName"))
+        Group_Name = Group_Name if Group_Name is not None else self._get(kwargs, "Group Name", "GroupName")
         pid = self.get_security_pid()
         if not pid:
             self.logger.error("No Security Provider found.")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
             
-        Connection = self.bridge.get(f"{pid}_Connection")
-        table = self.bridge.get(f"{pid}_Table Name") or "Groups"
+        Connection, table = self.get_security_config(pid, "Groups")
 
         if not Group_Name:
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
         try:
-            conn = self.get_connection(Connection)
-            cursor = conn.cursor()
-            cursor.execute(f"INSERT INTO {table} (GroupName) VALUES (?)", [Group_Name])
-            conn.commit()
-            conn.close()
-            self.bridge.set(f"{self.node_id}_Success", True, self.name)
+            with self.security_connection(Connection) as conn:
+                cursor = conn.cursor()
+                cursor.execute(security_sql("INSERT INTO {table} (GroupName) VALUES (?)", table), [Group_Name])
+                conn.commit()
+            self.bridge.set(self._k_success, True, self.name)
         except Exception as e:
             self.logger.error(f"Error: {e}")
-            self.bridge.set(f"{self.node_id}_Success", False, self.name)
+            self.bridge.set(self._k_success, False, self.name)
         return True
@@ -1,6 +1,6 @@
 from axonpulse.nodes.registry import NodeRegistry
 from axonpulse.core.types import DataType
-from .base import BaseSecurityActionNode
+from .base import BaseSecurityActionNode, security_sql
 
 @NodeRegistry.register("Add Role", "Security/Actions")
 class AddRoleNode(BaseSecurityActionNode):
@@ -40,31 +40,28 @@ class AddRoleNode(BaseSecurityActionNode):
 
     def add_role(self, Role_Name=None, Permissions=None, **kwargs):
         # Fallback with legacy support
-        Role_Name = Role_Name or kwargs.get("Role Name") or self.properties.get("Role Name", self.properties.get("RoleName"))
-        Permissions = Permissions or kwargs.get("Permissions") or self.properties.get("Permissions", self.properties.get("Permissions", []))
+        Role_Name = Role_Name if Role_Name is not None else self._get(kwargs, "Role Name", "RoleName")
+        Permissions = Permissions if Permissions is not None else self._get(kwargs, "Permissions", default=[])
         pid = self.get_security_pid()
         if not pid:
             self.logger.error("No Security Provider found.")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
             
-        Connection = self.bridge.get(f"{pid}_Connection")
-        table = self.bridge.get(f"{pid}_Table Name") or "Roles"
+        Connection, table = self.get_security_config(pid, "Roles")
 
         if not Role_Name:
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
         data = {"RoleName": Role_Name, "Permissions": str(Permissions or [])}
         try:
-            conn = self.get_connection(Connection)
-            cursor = conn.cursor()
-            cols = ", ".join([f"[{k}]" for k in data.keys()])
-            placeholders = ", ".join(["?"] * len(data))
-            cursor.execute(f"INSERT INTO {table} ({cols}) VALUES ({placeholders})", list(data.values()))
-            conn.commit()
-            conn.close()
-            self.bridge.set(f"{self.node_id}_Success", True, self.name)
+            with self.security_connection(Connection) as conn:
+                cursor = conn.cursor()
+                sql = security_sql("INSERT INTO {table} ({cols}) VALUES ({placeholders})", table, tuple(data))
+                cursor.execute(sql, list(data.values()))
+                conn.commit()
+            self.bridge.set(self._k_success, True, self.name)
         except Exception as e:
             self.logger.error(f"Error: {e}")
-            self.bridge.set(f"{self.node_id}_Success", False, self.name)
+            self.bridge.set(self._k_success, False, self.name)
         return True
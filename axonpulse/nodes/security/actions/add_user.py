@@ -1,6 +1,7 @@
+import json
 from axonpulse.nodes.registry import NodeRegistry
 from axonpulse.core.types import DataType
-from .base import BaseSecurityActionNode
+from .base import BaseSecurityActionNode, security_sql
 
 @NodeRegistry.register("Add User", "Security/Actions")
 class AddUserNode(BaseSecurityActionNode):
@@ -42,34 +43,31 @@ class AddUserNode(BaseSecurityActionNode):
 
     def add_user(self, Username=None, Password=None, Groups=None, **kwargs):
         # Fallback with legacy support
-        Username = Username or kwargs.get("Username") or self.properties.get("Username", self.properties.get("Username"))
-        Password = Password or kwargs.get("Password") or self.properties.get("Password", self.properties.get("Password"))
-        Groups = Groups or kwargs.get("Groups") or self.properties.get("Groups", self.properties.get("Groups", []))
+        Username = Username if Username is not None else self._get(kwargs, "Username")
+        Password = Password if Password is not None else self._get(kwargs, "Password")
+        Groups = Groups if Groups is not None else self._get(kwargs, "Groups", default=[])
 
         pid = self.get_security_pid()
         if not pid:
             self.logger.error("No Security Provider found.")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
             
-        Connection = self.bridge.get(f"{pid}_Connection")
-        table = self.bridge.get(f"{pid}_Table Name") or "Users"
+        Connection, table = self.get_security_config(pid, "Users")
         
         if not Username:
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
-        data = {"Username": Username, "Password": Password, "Groups": str(Groups)}
+        data = {"Username": Username, "Password": Password, "Groups": json.dumps(Groups)}
         
         try:
-            conn = self.get_connection(Connection)
-            cursor = conn.cursor()
-            cols = ", ".join([f"[{k}]" for k in data.keys()])
-            placeholders = ", ".join(["?"] * len(data))
-            cursor.execute(f"INSERT INTO {table} ({cols}) VALUES ({placeholders})", list(data.values()))
-            conn.commit()
-            conn.close()
-            self.bridge.set(f"{self.node_id}_Success", True, self.name)
+            with self.security_connection(Connection) as conn:
+                cursor = conn.cursor()
+                sql = security_sql("INSERT INTO {table} ({cols}) VALUES ({placeholders})", table, tuple(data))
+                cursor.execute(sql, list(data.values()))
+                conn.commit()
+            self.bridge.set(self._k_success, True, self.name)
         except Exception as e:
             self.logger.error(f"Error: {e}")
-            self.bridge.set(f"{self.node_id}_Success", False, self.name)
+            self.bridge.set(self._k_success, False, self.name)
         return True
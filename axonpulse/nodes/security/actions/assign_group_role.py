@@ -1,6 +1,6 @@
 from axonpulse.nodes.registry import NodeRegistry
 from axonpulse.core.types import DataType
-from .base import BaseSecurityActionNode
+from .base import BaseSecurityActionNode, security_sql
 
 @NodeRegistry.register("Assign Group to Role", "Security/Actions")
 class AssignGroupRoleNode(BaseSecurityActionNode):
@@ -40,28 +40,26 @@ class AssignGroupRoleNode(BaseSecurityActionNode):
 
     def assign_role(self, Group_Name=None, Role_Name=None, **kwargs):
         # Fallback with legacy support
-        Group_Name = Group_Name or kwargs.get("Group Name") or self.properties.get("Group Name", self.properties.get("GroupName"))
-        Role_Name = Role_Name or kwargs.get("Role Name") or self.properties.get("Role Name", self.properties.get("RoleName"))
+        Group_Name = Group_Name if Group_Name is not None else self._get(kwargs, "Group Name", "GroupName")
+        Role_Name = Role_Name if Role_Name is not None else self._get(kwargs, "Role Name", "RoleName")
         pid = self.get_security_pid()
         if not pid:
             self.logger.error("No Security Provider found.")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
             
-        Connection = self.bridge.get(f"{pid}_Connection")
-        table = self.bridge.get(f"{pid}_Table Name") or "GroupRoles"
+        Connection, table = self.get_security_config(pid, "GroupRoles")
 
         if not Group_Name or not Role_Name:
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
         try:
-            conn = self.get_connection(Connection)
-            cursor = conn.cursor()
-            cursor.execute(f"INSERT INTO {table} (GroupName, RoleName) VALUES (?, ?)", [Group_Name, Role_Name])
-            conn.commit()
-            conn.close()
-            self.bridge.set(f"{self.node_id}_Success", True, self.name)
+            with self.security_connection(Connection) as conn:
+                cursor = conn.cursor()
+                cursor.execute(security_sql("INSERT INTO {table} (GroupName, RoleName) VALUES (?, ?)", table), [Group_Name, Role_Name])
+                conn.commit()
+            self.bridge.set(self._k_success, True, self.name)
         except Exception as e:
             self.logger.error(f"Error: {e}")
-            self.bridge.set(f"{self.node_id}_Success", False, self.name)
+            self.bridge.set(self._k_success, False, self.name)
         return True
@@ -1,6 +1,6 @@
 from axonpulse.nodes.registry import NodeRegistry
 from axonpulse.core.types import DataType
-from .base import BaseSecurityActionNode
+from .base import BaseSecurityActionNode, security_sql
 
 @NodeRegistry.register("Assign User to Group", "Security/Actions")
 class AssignUserGroupNode(BaseSecurityActionNode):
@@ -40,28 +40,26 @@ class AssignUserGroupNode(BaseSecurityActionNode):
 
     def assign_group(self, Username=None, Group_Name=None, **kwargs):
         # Fallback with legacy support
-        Username = Username or kwargs.get("Username") or self.properties.get("Username", self.properties.get("Username"))
-        Group_Name = Group_Name or kwargs.get("Group Name") or self.properties.get("Group Name", self.properties.get("GroupName"))
+        Username = Username if Username is not None else self._get(kwargs, "Username")
+        Group_Name = Group_Name if Group_Name is not None else self._get(kwargs, "Group Name", "GroupName")
         pid = self.get_security_pid()
         if not pid:
             self.logger.error("No Security Provider found.")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
             
-        Connection = self.bridge.get(f"{pid}_Connection")
-        table = self.bridge.get(f"{pid}_Table Name") or "UserGroups"
+        Connection, table = self.get_security_config(pid, "UserGroups")
 
         if not Username or not Group_Name:
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
         try:
-            conn = self.get_connection(Connection)
-            cursor = conn.cursor()
-            cursor.execute(f"INSERT INTO {table} (Username, GroupName) VALUES (?, ?)", [Username, Group_Name])
-            conn.commit()
-            conn.close()
-            self.bridge.set(f"{self.node_id}_Success", True, self.name)
+            with self.security_connection(Connection) as conn:
+                cursor = conn.cursor()
+                cursor.execute(security_sql("INSERT INTO {table} (Username, GroupName) VALUES (?, ?)", table), [Username, Group_Name])
+                conn.commit()
+            self.bridge.set(self._k_success, True, self.name)
         except Exception as e:
             self.logger.error(f"Error: {e}")
-            self.bridge.set(f"{self.node_id}_Success", False, self.name)
+            self.bridge.set(self._k_success, False, self.name)
         return True
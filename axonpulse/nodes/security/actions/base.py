@@ -1,14 +1,148 @@
+import atexit
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from axonpulse.nodes.database.base import BaseSQLNode
 from axonpulse.nodes.registry import NodeRegistry
 
+# Table names cannot be bound as SQL parameters, so they are validated before being spliced in
+TABLE_NAME_RE = re.compile(r"[A-Za-z0-9_]+")
+
+@lru_cache(maxsize=256)
+def security_sql(template, table, cols=()):
+    """
+    Renders a query template once per (template, table, columns). Repeat pulses get the
+    identical string back, which is also what keys the driver's prepared-statement cache.
+    Placeholders: {table}, {cols}, {placeholders}, {sets}.
+    Raises ValueError for a table name that is not a plain identifier.
+    """
+    if not TABLE_NAME_RE.fullmatch(str(table)):
+        raise ValueError(f"Invalid table name: {table!r}")
+    return template.format(
+        table=table,
+        cols=", ".join([f"[{c}]" for c in cols]),
+        placeholders=", ".join(["?"] * len(cols)),
+        sets=", ".join([f"[{c}] = ?" for c in cols]))
+
 class BaseSecurityActionNode(BaseSQLNode):
     """
     Base class for security operations like Login, User Management, etc.
     Strictly requires a 'Security Provider' context to execute.
     """
+    # One open connection per Security Provider, shared by every action node in the process.
+    # Keeping it open also keeps the driver's prepared-statement cache warm across pulses.
+    # Threads share the connection, so each execute+commit unit holds the entry's lock.
+    _pool = {} # pid -> (config_hash, connection, lock)
+    _pool_lock = threading.Lock()
+    sqlite_check_same_thread = False
+    # Applied once when a pooled SQLite connection is opened. WAL lets logins read while
+    # another action writes; busy_timeout makes SQLite wait on a lock instead of raising.
+    SQLITE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",
+    )
+
     def __init__(self, node_id, name, bridge):
         super().__init__(node_id, name, bridge)
         self.required_providers = ["Security Provider"]
+        # Bridge keys built once instead of per pulse
+        self._k_success = f"{self.node_id}_Success"
+        self._pid_keys = {} # pid -> (connection key, table key)
+        self._local_lock = threading.Lock()
 
     def get_security_pid(self):
         return self.get_provider_id("Security Provider")
+
+    def get_security_config(self, pid, default_table):
+        """Returns (connection config, table name) published by the Security Provider."""
+        keys = self._pid_keys.get(pid)
+        if keys is None:
+            keys = self._pid_keys[pid] = (f"{pid}_Connection", f"{pid}_Table Name")
+        return self.bridge.get(keys[0]), self.bridge.get(keys[1]) or default_table
+
+    def get_connection(self, config_or_id):
+        return self._checkout(config_or_id)[0]
+
+    @contextmanager
+    def security_connection(self, config_or_id):
+        """
+        Yields the Security Provider's connection with its lock held for the whole block, so
+        one node's commit() never lands in the middle of another thread's transaction.
+        Work left uncommitted when the block raises is rolled back before the lock is released.
+        """
+        conn, lock = self._checkout(config_or_id)
+        with lock:
+            try:
+                yield conn
+            except Exception:
+                rollback = getattr(conn, "rollback", None)
+                if rollback:
+                    try: rollback()
+                    except sqlite3.Error: pass
+                raise
+
+    def _checkout(self, config_or_id):
+        """Returns (connection, lock) from the pool, opening the connection on first use."""
+        pid = self.get_security_pid()
+        if not pid or not isinstance(config_or_id, dict):
+            # Unpooled connections belong to this node alone; the lock only keeps its own threads apart
+            return super().get_connection(config_or_id), self._local_lock
+
+        try:
+            config_hash = hash(frozenset(config_or_id.items()))
+        except TypeError:
+            config_hash = str(config_or_id)
+
+        with self._pool_lock:
+            entry = self._pool.get(pid)
+            if entry and entry[0] == config_hash:
+                return entry[1], entry[2]
+
+            # Never let the base class close a pooled connection it did not open
+            self._active_connection = None
+            conn = super().get_connection(config_or_id)
+            self._active_connection = None
+            if entry:
+                self._close_entry(entry)
+            lock = threading.Lock()
+            if conn:
+                if isinstance(conn, sqlite3.Connection):
+                    self._tune_sqlite(conn)
+                self._pool[pid] = (config_hash, conn, lock)
+            return conn, lock
+
+    @staticmethod
+    def _close_entry(entry):
+        # Waits for any in-flight unit on the old connection before closing it
+        with entry[2]:
+            try: entry[1].close()
+            except sqlite3.Error: pass
+
+    def _tune_sqlite(self, conn):
+        try:
+            for pragma in self.SQLITE_PRAGMAS:
+                conn.execute(pragma)
+        except Exception as e:
+            self.logger.warning(f"SQLite tuning skipped: {e}")
+
+    @classmethod
+    def release_connection(cls, pid):
+        """Closes the pooled connection of one Security Provider (called when its scope ends)."""
+        with cls._pool_lock:
+            entry = cls._pool.pop(pid, None)
+        if entry:
+            cls._close_entry(entry)
+
+    @classmethod
+    def close_pool(cls):
+        with cls._pool_lock:
+            for entry in cls._pool.values():
+                cls._close_entry(entry)
+            cls._pool.clear()
+
+atexit.register(BaseSecurityActionNode.close_pool)
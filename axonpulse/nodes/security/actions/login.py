@@ -1,7 +1,20 @@
+import ast
+import json
 import time
 from axonpulse.nodes.registry import NodeRegistry
 from axonpulse.core.types import DataType
-from .base import BaseSecurityActionNode
+from .base import BaseSecurityActionNode, security_sql
+
+def _parse_groups(raw):
+    """Decodes a stored Groups column: JSON list, or a legacy Python-repr list."""
+    try:
+        return json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        pass
+    try:
+        return ast.literal_eval(raw)
+    except (ValueError, SyntaxError, TypeError):
+        return None
 
 @NodeRegistry.register("Log In", "Security/Actions")
 class LoginNode(BaseSecurityActionNode):
@@ -23,6 +36,7 @@ class LoginNode(BaseSecurityActionNode):
 
     def __init__(self, node_id, name, bridge):
         super().__init__(node_id, name, bridge)
+        self._k_authenticated = f"{self.node_id}_Authenticated"
         self.define_schema()
         self.register_handlers()
 
@@ -43,9 +57,9 @@ class LoginNode(BaseSecurityActionNode):
 
     def login(self, Username=None, Password=None, **kwargs):
         # Fallback with legacy support
-        Username = Username or kwargs.get("Username") or self.properties.get("Username", self.properties.get("Username"))
+        Username = Username if Username is not None else self._get(kwargs, "Username")
         # Password usually not stored in properties for security, but can be
-        Password = Password or kwargs.get("Password") or self.properties.get("Password", self.properties.get("Password"))
+        Password = Password if Password is not None else self._get(kwargs, "Password")
 
         pid = self.get_security_pid()
         if not pid:
@@ -54,33 +68,33 @@ class LoginNode(BaseSecurityActionNode):
 
         if not Username:
             self.logger.warning("Login attempt with empty username.")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Error Flow"], self.name)
+            self.bridge.set(self._k_active, ["Error Flow"], self.name)
             return True
 
-        Connection = self.bridge.get(f"{pid}_Connection")
-        table = self.bridge.get(f"{pid}_Table Name") or "Users"
+        Connection, table = self.get_security_config(pid, "Users")
         
         try:
-            conn = self.get_connection(Connection)
-            cursor = conn.cursor()
-            
-            # Basic SQL injection check? Parameterized query handles it.
-            query = f"SELECT * FROM {table} WHERE Username = ? AND Password = ?"
-            cursor.execute(query, [Username, Password])
-            user_record = cursor.fetchone()
+            with self.security_connection(Connection) as conn:
+                cursor = conn.cursor()
+                
+                # Basic SQL injection check? Parameterized query handles it.
+                query = security_sql("SELECT * FROM {table} WHERE Username = ? AND Password = ?", table)
+                cursor.execute(query, [Username, Password])
+                user_record = cursor.fetchone()
             
             if user_record:
                 use_verify = self.bridge.get(f"{pid}_Use Verify")
                 
                 if use_verify:
-                    self.bridge.set(f"{pid}_Authenticated", False, self.name)
-                    self.bridge.set(f"{pid}_Pending_Verify", Username, self.name)
-                    self.bridge.set(f"{self.node_id}_Authenticated", True, self.name)
-                    self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+                    self.bridge.set_batch({
+                        f"{pid}_Authenticated": False,
+                        f"{pid}_Pending_Verify": Username,
+                        self._k_authenticated: True,
+                        self._k_active: ["Flow"]
+                    }, self.name)
                 else:
                     token = f"TOKEN_{pid}_{int(time.time())}"
-                    self.bridge.set(f"{pid}_Token", token, self.name)
-                    self.bridge.set(f"{pid}_Authenticated", True, self.name)
+                    self.bridge.set_batch({f"{pid}_Token": token, f"{pid}_Authenticated": True}, self.name)
                     
                     # Update User Provider
                     up_id = self.get_provider_id("User Provider")
@@ -88,22 +102,21 @@ class LoginNode(BaseSecurityActionNode):
                         up_node = self.bridge.get(up_id)
                         if up_node and hasattr(up_node, "set_user"):
                             groups = ["Default"]
-                            try:
-                                if "Groups" in user_record.keys():
-                                    groups = eval(user_record["Groups"])
-                            except: pass
+                            if "Groups" in user_record.keys() and user_record["Groups"]:
+                                groups = _parse_groups(user_record["Groups"]) or groups
                             up_node.set_user(Username, roles=["User"], groups=groups)
 
-                    self.bridge.set(f"{self.node_id}_Authenticated", True, self.name)
-                    self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+                    self.bridge.set_batch({self._k_authenticated: True, self._k_active: ["Flow"]}, self.name)
                     return True
             else:
-                self.bridge.set(f"{pid}_Authenticated", False, self.name)
-                self.bridge.set(f"{self.node_id}_Authenticated", False, self.name)
-                self.bridge.set(f"{self.node_id}_ActivePorts", ["Error Flow"], self.name)
+                self.bridge.set_batch({
+                    f"{pid}_Authenticated": False,
+                    self._k_authenticated: False,
+                    self._k_active: ["Error Flow"]
+                }, self.name)
                 return True
                 
         except Exception as e:
             self.logger.error(f"Error: {e}")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Error Flow"], self.name)
+            self.bridge.set(self._k_active, ["Error Flow"], self.name)
         return True
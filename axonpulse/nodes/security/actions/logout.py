@@ -34,10 +34,13 @@ class LogoutNode(BaseSecurityActionNode):
 
     def logout(self, **kwargs):
         pid = self.get_security_pid()
+        batch = {self._k_active: ["Flow"]}
         if pid:
-            self.bridge.set(f"{pid}_Token", None, self.name)
-            self.bridge.set(f"{pid}_Authenticated", False, self.name)
-            self.bridge.set(f"{pid}_Pending_Verify", None, self.name)
+            batch.update({
+                f"{pid}_Token": None,
+                f"{pid}_Authenticated": False,
+                f"{pid}_Pending_Verify": None
+            })
         
-        self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+        self.bridge.set_batch(batch, self.name)
         return True
@@ -1,6 +1,6 @@
 from axonpulse.nodes.registry import NodeRegistry
-from axonpulse.core.types import DataType
-from .base import BaseSecurityActionNode
+from axonpulse.core.types import DataType, TypeCaster
+from .base import BaseSecurityActionNode, security_sql
 
 @NodeRegistry.register("Register", "Security/Actions")
 class RegisterNode(BaseSecurityActionNode):
@@ -13,10 +13,12 @@ class RegisterNode(BaseSecurityActionNode):
     - Username: The desired login name.
     - Password: The primary password entry.
     - Confirm Password: Must match the Password input to succeed.
+    - Users: Optional bulk list of [Username, Password] pairs or
+      {"Username", "Password"} dicts, inserted in one batch (replaces the single user).
     
     Outputs:
     - Flow: Triggered after the registration attempt.
-    - Success: True if the account was created successfully.
+    - Success: True if every account was created successfully.
     """
     version = "2.3.0"
 
@@ -33,49 +35,69 @@ class RegisterNode(BaseSecurityActionNode):
             "Flow": DataType.FLOW,
             "Username": DataType.STRING,
             "Password": DataType.PASSWORD,
-            "Confirm Password": DataType.PASSWORD
+            "Confirm Password": DataType.PASSWORD,
+            "Users": DataType.LIST
         }
         self.output_schema = {
             "Flow": DataType.FLOW,
             "Success": DataType.BOOLEAN
         }
 
-    def register_user(self, Username=None, Password=None, Confirm_Password=None, **kwargs):
+    def _bulk_rows(self, users):
+        rows = []
+        for entry in users:
+            if isinstance(entry, dict):
+                user, pwd = entry.get("Username"), entry.get("Password")
+            elif isinstance(entry, (list, tuple)) and len(entry) >= 2:
+                user, pwd = entry[0], entry[1]
+            else:
+                continue
+            if user and pwd:
+                # Same hashing the Password port applies to single registrations
+                rows.append((str(user), TypeCaster.cast(pwd, DataType.PASSWORD)))
+        return rows
+
+    def register_user(self, Username=None, Password=None, Confirm_Password=None, Users=None, **kwargs):
         # Fallback with legacy support
-        Username = Username or kwargs.get("Username") or self.properties.get("Username", self.properties.get("Username"))
-        Password = Password or kwargs.get("Password") or self.properties.get("Password", self.properties.get("Password"))
+        Username = Username if Username is not None else self._get(kwargs, "Username")
+        Password = Password if Password is not None else self._get(kwargs, "Password")
         
-        if not Username or not Password:
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+        if Users:
+            users = self._bulk_rows(Users)
+        elif not Username or not Password:
+            self.bridge.set(self._k_active, ["Flow"], self.name)
+            return True
+        elif Password != Confirm_Password:
+            self.bridge.set_batch({self._k_success: False, self._k_active: ["Flow"]}, self.name)
             return True
-        if Password != Confirm_Password:
-            self.bridge.set(f"{self.node_id}_Success", False, self.name)
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+        else:
+            users = [(Username, Password)]
+        if not users:
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
         pid = self.get_security_pid()
         if not pid:
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
 
-        Connection = self.bridge.get(f"{pid}_Connection")
-        table = self.bridge.get(f"{pid}_Table Name") or "Users"
+        Connection, table = self.get_security_config(pid, "Users")
 
         try:
-            conn = self.get_connection(Connection)
-            cursor = conn.cursor()
+            with self.security_connection(Connection) as conn:
+                cursor = conn.cursor()
             
-            cursor.execute(f"SELECT Username FROM {table} WHERE Username = ?", [Username])
-            if cursor.fetchone():
-                self.bridge.set(f"{self.node_id}_Success", False, self.name)
-            else:
-                cursor.execute(f"INSERT INTO {table} (Username, Password, Groups) VALUES (?, ?, ?)", 
-                               [Username, Password, "['Default']"])
+                # Existence check folded into the INSERT: one statement, one commit for the whole batch,
+                # and no UNIQUE constraint required on the user table
+                cursor.executemany(
+                    security_sql("INSERT INTO {table} (Username, Password, Groups) SELECT ?, ?, ? "
+                                 "WHERE NOT EXISTS (SELECT 1 FROM {table} WHERE Username = ?)", table),
+                    [(u, p, '["Default"]', u) for u, p in users])
                 conn.commit()
-                self.bridge.set(f"{self.node_id}_Success", True, self.name)
-            
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set_batch({
+                self._k_success: cursor.rowcount == len(users),
+                self._k_active: ["Flow"]
+            }, self.name)
         except Exception as e:
             self.logger.error(f"Error: {e}")
-            self.bridge.set(f"{self.node_id}_Success", False, self.name)
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set_batch({self._k_success: False, self._k_active: ["Flow"]}, self.name)
         return True
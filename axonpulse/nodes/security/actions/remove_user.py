@@ -1,6 +1,6 @@
 from axonpulse.nodes.registry import NodeRegistry
 from axonpulse.core.types import DataType
-from .base import BaseSecurityActionNode
+from .base import BaseSecurityActionNode, security_sql
 
 @NodeRegistry.register("Remove User", "Security/Actions")
 class RemoveUserNode(BaseSecurityActionNode):
@@ -37,30 +37,28 @@ class RemoveUserNode(BaseSecurityActionNode):
 
     def remove_user(self, Username=None, **kwargs):
         # Fallback with legacy support
-        Username = Username or kwargs.get("Username") or self.properties.get("Username", self.properties.get("Username"))
+        Username = Username if Username is not None else self._get(kwargs, "Username")
         pid = self.get_security_pid()
         if not pid:
             self.logger.error("No Security Provider found.")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
             
-        Connection = self.bridge.get(f"{pid}_Connection")
-        table = self.bridge.get(f"{pid}_Table Name") or "Users"
+        Connection, table = self.get_security_config(pid, "Users")
 
         if not Username:
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
         
         try:
-            conn = self.get_connection(Connection)
-            cursor = conn.cursor()
-            cursor.execute(f"DELETE FROM [{table}] WHERE Username = ?", [Username])
-            conn.commit()
-            conn.close()
+            with self.security_connection(Connection) as conn:
+                cursor = conn.cursor()
+                cursor.execute(security_sql("DELETE FROM [{table}] WHERE Username = ?", table), [Username])
+                conn.commit()
         except Exception as e:
             self.logger.error(f"Error: {e}")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Error Flow", "Flow"], self.name)
+            self.bridge.set(self._k_active, ["Error Flow", "Flow"], self.name)
             return True
 
-        self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+        self.bridge.set(self._k_active, ["Flow"], self.name)
         return True
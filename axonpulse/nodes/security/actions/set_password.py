@@ -20,6 +20,7 @@ class SetPasswordNode(BaseSecurityActionNode):
 
     def __init__(self, node_id, name, bridge):
         super().__init__(node_id, name, bridge)
+        self._k_password = f"{self.node_id}_Password"
         self.define_schema()
         self.register_handlers()
 
@@ -38,13 +39,12 @@ class SetPasswordNode(BaseSecurityActionNode):
 
     def hash_password(self, Plaintext=None, **kwargs):
         # Fallback with legacy support
-        Plaintext = Plaintext or kwargs.get("Plaintext") or self.properties.get("Plaintext", self.properties.get("Plaintext"))
+        Plaintext = Plaintext if Plaintext is not None else self._get(kwargs, "Plaintext")
         import hashlib
         if not Plaintext:
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
             
         hashed = hashlib.sha256(str(Plaintext).encode()).hexdigest()
-        self.bridge.set(f"{self.node_id}_Password", hashed, self.name)
-        self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+        self.bridge.set_batch({self._k_password: hashed, self._k_active: ["Flow"]}, self.name)
         return True
@@ -1,6 +1,7 @@
+import json
 from axonpulse.nodes.registry import NodeRegistry
 from axonpulse.core.types import DataType
-from .base import BaseSecurityActionNode
+from .base import BaseSecurityActionNode, security_sql
 
 @NodeRegistry.register("Update User", "Security/Actions")
 class UpdateUserNode(BaseSecurityActionNode):
@@ -16,6 +17,8 @@ class UpdateUserNode(BaseSecurityActionNode):
     - Flow: Triggered after the update attempt.
     """
     version = "2.3.0"
+    # Updatable columns in canonical order: every combination maps to one cached UPDATE statement
+    UPDATE_COLUMNS = ("Password", "Email", "Roles", "Groups")
 
     def __init__(self, node_id, name, bridge):
         super().__init__(node_id, name, bridge)
@@ -40,38 +43,33 @@ class UpdateUserNode(BaseSecurityActionNode):
 
     def update_user(self, Username=None, **kwargs):
         # Fallback with legacy support
-        Username = Username or kwargs.get("Username") or self.properties.get("Username")
+        Username = Username if Username is not None else self._get(kwargs, "Username")
         pid = self.get_security_pid()
         if not pid:
             self.logger.error("No Security Provider found.")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
             
-        Connection = self.bridge.get(f"{pid}_Connection")
-        table = self.bridge.get(f"{pid}_Table Name") or "Users"
+        Connection, table = self.get_security_config(pid, "Users")
 
-        updates = {}
-        if kwargs.get("Password"): updates["Password"] = kwargs["Password"]
-        if kwargs.get("Email"): updates["Email"] = kwargs["Email"]
-        if kwargs.get("Roles"): updates["Roles"] = kwargs["Roles"]
-        if kwargs.get("Groups"): updates["Groups"] = kwargs["Groups"]
+        cols = tuple([c for c in self.UPDATE_COLUMNS if kwargs.get(c)])
         
-        if not Username or not updates:
+        if not Username or not cols:
             self.logger.warning("No Username or updates provided.")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
             return True
         
         try:
-            conn = self.get_connection(Connection)
-            cursor = conn.cursor()
-            set_clauses = [f"[{k}] = ?" for k in updates.keys()]
-            query = f"UPDATE [{table}] SET {', '.join(set_clauses)} WHERE Username = ?"
-            params = list(updates.values()) + [Username]
-            cursor.execute(query, params)
-            conn.commit()
-            conn.close()
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            with self.security_connection(Connection) as conn:
+                cursor = conn.cursor()
+                query = security_sql("UPDATE [{table}] SET {sets} WHERE Username = ?", table, cols)
+                # Lists are stored as JSON, matching Add User
+                params = [json.dumps(v) if isinstance(v, (list, tuple)) else v for v in (kwargs[c] for c in cols)]
+                params.append(Username)
+                cursor.execute(query, params)
+                conn.commit()
+            self.bridge.set(self._k_active, ["Flow"], self.name)
         except Exception as e:
             self.logger.error(f"Error: {e}")
-            self.bridge.set(f"{self.node_id}_ActivePorts", ["Flow"], self.name)
+            self.bridge.set(self._k_active, ["Flow"], self.name)
         return True
@@ -54,6 +54,11 @@ class BasicSecurityProvider(SecurityProviderNode):
         table = self.properties.get("Table Name", "Users")
         use_verify = self.properties.get("Use Verify", False)
 
+        from axonpulse.nodes.security.actions.base import TABLE_NAME_RE
+        if not TABLE_NAME_RE.fullmatch(str(table)):
+            # Checked once here; security actions refuse to build SQL for it
+            self.logger.error(f"Invalid Table Name {table!r}: use letters, digits and underscores only.")
+
         if Connection:
             self.logger.info(f"DB Connection active ({db_pid}). Prepared for Table: {table}")
         else:
@@ -79,6 +84,12 @@ class BasicSecurityProvider(SecurityProviderNode):
         self.bridge.set(f"{self.node_id}_ActivePorts", ["Provider Flow"], self.name)
         return True
 
+    def cleanup_provider_context(self):
+        # Action nodes keep one live connection per provider; close it with the scope
+        from axonpulse.nodes.security.actions.base import BaseSecurityActionNode
+        BaseSecurityActionNode.release_connection(self.node_id)
+        super().cleanup_provider_context()
+
     def execute(self, **kwargs):
         # The execute method is now primarily handled by registered handlers.
         # This method can be kept for backward compatibility or removed if not needed.
@@ -10,13 +10,19 @@ from axonpulse.core.dependencies import DependencyManager
 
 import hashlib
 
+import hmac
+
 import base64
 
 import os
 
+import stat
+
 import threading
 
-import time
+from concurrent.futures import ThreadPoolExecutor
+
+from functools import lru_cache
 
 from typing import Any, List, Dict, Optional
 
@@ -24,32 +30,126 @@ from axonpulse.core.types import DataType, TypeCaster
 
 from axonpulse.nodes.decorators import axon_node
 
+
 Fernet = None
+AESGCM = None
+_HAS_CRYPTO = None # Resolved once: True/False after the first ensure_crypto()
+_HIJACK_EXECUTOR = None
+_HIJACK_WORKERS = 4
 
 def ensure_crypto():
-    global Fernet
-    if Fernet:
-        return True
+    global Fernet, AESGCM, _HAS_CRYPTO
+    if _HAS_CRYPTO is not None:
+        # Also remembers a failed install, so the XOR fallback doesn't retry it on every call
+        return _HAS_CRYPTO
+    available = False
     if DependencyManager.ensure('cryptography'):
         try:
             from cryptography.fernet import Fernet as _F
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM as _G
             Fernet = _F
-            return True
+            AESGCM = _G
+            available = True
         except ImportError:
-            return False
-    return False
+            pass
+    _HAS_CRYPTO = available
+    return available
+
+_HASH_CHUNK = 1 << 20 # Read size for streaming file checksums
+_MAX_PATH_LEN = 4096
+
+# Hash constructors by normalized name (upper case, no dashes). BLAKE2 is fixed to a 32-byte
+# digest so it is a drop-in for SHA-256 output length, and is faster where SHA-NI is absent.
+_HASHERS = {
+    'SHA256': hashlib.sha256,
+    'MD5': hashlib.md5,
+    'BLAKE2B': lambda *a: hashlib.blake2b(*a, digest_size=32),
+    'BLAKE2S': hashlib.blake2s,
+}
+
+def _is_regular_file(data: str) -> bool:
+    """One stat() call; strings that cannot be a path are rejected without touching the filesystem."""
+    if not data or len(data) > _MAX_PATH_LEN or '\x00' in data or '\n' in data:
+        return False
+    try:
+        return stat.S_ISREG(os.stat(data).st_mode)
+    except (OSError, ValueError):
+        return False
+
+@lru_cache(maxsize=128)
+def _fernet_for(key: str):
+    """Fernet instance for a passphrase (SHA-256 derived key); call ensure_crypto() first."""
+    k_hash = hashlib.sha256(key.encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(k_hash))
+
+_GCM_VERSION = b'\x01' # First byte of a provider AES-GCM token: version | nonce(12) | ciphertext+tag
+_GCM_NONCE = 12
+_GCM_MIN_LEN = 1 + _GCM_NONCE + 16
+
+@lru_cache(maxsize=128)
+def _aead_for(key: str):
+    """AES-256-GCM instance for a passphrase (SHA-256 derived key); call ensure_crypto() first."""
+    return AESGCM(hashlib.sha256(key.encode()).digest())
+
+def _gcm_encrypt(data: bytes, key: str) -> str:
+    nonce = os.urandom(_GCM_NONCE)
+    return base64.urlsafe_b64encode(_GCM_VERSION + nonce + _aead_for(key).encrypt(nonce, data, None)).decode()
+
+def _gcm_decrypt(token: bytes, key: str):
+    """Returns the plaintext bytes, or None if token is not an AES-GCM token for this key."""
+    try:
+        raw = base64.urlsafe_b64decode(token)
+    except Exception:
+        return None
+    if len(raw) < _GCM_MIN_LEN or raw[:1] != _GCM_VERSION:
+        return None
+    try:
+        return _aead_for(key).decrypt(raw[1:1 + _GCM_NONCE], raw[1 + _GCM_NONCE:], None)
+    except Exception:
+        return None
+
+def _decrypt_token(token: bytes, key: str):
+    """Plaintext bytes of an AES-GCM token or a legacy Fernet token, or None; call ensure_crypto() first."""
+    plain = _gcm_decrypt(token, key)
+    if plain is not None:
+        return plain
+    try:
+        # Data written before the switch to AES-GCM
+        return _fernet_for(key).decrypt(token)
+    except Exception:
+        return None
+
+def _plaintext_for(plain: bytes, source):
+    """Decrypted bytes in the caller's shape: bytes for binary input, else text (raw bytes if not UTF-8)."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return plain
+    try:
+        return plain.decode('utf-8')
+    except UnicodeDecodeError:
+        return plain
+
+def _to_bytes(val) -> bytes:
+    """bytes pass straight through; other buffers are copied once; anything else is str() + UTF-8."""
+    if isinstance(val, bytes):
+        return val
+    if isinstance(val, (bytearray, memoryview)):
+        return bytes(val)
+    return str(val).encode('utf-8')
+
+def _xor_bytes(data_bytes: bytes, key_bytes: bytes) -> bytes:
+    """XORs data with the repeating key as two big integers, so the loop runs in C."""
+    n = len(data_bytes)
+    if not n:
+        return b""
+    key_rep = (key_bytes * (n // len(key_bytes) + 1))[:n]
+    return (int.from_bytes(data_bytes, "big") ^ int.from_bytes(key_rep, "big")).to_bytes(n, "big")
 
 def _simple_xor_crypt(data: str, key: str) -> str:
     """Robust fallback if cryptography is missing."""
     if not key:
         return data
     try:
-        key_bytes = key.encode()
-        data_bytes = data.encode()
-        result = bytearray()
-        for i in range(len(data_bytes)):
-            result.append(data_bytes[i] ^ key_bytes[i % len(key_bytes)])
-        return base64.b64encode(result).decode()
+        return base64.b64encode(_xor_bytes(data.encode(), key.encode())).decode()
     except:
         return data
 
@@ -58,12 +158,7 @@ def _simple_xor_decrypt(encoded_data: str, key: str) -> str:
     if not key:
         return encoded_data
     try:
-        data_bytes = base64.b64decode(encoded_data)
-        key_bytes = key.encode()
-        result = bytearray()
-        for i in range(len(data_bytes)):
-            result.append(data_bytes[i] ^ key_bytes[i % len(key_bytes)])
-        return result.decode()
+        return _xor_bytes(base64.b64decode(encoded_data), key.encode()).decode()
     except:
         return '[Decryption Error]'
 
@@ -73,8 +168,8 @@ class EncryptionProviderNode(ProviderNode):
     Standardized data encryption and decryption service.
     
     This provider establishes a cryptographic environment using a master secret 
-    key. It handles Fernet (AES-128) encryption and can intercept system-wide 
-    file operations for transparent data security.
+    key. It handles AES-256-GCM encryption (still reading older Fernet data) and
+    can intercept system-wide file operations for transparent data security.
     
     Inputs:
     - Flow: Start the encryption service.
@@ -111,6 +206,7 @@ class EncryptionProviderNode(ProviderNode):
         self.bridge.register_super_function(self.node_id, 'Read File', self.node_id)
         self.bridge.set(f'{self.node_id}_Key', key, self.name)
         self._stop_event = threading.Event()
+        self._hijack_queue = self.bridge.open_hijack_queue(self.node_id)
         self._listener_thread = threading.Thread(target=self._hijack_listener, daemon=True)
         self._listener_thread.start()
         return super().start_scope(**kwargs)
@@ -122,16 +218,26 @@ class EncryptionProviderNode(ProviderNode):
         super().cleanup_provider_context()
 
     def _hijack_listener(self):
+        global _HIJACK_EXECUTOR
+        hijack_queue = self._hijack_queue
         while not self._stop_event.is_set():
-            req = self.bridge.get(f'{self.node_id}_HijackRequest')
+            # Blocks until a request arrives; the timeout keeps shutdown responsive
+            req = self.next_hijack_request(hijack_queue, timeout=1.0)
             if req:
-                func = req.get('func')
-                data = req.get('data')
-                req_id = req.get('id')
-                self.bridge.set(f'{self.node_id}_HijackRequest', None, self.name)
-                result = self.handle_hijack(func, data)
-                self.bridge.set(f'{self.node_id}_HijackResponse', {'id': req_id, 'result': result}, self.name)
-            time.sleep(0.01)
+                # Ciphers are stateless and OpenSSL drops the GIL, so requests run side by side
+                if _HIJACK_EXECUTOR is None:
+                    _HIJACK_EXECUTOR = ThreadPoolExecutor(max_workers=_HIJACK_WORKERS, thread_name_prefix='hijack')
+                _HIJACK_EXECUTOR.submit(self._handle_and_respond, req)
+
+    def _handle_and_respond(self, req):
+        # Always answer: a missing reply would leave the caller to time out and use its input unchanged
+        try:
+            reply = {'id': req.get('id'), 'result': self.handle_hijack(req.get('func'), req.get('data'))}
+        except Exception as e:
+            self.logger.error(f'Hijack handler failed: {e}')
+            reply = {'id': req.get('id'), 'error': str(e) or type(e).__name__}
+        reply_to = req.get('reply_to') or f'{self.node_id}_HijackResponse'
+        self.bridge.set(reply_to, reply, self.name)
 
     def handle_hijack(self, func_name, data):
         key = self.bridge.get(f'{self.node_id}_Key')
@@ -146,10 +252,8 @@ class EncryptionProviderNode(ProviderNode):
             return data
         if ensure_crypto():
             try:
-                k_hash = hashlib.sha256(key.encode()).digest()
-                k_b64 = base64.urlsafe_b64encode(k_hash)
-                f = Fernet(k_b64)
-                return f.encrypt(str(data).encode()).decode()
+                # Single-pass AES-GCM (AES-NI + carry-less multiply in OpenSSL) instead of Fernet's CBC + HMAC
+                return _gcm_encrypt(_to_bytes(data), key)
             except:
                 pass
         return _simple_xor_crypt(str(data), key)
@@ -158,21 +262,17 @@ class EncryptionProviderNode(ProviderNode):
         if not key:
             return data
         if ensure_crypto():
-            try:
-                k_hash = hashlib.sha256(key.encode()).digest()
-                k_b64 = base64.urlsafe_b64encode(k_hash)
-                f = Fernet(k_b64)
-                return f.decrypt(str(data).encode()).decode()
-            except:
-                pass
+            plain = _decrypt_token(_to_bytes(data), key)
+            if plain is not None:
+                return _plaintext_for(plain, data)
         return _simple_xor_decrypt(str(data), key)
 
 @axon_node(category="Security", version="2.3.0", node_label="AES Encrypt", outputs=['Encrypted Data'])
 def EncryptNode(Data: str, Key: str = 'secret-key', _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Encrypts a string or data object using a secret key.
 
-Uses Fernet (AES-128) for high-security encryption when available. 
-Encrypted data is returned as a base64-encoded string.
+Uses AES-256-GCM when available, the same token format as the
+Encryption Provider. Encrypted data is returned as a base64-encoded string.
 
 Inputs:
 - Flow: Trigger the encryption process.
@@ -187,12 +287,9 @@ Outputs:
     result = ''
     if ensure_crypto():
         try:
-            k_hash = hashlib.sha256(key.encode()).digest()
-            k_b64 = base64.urlsafe_b64encode(k_hash)
-            f = Fernet(k_b64)
-            result = f.encrypt(str(val).encode()).decode()
+            result = _gcm_encrypt(_to_bytes(val), key)
         except Exception as e:
-            _node.logger.error(f'Fernet Error: {e}')
+            _node.logger.error(f'AES-GCM Error: {e}')
             result = _simple_xor_crypt(str(val), key)
         finally:
             pass
@@ -206,8 +303,8 @@ Outputs:
 def DecryptNode(Encrypted_Data: str, Key: str = 'secret-key', _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Decrypts an encrypted string back to its original state.
 
-Attempts to reverse encryption using the provided key. Matches the 
-security logic used by the 'AES Encrypt' node.
+Attempts to reverse encryption using the provided key. Reads AES-GCM
+tokens from 'AES Encrypt' or the Encryption Provider, and older Fernet tokens.
 
 Inputs:
 - Flow: Trigger the decryption process.
@@ -221,15 +318,11 @@ Outputs:
     key = Key if Key is not None else _node.properties.get('Key', _node.properties.get('Key', ''))
     result = ''
     if ensure_crypto():
-        try:
-            k_hash = hashlib.sha256(key.encode()).digest()
-            k_b64 = base64.urlsafe_b64encode(k_hash)
-            f = Fernet(k_b64)
-            result = f.decrypt(str(val).encode()).decode()
-        except Exception as e:
+        plain = _decrypt_token(_to_bytes(val), key)
+        if plain is not None:
+            result = _plaintext_for(plain, val)
+        else:
             result = _simple_xor_decrypt(str(val), key)
-        finally:
-            pass
     else:
         result = _simple_xor_decrypt(str(val), key)
     _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
@@ -237,7 +330,7 @@ Outputs:
 
 
 @axon_node(category="Security", version="2.3.0", node_label="Hash String", outputs=['SHA Key'])
-def SHANode(Data: str, _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
+def SHANode(Data: str, Algorithm: str = 'SHA-256', _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Generates a secure SHA-256 hash (fingerprint) of a string.
 
 Hashing is a one-way transformation used for data integrity verification 
@@ -246,28 +339,31 @@ or password masking. It cannot be reversed.
 Inputs:
 - Flow: Trigger the hashing process.
 - Data: The string to hash.
+- Algorithm: SHA-256 (default), or BLAKE2b / BLAKE2s as faster 256-bit fingerprints.
 
 Outputs:
 - Flow: Pulse triggered after hashing.
 - SHA Key: The resulting 64-character hexadecimal hash."""
     val = Data if Data is not None else ''
-    h = hashlib.sha256(str(val).encode()).hexdigest()
+    hasher = _HASHERS.get(str(Algorithm or 'SHA-256').upper().replace('-', ''), hashlib.sha256)
+    h = hasher(_to_bytes(val)).hexdigest()
     _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
     return h
 
 
 @axon_node(category="Security/Cryptography", version="2.3.0", node_label="Checksum/Hash", outputs=['Hash'])
-def ChecksumNode(Data: str, Hash_Type: str = 'SHA-256', Secret: str = '', _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
+def ChecksumNode(Data: str, Hash_Type: str = 'SHA-256', Secret: str = '', Source: str = 'Auto', _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Generates a cryptographic checksum for strings or files.
 
-Supports multiple algorithms (SHA-256, MD5) and secure HMAC 
+Supports multiple algorithms (SHA-256, MD5, BLAKE2b, BLAKE2s) and secure HMAC 
 (Keyed-Hash Message Authentication Code) for verified message integrity.
 
 Inputs:
 - Flow: Trigger the calculation.
 - Data: The string or absolute file path to verify.
-- Hash Type: Algorithm to use (SHA-256, MD5, HMAC).
+- Hash Type: Algorithm to use (SHA-256, MD5, BLAKE2b, BLAKE2s, HMAC).
 - Secret: The authentication key (required for HMAC).
+- Source: How to treat Data: Auto (file if the path exists), File, or String.
 
 Outputs:
 - Flow: Pulse triggered after calculation.
@@ -276,21 +372,7 @@ Outputs:
     hash_type = Hash_Type if Hash_Type is not None else _node.properties.get('HashType', _node.properties.get('Hash Type', 'SHA-256'))
     secret = Secret if Secret is not None else _node.properties.get('Secret', '')
     hash_type = hash_type.upper().replace('-', '')
-    data_bytes = b''
-    if isinstance(data, str) and os.path.exists(data) and os.path.isfile(data):
-        try:
-            with open(data, 'rb') as f:
-                data_bytes = f.read()
-        except:
-            data_bytes = str(data).encode('utf-8')
-        finally:
-            pass
-    elif isinstance(data, str):
-        data_bytes = data.encode('utf-8')
-    elif isinstance(data, (bytes, bytearray)):
-        data_bytes = bytes(data)
-    else:
-        data_bytes = str(data).encode('utf-8')
+    source = str(Source or 'Auto').lower()
     result_hash = ''
     try:
         if hash_type == 'HMAC':
@@ -299,13 +381,31 @@ Outputs:
                 return
             else:
                 pass
-            import hmac
-            h = hmac.new(secret.encode('utf-8'), data_bytes, hashlib.sha256)
-            result_hash = h.hexdigest()
-        elif hash_type == 'MD5':
-            result_hash = hashlib.md5(data_bytes).hexdigest()
+            new_hash = lambda: hmac.new(secret.encode('utf-8'), None, hashlib.sha256)
         else:
-            result_hash = hashlib.sha256(data_bytes).hexdigest()
+            new_hash = _HASHERS.get(hash_type, hashlib.sha256)
+        h = new_hash()
+        hashed_file = False
+        if isinstance(data, str) and source != 'string' and (source == 'file' or _is_regular_file(data)):
+            try:
+                # Stream in 1 MiB blocks so large files are never held in memory whole
+                with open(data, 'rb') as f:
+                    for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+                        h.update(chunk)
+                hashed_file = True
+            except OSError as e:
+                # Unreadable file: hash the path string itself, as before
+                if source == 'file':
+                    _node.logger.warning(f'Checksum could not read file, hashing the path string: {e}')
+                h = new_hash()
+        if not hashed_file:
+            if isinstance(data, str):
+                h.update(data.encode('utf-8'))
+            elif isinstance(data, (bytes, bytearray, memoryview)):
+                h.update(data)
+            else:
+                h.update(str(data).encode('utf-8'))
+        result_hash = h.hexdigest()
         _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
     except Exception as e:
         _node.logger.error(f'Hashing Error: {e}')
@@ -2,6 +2,10 @@ import os
 from axonpulse.core.node import BaseNode
 from axonpulse.nodes.registry import NodeRegistry
 from axonpulse.core.vector import OpenAIVectorProvider
+from axonpulse.core.retry import retry_with_backoff, RateLimiter
+from axonpulse.core.embedding_chunks import MAX_CHUNK_TOKENS
+from axonpulse.core.embedding_cache import DEFAULT_CACHE_PATH, open_embedding_cache
+from axonpulse.utils.path_utils import resolve_project_path
 from axonpulse.core.types import DataType
 from axonpulse.nodes.lib.provider_node import ProviderNode
 
@@ -15,6 +19,8 @@ class OpenAIVectorNode(ProviderNode):
     - Flow: Start the embedding service and enter the EMBED scope.
     - Provider End: Close the service and exit the scope.
     - API Key: Your OpenAI API Key.
+    - Max Chunk Tokens: Longer texts are split into chunks of about this many tokens and mean-pooled (default: 2000).
+    - Embedding Cache: SQLite file caching vectors across runs and processes (default: ./data/embedding_cache.db; empty disables).
     
     Outputs:
     - Provider Flow: Active while the embedding service is running.
@@ -27,6 +33,8 @@ class OpenAIVectorNode(ProviderNode):
         super().__init__(node_id, name, bridge)
         self.provider_type = "EMBED"
         self.properties["Model Name"] = "text-embedding-3-small"
+        self.properties["Max Chunk Tokens"] = MAX_CHUNK_TOKENS
+        self.properties["Embedding Cache"] = DEFAULT_CACHE_PATH
         self.properties["API Key"] = ""
         self.define_schema()
         self.register_handlers()
@@ -45,10 +53,19 @@ class OpenAIVectorNode(ProviderNode):
             return super().start_scope(**kwargs)
 
         try:
-            provider = OpenAIVectorProvider(api_key, model)
+            # Requests per minute are throttled client-side; transient init failures are retried
+            limiter = RateLimiter(float(os.environ.get("OPENAI_MAX_REQUESTS_PER_MINUTE", 3500)))
+            max_tokens = int(self.properties.get("Max Chunk Tokens") or MAX_CHUNK_TOKENS)
+            # Vectors persist across runs and worker processes; an empty path disables the cache
+            cache_path = self.properties.get("Embedding Cache")
+            cache = open_embedding_cache(resolve_project_path(cache_path, self.bridge)) if cache_path else None
+            provider = retry_with_backoff(OpenAIVectorProvider, api_key, model, rate_limiter=limiter, max_chunk_tokens=max_tokens, embedding_cache=cache, logger=self.logger)
             self.logger.info(f"OpenAI Embeddings initialized with model: {model}")
-            # Register in bridge for components
-            self.bridge.set(f"context_provider_{self.provider_type}", provider, self.name)
+            # Register in bridge for components (Vector Search/Add Documents resolve {id}_Provider)
+            self.bridge.set_batch({
+                f"context_provider_{self.provider_type}": provider,
+                f"{self.node_id}_Provider": provider,
+            }, self.name)
             return super().start_scope(**kwargs)
         except Exception as e:
             self.logger.error(f"Failed to init OpenAI Embed: {e}")
@@ -1,3 +1,7 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
 from axonpulse.core.super_node import SuperNode
 
 from axonpulse.nodes.registry import NodeRegistry
@@ -10,6 +14,151 @@ from axonpulse.core.types import DataType, TypeCaster
 
 from axonpulse.nodes.decorators import axon_node
 
+from axonpulse.core.constants import ACTIVE_FLOW
+
+from axonpulse.core.embedding_chunks import as_float32
+
+# Process-wide LRU of query vectors: a repeated query skips the embedding round-trip entirely
+_QUERY_CACHE_SIZE = 1024
+_QUERY_CACHE = OrderedDict()
+_QUERY_CACHE_LOCK = threading.Lock()
+_QUERY_CACHE_STATS = {"hits": 0, "misses": 0}
+
+def _query_cache_key(provider, provider_id, text):
+    """
+    Cache key for a query vector, or None when the provider must not be cached.
+    Keying on the instance means a restarted provider never serves vectors from its predecessor.
+    Providers without a model_name (TF-IDF, BM25) are refit in place, so they are not cached.
+    """
+    model = getattr(provider, "model_name", None)
+    if not model:
+        return None
+    return (provider_id, id(provider), model, text)
+
+def _cached_query_vector(provider, provider_id, text, logger=None):
+    """Returns the cached vector for a query, or None (counting the hit or miss)."""
+    key = _query_cache_key(provider, provider_id, text)
+    if key is None:
+        return None
+    with _QUERY_CACHE_LOCK:
+        vec = _QUERY_CACHE.get(key)
+        if vec is not None:
+            _QUERY_CACHE.move_to_end(key)
+            _QUERY_CACHE_STATS["hits"] += 1
+        else:
+            _QUERY_CACHE_STATS["misses"] += 1
+    if logger:
+        state = "hit" if vec is not None else "miss"
+        logger.debug(f"Query embedding cache {state} ({_QUERY_CACHE_STATS['hits']} hits / {_QUERY_CACHE_STATS['misses']} misses)")
+    return vec
+
+def _remember_query_vector(provider, provider_id, text, vec):
+    key = _query_cache_key(provider, provider_id, text)
+    if key is None:
+        return
+    with _QUERY_CACHE_LOCK:
+        _QUERY_CACHE[key] = vec
+        if len(_QUERY_CACHE) > _QUERY_CACHE_SIZE:
+            _QUERY_CACHE.popitem(last=False)
+
+# Concurrent searches against the same providers are coalesced into one embedding request
+_MAX_BATCH = 48
+_FLUSH_SECONDS = 0.015
+_BATCH_RESULT_TIMEOUT = 120
+_SEARCH_WORKERS = 8
+_SEARCH_EXECUTOR = None
+_SEARCH_EXECUTOR_LOCK = threading.Lock()
+
+def _get_search_executor():
+    global _SEARCH_EXECUTOR
+    if _SEARCH_EXECUTOR is None:
+        with _SEARCH_EXECUTOR_LOCK:
+            if _SEARCH_EXECUTOR is None:
+                _SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=_SEARCH_WORKERS, thread_name_prefix='VectorSearch')
+    return _SEARCH_EXECUTOR
+
+class _QueryBatch:
+    __slots__ = ("items", "full")
+
+    def __init__(self):
+        self.items = [] # (text, limit, future)
+        self.full = threading.Event()
+
+class _BatchCoordinator:
+    """
+    Bundles queries that arrive within _FLUSH_SECONDS of each other (up to _MAX_BATCH) for the
+    same (embedding provider, database provider, table). The first caller of a window leads it:
+    it waits for the window to close or fill, then embeds the unique texts in one call and runs
+    the searches, resolving every caller's future. No thread lingers between windows.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._open = {}
+
+    def search(self, key, provider, provider_id, db, table_name, text, limit):
+        future = Future()
+        with self._lock:
+            batch = self._open.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._open[key] = _QueryBatch()
+            batch.items.append((text, limit, future))
+            if len(batch.items) >= _MAX_BATCH:
+                # Close the window; later callers start a fresh batch
+                del self._open[key]
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(_FLUSH_SECONDS)
+            with self._lock:
+                if self._open.get(key) is batch:
+                    del self._open[key]
+            self._flush(provider, provider_id, db, table_name, batch.items)
+        return future.result(timeout=_BATCH_RESULT_TIMEOUT)
+
+    def _flush(self, provider, provider_id, db, table_name, items):
+        unique = list(dict.fromkeys(text for text, _, _ in items))
+        try:
+            embed_queries = getattr(provider, "embed_queries", None)
+            vecs = embed_queries(unique) if embed_queries else [provider.embed_query(t) for t in unique]
+            vectors = dict(zip(unique, vecs))
+        except Exception as e:
+            for _, _, future in items:
+                future.set_exception(e)
+            return
+        for text, vec in vectors.items():
+            _remember_query_vector(provider, provider_id, text, vec)
+
+        if hasattr(db, "search_batch"):
+            top = max(limit for _, limit, _ in items)
+            try:
+                hits = db.search_batch(table_name, [vectors[text] for text, _, _ in items], limit=top)
+            except Exception as e:
+                for _, _, future in items:
+                    future.set_exception(e)
+                return
+            for (_, limit, future), (docs, scores, metas) in zip(items, hits):
+                future.set_result((docs[:limit], scores[:limit], metas[:limit]))
+            return
+
+        if len(items) == 1:
+            text, limit, future = items[0]
+            self._resolve(future, db.search, table_name, vectors[text], limit)
+            return
+        executor = _get_search_executor()
+        pending = [executor.submit(self._resolve, future, db.search, table_name, vectors[text], limit) for text, limit, future in items]
+        for p in pending:
+            p.result()
+
+    @staticmethod
+    def _resolve(future, search, table_name, vec, limit):
+        try:
+            future.set_result(search(table_name, vec, limit=limit))
+        except Exception as e:
+            future.set_exception(e)
+
+_COORDINATOR = _BatchCoordinator()
+
 @axon_node(category="AI/Vector", version="2.3.0", node_label="Vector Search", outputs=['Results', 'Scores', 'Metadata'])
 def VectorSearchNode(Query: str, Limit: float = 5, _bridge: Any = None, _node: Any = None, _node_id: str = None, **kwargs) -> Any:
     """Performs a semantic similarity search against a connected Vector Database Provider.
@@ -24,13 +173,13 @@ Assumes a Provider Flow connection for both VECTOR and EMBED capabilities.
 ### Outputs:
 - Flow (flow): Triggered after search is complete.
 - Results (list): List of matching document text.
-- Scores (list): List of similarity scores (0.0 to 1.0).
+- Scores (list): Similarity scores (0.0 to 1.0) as a float32 array.
 - Metadata (list): List of metadata dictionaries for each result."""
-    query = kwargs.get('Query') or _node.properties.get('Query')
-    limit = kwargs.get('Limit') or _node.properties.get('Limit', 5)
-    db_provider_id = self.get_provider_id('Vector Database Provider')
+    query = Query or kwargs.get('Query') or _node.properties.get('Query')
+    limit = Limit or kwargs.get('Limit') or _node.properties.get('Limit', 5)
+    db_provider_id = _node.get_provider_id('Vector Database Provider')
     database = _bridge.get(f'{db_provider_id}_Database') if db_provider_id else None
-    emb_provider_id = self.get_provider_id('Embedding Provider')
+    emb_provider_id = _node.get_provider_id('Embedding Provider')
     embedding_provider = _bridge.get(f'{emb_provider_id}_Provider') if emb_provider_id else None
     if not database or not embedding_provider or (not query):
         missing = []
@@ -51,13 +200,20 @@ Assumes a Provider Flow connection for both VECTOR and EMBED capabilities.
         pass
     db = database.get('db')
     table_name = database.get('table')
+    (docs, scores, metas) = ([], [], [])
     try:
-        query_vec = embedding_provider.embed_query(str(query))
-        (docs, scores, metas) = db.search(table_name, query_vec, limit=int(limit))
+        query = str(query)
+        query_vec = _cached_query_vector(embedding_provider, emb_provider_id, query, _node.logger)
+        if query_vec is not None:
+            (docs, scores, metas) = db.search(table_name, query_vec, limit=int(limit))
+        else:
+            batch_key = (emb_provider_id, db_provider_id, table_name)
+            (docs, scores, metas) = _COORDINATOR.search(batch_key, embedding_provider, emb_provider_id, db, table_name, query, int(limit))
         _node.logger.info(f'Vector search returned {len(docs)} results.')
     except Exception as e:
         _node.logger.error(f'Search Failed: {e}')
     finally:
         pass
-    _bridge.set(f'{_node_id}_ActivePorts', ['Flow'], _node.name)
-    return {'Results': docs, 'Scores': scores, 'Metadata': metas}
+    # Outputs and ActivePorts go out in one bridge batch
+    _node.set_outputs({'Results': docs, 'Scores': as_float32(scores), 'Metadata': metas}, active_ports=ACTIVE_FLOW)
+    return True
@@ -0,0 +1,71 @@
+from array import array
+
+import pytest
+
+from axonpulse.core.embedding_cache import EmbeddingCache
+
+
+class _Embedder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[len(t) + 0.1, -1.0 / 3.0] for t in texts]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = EmbeddingCache(str(tmp_path / "cache.db"))
+    yield c
+    c.close()
+
+
+def test_second_call_served_from_cache(cache):
+    embed = _Embedder()
+    first = cache.get_or_compute("openai", "m", ["alpha", "beta"], embed)
+    second = cache.get_or_compute("openai", "m", ["beta", "alpha"], embed)
+
+    assert len(embed.calls) == 1
+    # Fresh vectors come straight from embed_many; cached ones are float32-rounded
+    assert second[0] == pytest.approx(first[1], rel=1e-6)
+    assert second[1] == pytest.approx(first[0], rel=1e-6)
+
+
+def test_cache_persists_across_instances(cache, tmp_path):
+    cache.get_or_compute("openai", "m", ["alpha"], _Embedder())
+    cache.close()
+
+    embed = _Embedder()
+    reopened = EmbeddingCache(str(tmp_path / "cache.db"))
+    try:
+        reopened.get_or_compute("openai", "m", ["alpha"], embed)
+    finally:
+        reopened.close()
+    assert embed.calls == []
+
+
+def test_duplicates_embedded_once(cache):
+    embed = _Embedder()
+    vectors = cache.get_or_compute("openai", "m", ["a", "bb", "a", "bb", "a"], embed)
+
+    assert embed.calls == [["a", "bb"]]
+    assert vectors[0] == vectors[2] == vectors[4]
+    assert vectors[1] == vectors[3]
+
+
+def test_model_and_task_are_part_of_the_key(cache):
+    embed = _Embedder()
+    cache.get_or_compute("openai", "m1", ["alpha"], embed)
+    cache.get_or_compute("openai", "m2", ["alpha"], embed)
+    cache.get_or_compute("openai", "m1", ["alpha"], embed, task="query")
+    assert len(embed.calls) == 3
+
+
+def test_vectors_round_trip_as_float32(cache):
+    embed = _Embedder()
+    cache.get_or_compute("openai", "m", ["abc"], embed)
+    stored = cache.get_or_compute("openai", "m", ["abc"], embed)[0]
+
+    assert stored == array("f", [3.1, -1.0 / 3.0]).tolist()
+    assert stored == pytest.approx([3.1, -1.0 / 3.0], rel=1e-6)
@@ -0,0 +1,64 @@
+import math
+
+import pytest
+
+from axonpulse.core import embedding_chunks as E
+
+
+def test_short_text_is_one_chunk():
+    assert E.split_for_embedding("hello", max_tokens=2) == ["hello"]
+
+
+def test_split_breaks_on_whitespace_in_back_half():
+    # max_tokens=2 -> 8-character windows
+    assert E.split_for_embedding("hello world foo", max_tokens=2) == ["hello", "world", "foo"]
+
+
+def test_split_cuts_hard_without_whitespace_in_back_half():
+    assert E.split_for_embedding("abcdefghijkl", max_tokens=2) == ["abcdefgh", "ijkl"]
+    # A space in the front half of the window is not worth the short chunk
+    assert E.split_for_embedding("ab cdefghijk", max_tokens=2) == ["ab cdefg", "hijk"]
+
+
+def _fake_embed(calls):
+    def embed_many(texts):
+        calls.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+    return embed_many
+
+
+def test_embed_pooled_one_vector_per_input():
+    calls = []
+    texts = ["hi", "hello world foo", "yo"]
+    vectors = E.embed_pooled(texts, _fake_embed(calls), max_tokens=2)
+
+    assert calls == [["hi", "hello", "world", "foo", "yo"]]
+    assert len(vectors) == len(texts)
+    assert vectors[0] == [2.0, 1.0] and vectors[2] == [2.0, 1.0]
+    # Chunk vectors (5,1), (5,1), (3,1) mean-pooled and normalized
+    mean = [13 / 3, 1.0]
+    norm = math.hypot(*mean)
+    assert list(vectors[1]) == pytest.approx([mean[0] / norm, mean[1] / norm])
+
+
+def test_embed_pooled_passes_short_batches_through():
+    calls = []
+    texts = ["a", "b"]
+    assert E.embed_pooled(texts, _fake_embed(calls), max_tokens=2) == [[1.0, 1.0], [1.0, 1.0]]
+    assert calls == [texts]
+
+
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_mean_pool_is_unit_length(monkeypatch, with_numpy):
+    if with_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(E, "_numpy", lambda: None)
+    pooled = E.mean_pool([[6.0, 0.0], [0.0, 8.0]])
+    assert math.hypot(*pooled) == pytest.approx(1.0)
+    assert list(pooled) == pytest.approx([0.6, 0.8])
+
+
+def test_mean_pool_zero_vector_left_unscaled(monkeypatch):
+    monkeypatch.setattr(E, "_numpy", lambda: None)
+    assert E.mean_pool([[0.0, 0.0], [0.0, 0.0]]) == [0.0, 0.0]
@@ -0,0 +1,106 @@
+from email.utils import formatdate
+
+import pytest
+
+from axonpulse.core import retry as R
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class ApiError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.response = _Response(status_code, headers)
+
+
+class _Flaky:
+    """Raises each queued exception in turn, then returns "ok"."""
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waited = []
+    monkeypatch.setattr(R.time, "sleep", waited.append)
+    return waited
+
+
+def test_retries_rate_limit_then_succeeds(sleeps):
+    fn = _Flaky(ApiError(429), ApiError(503))
+    assert R.retry_with_backoff(fn, base=1.0, cap=16.0) == "ok"
+    assert fn.calls == 3
+    # min(cap, base * 2**i) plus up to `base` of jitter
+    assert 1.0 <= sleeps[0] <= 2.0 and 2.0 <= sleeps[1] <= 3.0
+
+
+def test_does_not_retry_client_error(sleeps):
+    fn = _Flaky(ApiError(400))
+    with pytest.raises(ApiError):
+        R.retry_with_backoff(fn)
+    assert fn.calls == 1 and sleeps == []
+
+
+def test_gives_up_after_attempts(sleeps):
+    fn = _Flaky(*[ApiError(500)] * 5)
+    with pytest.raises(ApiError):
+        R.retry_with_backoff(fn, attempts=3)
+    assert fn.calls == 3 and len(sleeps) == 2
+
+
+def test_is_transient():
+    assert R.is_transient(ApiError(429))
+    assert R.is_transient(ConnectionError())
+    assert not R.is_transient(ApiError(404))
+    assert not R.is_transient(ValueError())
+    assert R.is_transient(type("RateLimitError", (Exception,), {})())
+
+
+def test_retry_after_delta_seconds(sleeps):
+    err = ApiError(429, {"Retry-After": "7"})
+    assert R.retry_after_seconds(err) == 7.0
+    assert R.retry_with_backoff(_Flaky(err)) == "ok"
+    assert sleeps == [7.0]
+
+
+def test_retry_after_http_date():
+    err = ApiError(503, {"retry-after": formatdate(R.time.time() + 30, usegmt=True)})
+    assert R.retry_after_seconds(err) == pytest.approx(30, abs=2)
+    assert R.retry_after_seconds(ApiError(503, {"Retry-After": "soon"})) is None
+    assert R.retry_after_seconds(ApiError(503)) is None
+
+
+def test_retry_after_above_max_raises(sleeps):
+    fn = _Flaky(ApiError(429, {"Retry-After": str(R.MAX_RETRY_AFTER + 1)}))
+    with pytest.raises(ApiError):
+        R.retry_with_backoff(fn)
+    assert fn.calls == 1 and sleeps == []
+
+
+def test_rate_limiter_waits_for_refill(monkeypatch):
+    now = [100.0]
+    waited = []
+    monkeypatch.setattr(R.time, "monotonic", lambda: now[0])
+
+    def sleep(seconds):
+        waited.append(seconds)
+        now[0] += seconds
+    monkeypatch.setattr(R.time, "sleep", sleep)
+
+    limiter = R.RateLimiter(rpm=60, burst=2)
+    limiter.acquire()
+    limiter.acquire()
+    assert waited == []
+    limiter.acquire()
+    assert waited == [pytest.approx(1.0)]
@@ -0,0 +1,77 @@
+import itertools
+
+import pytest
+
+from axonpulse.nodes.security.actions.base import BaseSecurityActionNode
+from axonpulse.nodes.security.actions.register import RegisterNode
+
+_PIDS = itertools.count()
+
+
+class _Bridge:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value, *args):
+        self.data[key] = value
+
+    def set_batch(self, values, *args):
+        self.data.update(values)
+
+
+@pytest.fixture
+def node(monkeypatch):
+    pid = f"security_{next(_PIDS)}"
+    bridge = _Bridge()
+    # The pooled connection keeps the in-memory database alive for the whole test
+    bridge.data[f"{pid}_Connection"] = {"type": "sqlite", "path": ":memory:"}
+    bridge.data[f"{pid}_Table Name"] = "Users"
+    n = RegisterNode("register", "Register", bridge)
+    monkeypatch.setattr(n, "get_security_pid", lambda: pid)
+    with n.security_connection(bridge.data[f"{pid}_Connection"]) as conn:
+        conn.execute("CREATE TABLE Users (Username TEXT, Password TEXT, Groups TEXT)")
+        conn.commit()
+    yield n
+    BaseSecurityActionNode.release_connection(pid)
+
+
+def _usernames(node):
+    config = node.bridge.get(f"{node.get_security_pid()}_Connection")
+    with node.security_connection(config) as conn:
+        return sorted(row[0] for row in conn.execute("SELECT Username FROM Users"))
+
+
+def _success(node):
+    return node.bridge.get(node._k_success)
+
+
+def test_bulk_register_all_new(node):
+    node.register_user(Users=[["ann", "pw1"], {"Username": "bob", "Password": "pw2"}])
+    assert _success(node) is True
+    assert _usernames(node) == ["ann", "bob"]
+    assert node.bridge.get(node._k_active) == ["Flow"]
+
+
+def test_bulk_register_with_existing_user(node):
+    node.register_user(Users=[["ann", "pw1"]])
+    node.register_user(Users=[["bob", "pw2"], ["ann", "other"]])
+    # The existing user is skipped, the rest are still registered
+    assert _success(node) is False
+    assert _usernames(node) == ["ann", "bob"]
+
+
+def test_bulk_register_with_duplicate_in_batch(node):
+    node.register_user(Users=[["ann", "pw1"], ["ann", "pw2"], ["cid", "pw3"]])
+    assert _success(node) is False
+    assert _usernames(node) == ["ann", "cid"]
+
+
+def test_single_register_rejects_existing_user(node):
+    node.register_user(Username="ann", Password="pw", Confirm_Password="pw")
+    assert _success(node) is True
+    node.register_user(Username="ann", Password="pw", Confirm_Password="pw")
+    assert _success(node) is False
+    assert _usernames(node) == ["ann"]
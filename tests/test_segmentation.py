@@ -0,0 +1,71 @@
+import numpy
+import pytest
+
+from axonpulse.nodes.media import segmentation as S
+
+torch = pytest.importorskip("torch")
+
+
+class _Bridge:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value, *args):
+        self.data[key] = value
+
+    def set_batch(self, values, *args):
+        self.data.update(values)
+
+
+class _Predictor:
+    """Mimics SamPredictor.predict: decoder tensors handed back through .cpu().numpy()."""
+    def predict(self, point_coords=None, point_labels=None, box=None, multimask_output=True):
+        low_res = torch.zeros((3, 4, 6))
+        low_res[0, 1:3, 2:5] = 1.0
+        low_res[2, 0, 0] = 1.0
+        iou = torch.tensor([0.2, 0.1, 0.9])
+        masks = low_res > 0.5
+        return masks.cpu().numpy(), iou.cpu().numpy(), low_res.cpu().numpy()
+
+
+class _Generator:
+    def generate(self, image):
+        seg = numpy.zeros(image.shape[:2], dtype=bool)
+        seg[0:2, 0:3] = True
+        return [
+            {"segmentation": seg[:, ::-1].copy(), "bbox": [3, 0, 3, 1], "area": 1, "predicted_iou": 0.5},
+            {"segmentation": seg, "bbox": [0, 0, 3, 2], "area": 6, "predicted_iou": 0.8},
+        ]
+
+
+@pytest.fixture
+def node():
+    S.np = numpy
+    n = S.ImageSegmentationAnythingNode("seg", "Seg", _Bridge())
+    # CPU model: no reduced-precision dtype, plain inference mode
+    n._dtype = None
+    n._predictor = _Predictor()
+    n._generator = _Generator()
+    return n
+
+
+def test_segment_prompt_table_from_cpu_predictor(node):
+    table = node._segment_prompt(numpy.array([[1, 1]]), numpy.ones(1), None)
+    # Empty mask dropped, best score first
+    assert table["scores"].dtype == numpy.float32
+    assert table["scores"].tolist() == pytest.approx([0.9, 0.2])
+    assert table["areas"].tolist() == [1, 6]
+    assert table["bboxes"].tolist() == [[0, 0, 0, 0], [2, 1, 2, 1]]
+    assert table["mask_shape"] == (4, 6)
+    assert S.unpack_masks(table)[1].sum() == 6
+
+
+def test_segment_auto_table_from_cpu_generator(node):
+    table = node._segment_auto(numpy.zeros((4, 6, 3), dtype=numpy.uint8))
+    assert table["areas"].tolist() == [6, 1]
+    assert table["bboxes"].tolist() == [[0, 0, 3, 2], [3, 0, 3, 1]]
+    assert table["scores"].dtype == numpy.float32
+    assert S.unpack_masks(table).shape == (2, 4, 6)
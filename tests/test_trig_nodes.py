@@ -0,0 +1,40 @@
+import math
+
+from axonpulse.nodes.lib import trig_nodes as T
+
+
+def test_hyper_large_arguments_match_math():
+    for x in (20.5, 100.0, 354.0, 355.0, 400.0, -500.0, 699.0, 710.5, -1e6):
+        for op, ref in enumerate((math.sinh, math.cosh, math.tanh)):
+            T._HYPER_LAST = None
+            try:
+                expected = ref(x)
+            except OverflowError:
+                expected = OverflowError
+            try:
+                got = T._hyper(x, op)
+            except OverflowError:
+                got = OverflowError
+            if expected is OverflowError or got is OverflowError:
+                assert got is expected, (x, op)
+            else:
+                assert math.isclose(got, expected, rel_tol=1e-12), (x, op, got, expected)
+
+
+def test_hyper_tanh_stays_in_range():
+    for x in (18.0, 19.0, 20.0, 21.0, 354.0, -354.0):
+        T._HYPER_LAST = None
+        t = T._hyper(x, 2)
+        assert -1.0 <= t <= 1.0
+        assert math.isclose(t, math.tanh(x), rel_tol=1e-15)
+
+
+def test_hyper_array_memo_sees_in_place_edits():
+    if T.np is None:
+        return
+    values = [0.0, 1.0, 2.0]
+    first = T._hyperbolic_array(0, values)
+    values[1] = 3.0
+    second = T._hyperbolic_array(0, values)
+    assert second[1] == math.sinh(3.0)
+    assert first[1] == math.sinh(1.0)
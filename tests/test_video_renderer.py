@@ -0,0 +1,170 @@
+import json
+import os
+import subprocess
+
+import pytest
+
+from axonpulse.core.video_builder import renderer as R
+
+# Captured from `ffmpeg -hide_banner -encoders` (trimmed)
+ENCODERS_OUT = """Encoders:
+ V..... = Video
+ A..... = Audio
+ S..... = Subtitle
+ .F.... = Frame-level multithreading
+ ..S... = Slice-level multithreading
+ ...X.. = Codec is experimental
+ ....B. = Supports draw_horiz_band
+ .....D = Supports direct rendering method 1
+ ------
+ V....D libx264              libx264 H.264 / AVC / MPEG-4 AVC / MPEG-4 part 10 (codec h264)
+ V....D h264_nvenc           NVIDIA NVENC H.264 encoder (codec h264)
+ V....D libvpx               libvpx VP8 (codec vp8)
+ A....D aac                  AAC (Advanced Audio Coding)
+ S..... srt                  SubRip subtitle
+"""
+
+# Captured from `ffmpeg -hide_banner -i clip.mp4` (stderr)
+PROBE_ERR = """Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'clip.mp4':
+  Metadata:
+    major_brand     : isom
+    encoder         : Lavf61.1.100
+  Duration: 00:01:02.50, start: 0.000000, bitrate: 101 kb/s
+  Stream #0:0[0x1](und): Video: h264 (High) (avc1 / 0x31637661), yuv420p(progressive), 64x48 [SAR 1:1 DAR 4:3], 14 kb/s, 10 fps, 10 tbr, 10240 tbn (default)
+      Metadata:
+        handler_name    : VideoHandler
+  Stream #0:1[0x2](und): Audio: aac (LC) (mp4a / 0x6134706D), 44100 Hz, mono, fltp, 70 kb/s (default)
+At least one output file must be specified
+"""
+
+
+def _fake_run(stdout="", stderr=""):
+    def run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=stderr)
+    return run
+
+
+def test_available_encoders_parses_table_only(monkeypatch):
+    monkeypatch.setattr(R, "_ENCODERS", None)
+    monkeypatch.setattr(R.subprocess, "run", _fake_run(stdout=ENCODERS_OUT))
+    assert R.available_encoders() == {"libx264", "h264_nvenc", "libvpx", "aac", "srt"}
+
+
+def test_available_encoders_empty_when_probe_fails(monkeypatch):
+    def boom(cmd, **kwargs):
+        raise FileNotFoundError(cmd[0])
+    monkeypatch.setattr(R, "_ENCODERS", None)
+    monkeypatch.setattr(R.subprocess, "run", boom)
+    assert R.available_encoders() == set()
+
+
+def test_probe_video_stream_parses_ffmpeg_stderr(monkeypatch, tmp_path):
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"\0")
+    monkeypatch.setattr(R, "_PROBES", {})
+    monkeypatch.setattr(R.subprocess, "run", _fake_run(stderr=PROBE_ERR))
+    assert R.probe_video_stream(str(clip)) == {
+        "codec": "h264", "profile": "High", "pix_fmt": "yuv420p", "size": (64, 48),
+        "sar": "1:1", "fps": 10.0, "tbn": "10240", "duration": 62.5, "audio": True,
+    }
+
+
+def test_probe_video_stream_none_for_missing_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(R, "_PROBES", {})
+    assert R.probe_video_stream(str(tmp_path / "missing.mp4")) is None
+
+
+@pytest.mark.parametrize("out_path, codec, hw_accel, encoders, expected", [
+    ("out.mp4", "auto", "auto", {"libx264", "h264_nvenc"}, "h264_nvenc"),
+    ("out.mp4", "auto", "auto", {"libx264"}, "libx264"),
+    ("out.mp4", "auto", "none", {"libx264", "h264_nvenc"}, "libx264"),
+    ("out.mp4", "hevc", "qsv", {"hevc_qsv", "hevc_nvenc"}, "hevc_qsv"),
+    ("out.mp4", "hevc", "cuda", {"libx265"}, "libx265"),
+    ("out.mp4", "mpeg4", "auto", set(), "mpeg4"),
+    ("out.webm", "hevc", "auto", {"hevc_nvenc"}, "libvpx"),
+])
+def test_select_video_codec(monkeypatch, out_path, codec, hw_accel, encoders, expected):
+    monkeypatch.setattr(R, "available_encoders", lambda: encoders)
+    assert R.select_video_codec(out_path, codec, hw_accel)[0] == expected
+
+
+def test_select_video_codec_presets(monkeypatch):
+    monkeypatch.setattr(R, "available_encoders", lambda: {"h264_nvenc"})
+    assert R.select_video_codec("out.mp4") == ("h264_nvenc", "p4", ["-tune", "hq", "-rc", "vbr"])
+    assert R.select_video_codec("out.mp4", hw_accel="none") == ("libx264", "veryfast", [])
+
+
+def _shape(start, duration, color):
+    return {"path": "", "type": "shape", "start": start, "duration": duration,
+            "meta": {"size": [64, 48], "color": color}}
+
+
+@pytest.mark.parametrize("as_json", [False, True])
+def test_render_shape_timeline(tmp_path, as_json):
+    pytest.importorskip("moviepy.editor")
+    imageio_ffmpeg = pytest.importorskip("imageio_ffmpeg")
+    timeline = [_shape(0.0, 0.5, [255, 0, 0]), _shape(0.5, 0.3, [0, 0, 255])]
+    out = str(tmp_path / "out.mp4")
+
+    renderer = R.TimelineRenderer(width=64, height=48, fps=10, hw_accel="none", threads=1)
+    assert renderer.render_timeline(json.dumps(timeline) if as_json else timeline, out) == out
+
+    frames, seconds = imageio_ffmpeg.count_frames_and_secs(out)
+    assert frames == 8
+    assert seconds == pytest.approx(0.8, abs=0.05)
+
+
+def _video(path, start, duration):
+    return {"path": str(path), "type": "video", "start": start, "duration": duration}
+
+
+def test_segment_keys_stable_when_object_moves_in_time(tmp_path):
+    src = tmp_path / "a.mp4"
+    src.write_bytes(b"\0")
+    renderer = R.TimelineRenderer(width=64, height=48, fps=10, hw_accel="none")
+
+    before = renderer._segments([_video(src, 0.0, 1.0)], 10, "libx264")
+    after = renderer._segments([_video(src, 2.0, 1.0)], 30, "libx264")
+    assert [(f0, f1) for f0, f1, _ in after] == [(0, 20), (20, 30)]
+    assert after[1][2] == before[0][2]
+    # The empty lead-in is a different segment
+    assert after[0][2] != before[0][2]
+
+
+def test_segment_key_changes_with_source_mtime(tmp_path):
+    src = tmp_path / "a.mp4"
+    src.write_bytes(b"\0")
+    renderer = R.TimelineRenderer(width=64, height=48, fps=10, hw_accel="none")
+    timeline = [_video(src, 0.0, 1.0)]
+
+    os.utime(src, ns=(1_000_000_000, 1_000_000_000))
+    first = renderer._segments(timeline, 10, "libx264")[0][2]
+    os.utime(src, ns=(2_000_000_000, 2_000_000_000))
+    assert renderer._segments(timeline, 10, "libx264")[0][2] != first
+
+
+def test_render_cache_evicts_least_recently_used(tmp_path):
+    cache = R.RenderCache(root=str(tmp_path), max_entries=2)
+    for i, key in enumerate("abcd"):
+        path = tmp_path / f"{key}.mp4"
+        path.write_bytes(b"\0")
+        os.utime(path, (1000 + i, 1000 + i))
+
+    cache._evict()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["c.mp4", "d.mp4"]
+
+
+def test_render_cache_hit_refreshes_entry(tmp_path):
+    cache = R.RenderCache(root=str(tmp_path / "cache"), max_entries=2)
+    for i, key in enumerate("ab"):
+        src = tmp_path / f"{key}.tmp"
+        src.write_bytes(b"\0")
+        os.utime(cache.put(key, ".mp4", str(src)), (1000 + i, 1000 + i))
+
+    assert cache.get("a", ".mp4") is not None
+    src = tmp_path / "c.tmp"
+    src.write_bytes(b"\0")
+    cache.put("c", ".mp4", str(src))
+
+    assert cache.get("b", ".mp4") is None
+    assert cache.get("a", ".mp4") is not None and cache.get("c", ".mp4") is not None